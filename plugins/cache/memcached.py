@@ -11,6 +11,10 @@ name: memcached
 short_description: Use memcached DB for cache
 description:
   - This cache uses JSON formatted, per host records saved in memcached.
+  - The serialization format and compression can be changed with O(_serializer) and O(_compression).
+    This allows to store larger host records below the memcached item size limit.
+extends_documentation_fragment:
+  - community.general._cache_serialization
 requirements:
   - memcache (python lib)
 options:
@@ -34,6 +38,44 @@ options:
     ini:
       - key: fact_caching_prefix
         section: defaults
+  _bulk_size:
+    description:
+      - Number of hosts whose writes are buffered and sent to memcached together, with one C(set_multi) call for the values
+        and one for the key set.
+      - Pending writes are also sent when O(_bulk_interval) has passed, when keys are listed or deleted, and when the process exits.
+      - Set to V(0) to send every write immediately.
+    type: integer
+    default: 0
+    env:
+      - name: ANSIBLE_CACHE_MEMCACHED_BULK_SIZE
+    ini:
+      - key: fact_caching_memcached_bulk_size
+        section: defaults
+    version_added: 13.4.0
+  _bulk_interval:
+    description:
+      - Maximum age in seconds of buffered writes, checked on every write.
+      - Only used when O(_bulk_size) is greater than V(0).
+    type: float
+    default: 1.0
+    env:
+      - name: ANSIBLE_CACHE_MEMCACHED_BULK_INTERVAL
+    ini:
+      - key: fact_caching_memcached_bulk_interval
+        section: defaults
+    version_added: 13.4.0
+  _prefetch:
+    description:
+      - Load all cached entries with C(get_multi) when the plugin is initialized, so that later lookups do not need a round
+        trip per host.
+    type: boolean
+    default: false
+    env:
+      - name: ANSIBLE_CACHE_MEMCACHED_PREFETCH
+    ini:
+      - key: fact_caching_memcached_prefetch
+        section: defaults
+    version_added: 13.4.0
   _timeout:
     default: 86400
     type: integer
@@ -46,8 +88,10 @@ options:
         section: defaults
 """
 
+import atexit
 import collections
 import os
+import threading
 import time
 from collections.abc import MutableSet
 from itertools import chain
@@ -57,6 +101,8 @@ from ansible.errors import AnsibleError
 from ansible.plugins.cache import BaseCacheModule
 from ansible.utils.display import Display
 
+from ansible_collections.community.general.plugins.plugin_utils._cache_serialization import CacheSerializer
+
 try:
     import memcache
 
@@ -73,10 +119,15 @@ class ProxyClientPool:
     connection pool.
 
     Available connections are maintained in a deque and released in a FIFO manner.
+    When all connections are in use, callers wait up to ``pool_timeout`` seconds
+    for one to be released. Connections that have been idle for more than
+    ``health_check_interval`` seconds are checked before they are handed out.
     """
 
     def __init__(self, *args, **kwargs):
         self.max_connections = kwargs.pop("max_connections", 1024)
+        self.pool_timeout = kwargs.pop("pool_timeout", 10)
+        self.health_check_interval = kwargs.pop("health_check_interval", 30)
         self.connection_args = args
         self.connection_kwargs = kwargs
         self.reset()
@@ -86,7 +137,9 @@ class ProxyClientPool:
         self._num_connections = 0
         self._available_connections = collections.deque(maxlen=self.max_connections)
         self._locked_connections = set()
+        self._last_used = {}
         self._lock = Lock()
+        self._condition = threading.Condition()
 
     def _check_safe(self):
         if self.pid != os.getpid():
@@ -99,11 +152,24 @@ class ProxyClientPool:
 
     def get_connection(self):
         self._check_safe()
-        try:
-            connection = self._available_connections.popleft()
-        except IndexError:
-            connection = self.create_connection()
-        self._locked_connections.add(connection)
+        deadline = time.monotonic() + self.pool_timeout
+        with self._condition:
+            while True:
+                try:
+                    connection = self._available_connections.popleft()
+                    break
+                except IndexError:
+                    pass
+                if self._num_connections < self.max_connections:
+                    connection = self.create_connection()
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError("Timed out waiting for a free memcached connection")
+                self._condition.wait(remaining)
+            self._locked_connections.add(connection)
+        if time.monotonic() - self._last_used.get(connection, time.monotonic()) > self.health_check_interval:
+            self.check_health(connection)
         return connection
 
     def create_connection(self):
@@ -112,10 +178,20 @@ class ProxyClientPool:
         self._num_connections += 1
         return memcache.Client(*self.connection_args, **self.connection_kwargs)
 
+    @staticmethod
+    def check_health(connection):
+        # get_stats() only returns entries for servers that answered
+        if not connection.get_stats():
+            # close the sockets, the client reconnects on the next command
+            connection.disconnect_all()
+
     def release_connection(self, connection):
         self._check_safe()
-        self._locked_connections.remove(connection)
-        self._available_connections.append(connection)
+        with self._condition:
+            self._locked_connections.remove(connection)
+            self._available_connections.append(connection)
+            self._last_used[connection] = time.monotonic()
+            self._condition.notify()
 
     def disconnect_all(self):
         for conn in chain(self._available_connections, self._locked_connections):
@@ -140,13 +216,34 @@ class CacheModuleKeys(MutableSet):
     """
     A set subclass that keeps track of insertion time and persists
     the set in memcached.
+
+    Changes are recorded as small numbered log entries, so adding a key does
+    not rewrite the whole set. Log entries do not expire, so only eviction can
+    remove them. A snapshot of the set is written once the log has grown much
+    larger than the set. Changes are collected by ``add`` and ``discard`` and
+    written by ``flush``.
     """
 
     PREFIX = "ansible_cache_keys"
-
-    def __init__(self, cache, *args, **kwargs):
+    SNAPSHOT = f"{PREFIX}_v2"
+    SEQUENCE = f"{PREFIX}_v2_seq"
+    ENTRY_PREFIX = f"{PREFIX}_v2_"
+    CHUNK_SIZE = 1000
+    COMPACT_MIN_ENTRIES = 1000
+    GAP_TIMEOUT = 10
+
+    def __init__(self, cache):
         self._cache = cache
-        self._keyset = dict(*args, **kwargs)
+        self._keyset = {}
+        self._seq = 0
+        self._snapshot_seq = 0
+        # (time, sequence number) seen by refresh(), and the last number that is older than GAP_TIMEOUT
+        self._observed = collections.deque()
+        self._overdue = 0
+        self._pending = []
+        self._cache.add(self.SEQUENCE, "0")
+        self._load_snapshot()
+        self.refresh()
 
     def __contains__(self, key):
         return key in self._keyset
@@ -157,20 +254,94 @@ class CacheModuleKeys(MutableSet):
     def __len__(self):
         return len(self._keyset)
 
+    def _load_snapshot(self):
+        snapshot = self._cache.get(self.SNAPSHOT)
+        if snapshot is None:
+            # the key set written by previous versions of this plugin
+            self._keyset = dict(self._cache.get(self.PREFIX) or {})
+            return
+        self._keyset = dict(snapshot["keys"])
+        self._seq = self._snapshot_seq = snapshot["seq"]
+
+    def refresh(self):
+        """Apply the changes logged by other processes since the last refresh."""
+        while True:
+            current = int(self._cache.get(self.SEQUENCE) or 0)
+            gap = self._apply_log(current, self._overdue_until(current))
+            if gap is None:
+                break
+            snapshot = self._cache.get(self.SNAPSHOT)
+            if snapshot is None or snapshot["seq"] < gap:
+                # the entry is not written yet, try again on the next refresh
+                return
+            # the entry has been evicted, but a snapshot covers it
+            self._keyset = dict(snapshot["keys"])
+            self._seq = self._snapshot_seq = snapshot["seq"]
+        if self._seq - self._snapshot_seq > max(self.COMPACT_MIN_ENTRIES, 2 * len(self._keyset)):
+            self._cache.set(self.SNAPSHOT, {"seq": self._seq, "keys": self._keyset})
+            self._snapshot_seq = self._seq
+
+    def _overdue_until(self, current):
+        # a writer sets its log entries right after reserving their numbers, so entries that
+        # were reserved more than GAP_TIMEOUT seconds ago and are still missing have been evicted
+        now = time.time()
+        if not self._observed or self._observed[-1][1] < current:
+            self._observed.append((now, current))
+        while self._observed and now - self._observed[0][0] >= self.GAP_TIMEOUT:
+            self._overdue = max(self._overdue, self._observed.popleft()[1])
+        return self._overdue
+
+    def _apply_log(self, current, overdue):
+        """
+        Apply the log entries up to ``current``, skipping missing entries up to ``overdue``.
+        Return the first missing entry that may still be written, if any.
+        """
+        while self._seq < current:
+            seqs = [str(seq) for seq in range(self._seq + 1, min(self._seq + self.CHUNK_SIZE, current) + 1)]
+            entries = self._cache.get_multi(seqs, key_prefix=self.ENTRY_PREFIX)
+            for seq in seqs:
+                if seq in entries:
+                    key, timestamp = entries[seq]
+                    if timestamp is None:
+                        self._keyset.pop(key, None)
+                    else:
+                        self._keyset[key] = timestamp
+                elif int(seq) > overdue:
+                    return int(seq)
+                self._seq = int(seq)
+        return None
+
     def add(self, value):
         self._keyset[value] = time.time()
-        self._cache.set(self.PREFIX, self._keyset)
+        self._pending.append((value, self._keyset[value]))
 
     def discard(self, value):
         del self._keyset[value]
-        self._cache.set(self.PREFIX, self._keyset)
+        self._pending.append((value, None))
 
     def remove_by_timerange(self, s_min, s_max):
+        # every process expires keys by itself, so this is not logged
         for k in list(self._keyset.keys()):
             t = self._keyset[k]
             if s_min < t < s_max:
                 del self._keyset[k]
-        self._cache.set(self.PREFIX, self._keyset)
+
+    def flush(self, mapping=None, **kwargs):
+        """Write the items in ``mapping`` with ``set_multi(mapping, **kwargs)``, then the pending changes."""
+        if mapping:
+            self._cache.set_multi(mapping, **kwargs)
+        if self._pending:
+            end = self._cache.incr(self.SEQUENCE, len(self._pending))
+            if end is None:
+                # the counter has been evicted
+                self._cache.add(self.SEQUENCE, "0")
+                end = self._cache.incr(self.SEQUENCE, len(self._pending)) or len(self._pending)
+            first = end - len(self._pending) + 1
+            # the log entries never expire: a missing entry holds up readers for GAP_TIMEOUT seconds
+            self._cache.set_multi(
+                {f"{self.ENTRY_PREFIX}{seq}": entry for seq, entry in enumerate(self._pending, first)}
+            )
+            self._pending = []
 
 
 class CacheModule(BaseCacheModule):
@@ -182,17 +353,45 @@ class CacheModule(BaseCacheModule):
             connection = self.get_option("_uri")
         self._timeout = self.get_option("_timeout")
         self._prefix = self.get_option("_prefix")
+        self._bulk_size = self.get_option("_bulk_size")
+        self._bulk_interval = float(self.get_option("_bulk_interval"))
+        self._serializer = CacheSerializer("memcached", self.get_option("_serializer"), self.get_option("_compression"))
 
         if not HAS_MEMCACHE:
             raise AnsibleError("python-memcached is required for the memcached fact cache")
 
         self._cache = {}
+        self._pending = {}
+        self._pending_started = 0.0
         self._db = ProxyClientPool(connection, debug=0)
-        self._keys = CacheModuleKeys(self._db, self._db.get(CacheModuleKeys.PREFIX) or [])
+        self._keys = CacheModuleKeys(self._db)
+        if self._bulk_size > 0:
+            atexit.register(self._flush_pending)
+        if self.get_option("_prefetch"):
+            self._load_many(self.keys())
 
     def _make_key(self, key):
         return f"{self._prefix}{key}"
 
+    def _decode(self, value):
+        if CacheSerializer.is_encoded(value):
+            return CacheSerializer.decode(value)
+        return value
+
+    def _flush_pending(self):
+        pending = self._pending
+        self._pending = {}
+        # values are already compressed if requested, do not let the client compress them again
+        min_compress_len = 1 if not self._serializer.enabled else 0
+        self._keys.flush(pending, time=self._timeout, min_compress_len=min_compress_len)
+
+    def _load_many(self, keys):
+        missing = [key for key in keys if key not in self._cache]
+        for i in range(0, len(missing), CacheModuleKeys.CHUNK_SIZE):
+            values = self._db.get_multi(missing[i : i + CacheModuleKeys.CHUNK_SIZE], key_prefix=self._prefix)
+            for key, value in values.items():
+                self._cache[key] = self._decode(value)
+
     def _expire_keys(self):
         if self._timeout > 0:
             expiry_age = time.time() - self._timeout
@@ -207,16 +406,23 @@ class CacheModule(BaseCacheModule):
             if value is None:
                 self.delete(key)
                 raise KeyError
-            self._cache[key] = value
+            self._cache[key] = self._decode(value)
 
         return self._cache.get(key)
 
     def set(self, key, value):
-        self._db.set(self._make_key(key), value, time=self._timeout, min_compress_len=1)
+        data = self._serializer.encode(value)
+        if not self._pending:
+            self._pending_started = time.time()
+        self._pending[self._make_key(key)] = value if data is None else data
         self._cache[key] = value
         self._keys.add(key)
+        if len(self._pending) >= self._bulk_size or time.time() - self._pending_started >= self._bulk_interval:
+            self._flush_pending()
 
     def keys(self):
+        self._flush_pending()
+        self._keys.refresh()
         self._expire_keys()
         return list(iter(self._keys))
 
@@ -225,16 +431,21 @@ class CacheModule(BaseCacheModule):
         return key in self._keys
 
     def delete(self, key):
-        del self._cache[key]
+        self._flush_pending()
+        self._cache.pop(key, None)
         self._db.delete(self._make_key(key))
-        self._keys.discard(key)
+        if key in self._keys:
+            self._keys.discard(key)
+            self._keys.flush()
 
     def flush(self):
         for key in self.keys():
             self.delete(key)
 
     def copy(self):
-        return self._keys.copy()
+        keys = self.keys()
+        self._load_many(keys)
+        return {k: self._cache[k] for k in keys if k in self._cache}
 
     def __getstate__(self):
         return dict()
@@ -10,6 +10,9 @@ name: redis
 short_description: Use Redis DB for cache
 description:
   - This cache uses JSON formatted, per host records saved in Redis.
+  - The serialization format and compression can be changed with O(_serializer) and O(_compression).
+extends_documentation_fragment:
+  - community.general._cache_serialization
 requirements:
   - redis>=2.4.5 (python lib)
 options:
@@ -54,6 +57,67 @@ options:
       - key: fact_caching_redis_sentinel
         section: defaults
     version_added: 1.3.0
+  _bulk_size:
+    description:
+      - Number of hosts whose writes are buffered in a Redis pipeline before they are sent to the server in one round trip.
+      - Pending writes are also sent when O(_bulk_interval) has passed, when keys are listed or deleted, and when the process exits.
+      - Set to V(0) to send every write immediately.
+    type: integer
+    default: 0
+    env:
+      - name: ANSIBLE_CACHE_REDIS_BULK_SIZE
+    ini:
+      - key: fact_caching_redis_bulk_size
+        section: defaults
+    version_added: 13.4.0
+  _bulk_interval:
+    description:
+      - Maximum age in seconds of buffered writes before the pipeline is sent, checked on every write.
+      - Only used when O(_bulk_size) is greater than V(0).
+    type: float
+    default: 1.0
+    env:
+      - name: ANSIBLE_CACHE_REDIS_BULK_INTERVAL
+    ini:
+      - key: fact_caching_redis_bulk_interval
+        section: defaults
+    version_added: 13.4.0
+  _transactional:
+    description:
+      - Whether buffered writes are wrapped in a C(MULTI)/C(EXEC) transaction.
+      - Only used when O(_bulk_size) is greater than V(0).
+    type: boolean
+    default: false
+    env:
+      - name: ANSIBLE_CACHE_REDIS_TRANSACTIONAL
+    ini:
+      - key: fact_caching_redis_transactional
+        section: defaults
+    version_added: 13.4.0
+  _prefetch:
+    description:
+      - Load all cached entries with C(MGET) when the plugin is initialized, so that later lookups do not need a round trip per host.
+    type: boolean
+    default: false
+    env:
+      - name: ANSIBLE_CACHE_REDIS_PREFETCH
+    ini:
+      - key: fact_caching_redis_prefetch
+        section: defaults
+    version_added: 13.4.0
+  _use_keyset:
+    description:
+      - Whether to maintain the keyset O(_keyset_name) as a sorted set that is trimmed on every key listing.
+      - When set to V(false), expiry relies only on the per-key TTL set with C(SET EX), existence checks use C(EXISTS),
+        and keys are listed with C(SCAN) over O(_prefix). In this case O(_prefix) should not be empty.
+    type: boolean
+    default: true
+    env:
+      - name: ANSIBLE_CACHE_REDIS_USE_KEYSET
+    ini:
+      - key: fact_caching_redis_use_keyset
+        section: defaults
+    version_added: 13.4.0
   _timeout:
     default: 86400
     type: integer
@@ -66,15 +130,20 @@ options:
         section: defaults
 """
 
+import atexit
 import json
 import re
 import time
+import weakref
 
 from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_text
 from ansible.parsing.ajson import AnsibleJSONDecoder, AnsibleJSONEncoder
 from ansible.plugins.cache import BaseCacheModule
 from ansible.utils.display import Display
 
+from ansible_collections.community.general.plugins.plugin_utils._cache_serialization import CacheSerializer
+
 try:
     from redis import VERSION, StrictRedis
 
@@ -84,6 +153,23 @@ except ImportError:
 
 display = Display()
 
+# Cache instances in bulk mode; their pending writes are sent by one atexit handler per process
+_BULK_INSTANCES: weakref.WeakSet[CacheModule] = weakref.WeakSet()
+_ATEXIT_REGISTERED = False
+
+
+def _flush_bulk_instances():
+    for instance in list(_BULK_INSTANCES):
+        instance._flush_pipeline()
+
+
+def _register_bulk_instance(instance):
+    global _ATEXIT_REGISTERED
+    _BULK_INSTANCES.add(instance)
+    if not _ATEXIT_REGISTERED:
+        atexit.register(_flush_bulk_instances)
+        _ATEXIT_REGISTERED = True
+
 
 class CacheModule(BaseCacheModule):
     """
@@ -93,11 +179,17 @@ class CacheModule(BaseCacheModule):
     when they are inserted. This allows for the usage of 'zremrangebyscore'
     to expire keys. This mechanism is used or a pattern matched 'scan' for
     performance.
+
+    When bulk mode is enabled, writes are queued in a pipeline and sent in
+    batches; values that are not yet written are served from the in-memory
+    cache.
     """
 
     _sentinel_service_name = None
     re_url_conn = re.compile(r"^([^:]+|\[[^]]+\]):(\d+):(\d+)(?::(.*))?$")
     re_sent_conn = re.compile(r"^(.*):(\d+)$")
+    re_scan_special = re.compile(r"([*?\[\]\\])")
+    mget_chunk_size = 1000
 
     def __init__(self, *args, **kwargs):
         uri = ""
@@ -109,6 +201,11 @@ class CacheModule(BaseCacheModule):
         self._prefix = self.get_option("_prefix")
         self._keys_set = self.get_option("_keyset_name")
         self._sentinel_service_name = self.get_option("_sentinel_service_name")
+        self._bulk_size = self.get_option("_bulk_size")
+        self._bulk_interval = float(self.get_option("_bulk_interval"))
+        self._transactional = self.get_option("_transactional")
+        self._use_keyset = self.get_option("_use_keyset")
+        self._serializer = CacheSerializer("redis", self.get_option("_serializer"), self.get_option("_compression"))
 
         if not HAS_REDIS:
             raise AnsibleError(
@@ -116,6 +213,9 @@ class CacheModule(BaseCacheModule):
             )
 
         self._cache = {}
+        # bulk mode: key -> (encoded value, time of the write), sent by _flush_pipeline()
+        self._pending = {}
+        self._pending_started = 0.0
         kw = {}
 
         # tls connection
@@ -134,6 +234,12 @@ class CacheModule(BaseCacheModule):
 
         display.vv(f"Redis connection: {self._db}")
 
+        if self._bulk_size > 0:
+            _register_bulk_instance(self)
+
+        if self.get_option("_prefetch"):
+            self._load_many(self.keys())
+
     @staticmethod
     def _parse_connection(re_patt, uri):
         match = re_patt.match(uri)
@@ -177,6 +283,43 @@ class CacheModule(BaseCacheModule):
     def _make_key(self, key):
         return self._prefix + key
 
+    def _write(self, db, key, value, timestamp):
+        if self._timeout > 0:  # a timeout of 0 is handled as meaning 'never expire'
+            db.setex(self._make_key(key), int(self._timeout), value)
+        else:
+            db.set(self._make_key(key), value)
+
+        if self._use_keyset:
+            if VERSION[0] == 2:
+                db.zadd(self._keys_set, timestamp, key)
+            else:
+                db.zadd(self._keys_set, {key: timestamp})
+
+    def _flush_pipeline(self):
+        if not self._pending:
+            return
+        pipeline = self._db.pipeline(transaction=self._transactional)
+        for key, (value, timestamp) in self._pending.items():
+            self._write(pipeline, key, value, timestamp)
+        pipeline.execute()
+        # only forget the writes once they have been sent, so that a failed flush can be repeated
+        self._pending = {}
+
+    def _load_many(self, keys):
+        missing = [key for key in keys if key not in self._cache]
+        for i in range(0, len(missing), self.mget_chunk_size):
+            chunk = missing[i : i + self.mget_chunk_size]
+            values = self._db.mget([self._make_key(key) for key in chunk])
+            for key, value in zip(chunk, values):
+                if value is not None:
+                    self._cache[key] = self._decode(value)
+
+    @staticmethod
+    def _decode(value):
+        if CacheSerializer.is_encoded(value):
+            return CacheSerializer.decode(value)
+        return json.loads(value, cls=AnsibleJSONDecoder)
+
     def get(self, key):
         if key not in self._cache:
             value = self._db.get(self._make_key(key))
@@ -186,22 +329,25 @@ class CacheModule(BaseCacheModule):
             if value is None:
                 self.delete(key)
                 raise KeyError
-            self._cache[key] = json.loads(value, cls=AnsibleJSONDecoder)
+            self._cache[key] = self._decode(value)
 
         return self._cache.get(key)
 
     def set(self, key, value):
-        value2 = json.dumps(value, cls=AnsibleJSONEncoder, sort_keys=True, indent=4)
-        if self._timeout > 0:  # a timeout of 0 is handled as meaning 'never expire'
-            self._db.setex(self._make_key(key), int(self._timeout), value2)
-        else:
-            self._db.set(self._make_key(key), value2)
+        value2 = self._serializer.encode(value)
+        if value2 is None:
+            value2 = json.dumps(value, cls=AnsibleJSONEncoder, sort_keys=True, indent=4)
+        if self._bulk_size <= 0:
+            self._write(self._db, key, value2, time.time())
+            self._cache[key] = value
+            return
 
-        if VERSION[0] == 2:
-            self._db.zadd(self._keys_set, time.time(), key)
-        else:
-            self._db.zadd(self._keys_set, {key: time.time()})
         self._cache[key] = value
+        if not self._pending:
+            self._pending_started = time.time()
+        self._pending[key] = (value2, time.time())
+        if len(self._pending) >= self._bulk_size or time.time() - self._pending_started >= self._bulk_interval:
+            self._flush_pipeline()
 
     def _expire_keys(self):
         if self._timeout > 0:
@@ -209,26 +355,39 @@ class CacheModule(BaseCacheModule):
             self._db.zremrangebyscore(self._keys_set, 0, expiry_age)
 
     def keys(self):
+        self._flush_pipeline()
+        if not self._use_keyset:
+            pattern = self.re_scan_special.sub(r"\\\1", self._prefix) + "*"
+            prefix_length = len(self._prefix)
+            return [to_text(key)[prefix_length:] for key in self._db.scan_iter(match=pattern)]
         self._expire_keys()
-        return self._db.zrange(self._keys_set, 0, -1)
+        return [to_text(key) for key in self._db.zrange(self._keys_set, 0, -1)]
 
     def contains(self, key):
+        # in bulk mode, values written by this process or loaded by the prefetch do not need a round trip
+        if self._bulk_size > 0 and (key in self._pending or key in self._cache):
+            return True
+        if not self._use_keyset:
+            return bool(self._db.exists(self._make_key(key)))
         self._expire_keys()
         return self._db.zrank(self._keys_set, key) is not None
 
     def delete(self, key):
+        self._flush_pipeline()
         if key in self._cache:
             del self._cache[key]
         self._db.delete(self._make_key(key))
-        self._db.zrem(self._keys_set, key)
+        if self._use_keyset:
+            self._db.zrem(self._keys_set, key)
 
     def flush(self):
         for key in list(self.keys()):
             self.delete(key)
 
     def copy(self):
-        # TODO: there is probably a better way to do this in redis
-        ret = {k: self.get(k) for k in self.keys()}
+        keys = self.keys()
+        self._load_many(keys)
+        ret = {k: self._cache[k] for k in keys if k in self._cache}
         return ret
 
     def __getstate__(self):
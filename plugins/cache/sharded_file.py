@@ -0,0 +1,277 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+DOCUMENTATION = r"""
+name: sharded_file
+short_description: Per host files in hashed subdirectories with an on-disk index
+version_added: 13.4.0
+description:
+  - This cache stores one file per host, saved to the filesystem in subdirectories named after a hash of the host name.
+  - Files are written to a temporary file first and then renamed, so readers never see partially written entries.
+  - An append-only index file in the cache directory records modification time and size of every entry, so listing
+    keys and checking expiry does not need to list directories or stat every file. The index is compacted automatically.
+  - Multiple processes can share the same cache directory.
+  - If O(_serializer) is not set, entries are stored as JSON.
+author: agent (!UNKNOWN) <agent@local>
+extends_documentation_fragment:
+  - community.general._cache_serialization
+options:
+  _uri:
+    required: true
+    description:
+      - Path in which the cache plugin saves the files.
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_CONNECTION
+    ini:
+      - key: fact_caching_connection
+        section: defaults
+    type: path
+  _prefix:
+    description: User defined prefix to use when creating the files.
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_PREFIX
+    ini:
+      - key: fact_caching_prefix
+        section: defaults
+    type: string
+  _timeout:
+    default: 86400
+    description: Expiration timeout in seconds for the cache plugin data. Set to 0 to never expire.
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_TIMEOUT
+    ini:
+      - key: fact_caching_timeout
+        section: defaults
+    type: float
+  _shard_levels:
+    description:
+      - Number of nested subdirectory levels. Every level has up to 256 subdirectories.
+      - Changing this value makes existing entries unreachable.
+    type: integer
+    default: 1
+    choices: [1, 2, 3]
+    env:
+      - name: ANSIBLE_CACHE_SHARDED_FILE_LEVELS
+    ini:
+      - key: fact_caching_sharded_file_levels
+        section: defaults
+notes:
+  - The index and the cache files must be on a local filesystem that supports C(flock).
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ansible.module_utils.common.file import S_IRWU_RG_RO
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible.plugins.cache import BaseFileCacheModule
+from ansible.utils.display import Display
+
+from ansible_collections.community.general.plugins.plugin_utils._cache_serialization import CacheSerializer
+
+display = Display()
+
+
+class CacheModule(BaseFileCacheModule):
+    """
+    A caching module backed by per host files in hashed subdirectories.
+
+    The index is a JSON lines journal: ``[name, mtime, size]`` records an
+    entry, ``[name]`` records its removal. Every process reads only the
+    records appended since its last look, and the journal is rewritten
+    once it contains many superseded records.
+    """
+
+    INDEX_FILE = ".index"
+    COMPACT_MIN_RECORDS = 1000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._shard_levels = self.get_option("_shard_levels")
+        self._serializer = CacheSerializer(
+            "sharded_file", self.get_option("_serializer") or "json", self.get_option("_compression")
+        )
+        self._index_path = os.path.join(self._cache_dir, self.INDEX_FILE)
+        self._reset_index()
+        if not os.path.exists(self._index_path):
+            self._rebuild_index()
+        self._refresh_index()
+
+    def _name(self, key):
+        return f"{self.get_option('_prefix') or ''}{key}"
+
+    def _get_cache_file_name(self, key):
+        name = self._name(key)
+        digest = hashlib.sha256(to_bytes(name, errors="surrogate_or_strict")).hexdigest()
+        shards = [digest[2 * level : 2 * level + 2] for level in range(self._shard_levels)]
+        return os.path.join(self._cache_dir, *shards, name)
+
+    def _reset_index(self):
+        self._index = {}
+        self._index_inode = None
+        self._index_offset = 0
+        self._index_records = 0
+
+    def _refresh_index(self):
+        """Read the records appended to the index since the last refresh."""
+        try:
+            f = open(self._index_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            if inode != self._index_inode:
+                # the index has been compacted by another process
+                self._reset_index()
+                self._index_inode = inode
+            f.seek(self._index_offset)
+            data = f.read()
+        # a writer might still be appending the last line
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            self._index_records += 1
+            if len(record) == 3:
+                self._index[record[0]] = (record[1], record[2])
+            else:
+                self._index.pop(record[0], None)
+        self._index_offset += end
+
+    def _open_locked_index(self):
+        while True:
+            f = open(self._index_path, "ab")
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                if os.fstat(f.fileno()).st_ino == os.stat(self._index_path).st_ino:
+                    return f
+            except FileNotFoundError:
+                pass
+            # the index was replaced while waiting for the lock
+            f.close()
+
+    def _append_index(self, record):
+        with self._open_locked_index() as f:
+            f.write(to_bytes(json.dumps(record, separators=(",", ":")) + "\n"))
+
+    def _write_index(self):
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=self.INDEX_FILE)
+        with os.fdopen(fd, "wb") as f:
+            for name, (mtime, size) in self._index.items():
+                f.write(to_bytes(json.dumps([name, mtime, size], separators=(",", ":")) + "\n"))
+        os.rename(tmp_path, self._index_path)
+
+    def _compact_index(self):
+        with self._open_locked_index():
+            self._refresh_index()
+            if self._index_records < max(self.COMPACT_MIN_RECORDS, 2 * len(self._index)):
+                return
+            self._write_index()
+
+    def _rebuild_index(self):
+        """Create the index from the files in the cache directory, for example after it was removed."""
+        for dirpath, dirnames, filenames in os.walk(self._cache_dir):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            if dirpath == self._cache_dir:
+                continue
+            for name in filenames:
+                if name.startswith("."):
+                    continue
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                self._index[name] = (st.st_mtime, st.st_size)
+        with self._open_locked_index():
+            # another process may have created the index in the meantime
+            if os.path.getsize(self._index_path) == 0:
+                self._write_index()
+        self._reset_index()
+
+    def _load(self, filepath):
+        with open(filepath, "rb") as f:
+            data = f.read()
+        if CacheSerializer.is_encoded(data):
+            return CacheSerializer.decode(data)
+        return json.loads(data)
+
+    def _dump(self, value, filepath):
+        with open(filepath, "wb") as f:
+            f.write(self._serializer.encode(value))
+
+    def set(self, key, value):
+        self._cache[key] = value
+
+        cachefile = self._get_cache_file_name(key)
+        cachedir = os.path.dirname(cachefile)
+        try:
+            os.makedirs(cachedir, exist_ok=True)
+            # the leading dot keeps unfinished files out of the index rebuild
+            tmpfile_handle, tmpfile_path = tempfile.mkstemp(dir=cachedir, prefix=".")
+            os.close(tmpfile_handle)
+        except OSError as e:
+            display.warning(f"error in 'sharded_file' cache plugin while trying to create a file in {cachedir}: {e}")
+            return
+        try:
+            self._dump(value, tmpfile_path)
+            os.chmod(tmpfile_path, S_IRWU_RG_RO)
+            os.rename(tmpfile_path, cachefile)
+            st = os.stat(cachefile)
+        except OSError as e:
+            display.warning(f"error in 'sharded_file' cache plugin while trying to write to {cachefile}: {e}")
+            try:
+                os.unlink(tmpfile_path)
+            except OSError:
+                pass
+            return
+        self._index[self._name(key)] = (st.st_mtime, st.st_size)
+        self._append_index([self._name(key), st.st_mtime, st.st_size])
+
+    def has_expired(self, key):
+        if self._timeout == 0:
+            return False
+
+        entry = self._index.get(self._name(key))
+        if entry is None or time.time() - entry[0] <= self._timeout:
+            return False
+
+        self._cache.pop(key, None)
+        return True
+
+    def keys(self):
+        self._refresh_index()
+        if self._index_records >= max(self.COMPACT_MIN_RECORDS, 2 * len(self._index)):
+            self._compact_index()
+        prefix = self.get_option("_prefix") or ""
+        prefix_length = len(prefix)
+        keys = []
+        for name in self._index:
+            if not name.startswith(prefix):
+                continue
+            key = name[prefix_length:]
+            if not self.has_expired(key):
+                keys.append(key)
+        return keys
+
+    def contains(self, key):
+        if key in self._cache:
+            return True
+        if self._name(key) not in self._index:
+            # the entry might have been written by another process
+            self._refresh_index()
+        return self._name(key) in self._index and not self.has_expired(key)
+
+    def delete(self, key):
+        super().delete(key)
+        # record the removal even if this process has not seen the entry, another one might have
+        self._index.pop(self._name(key), None)
+        self._append_index([self._name(key)])
@@ -0,0 +1,256 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+DOCUMENTATION = r"""
+name: sqlite
+short_description: Use a SQLite database file for cache
+version_added: 13.4.0
+description:
+  - This cache stores per host records in a single SQLite database file.
+  - The database uses write-ahead logging, so several C(ansible-playbook) processes can read the cache concurrently while
+    one of them writes.
+  - Writes are buffered in memory and written in one short transaction per O(_batch_size) entries.
+  - Expired entries are removed with an indexed query whenever keys are listed.
+  - If O(_serializer) is not set, entries are stored as JSON.
+author: agent (!UNKNOWN) <agent@local>
+extends_documentation_fragment:
+  - community.general._cache_serialization
+options:
+  _uri:
+    required: true
+    description:
+      - Path of the SQLite database file. It is created if it does not exist.
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_CONNECTION
+    ini:
+      - key: fact_caching_connection
+        section: defaults
+    type: path
+  _prefix:
+    description: User defined prefix to use when creating the DB entries.
+    type: string
+    default: ansible_facts
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_PREFIX
+    ini:
+      - key: fact_caching_prefix
+        section: defaults
+  _timeout:
+    default: 86400
+    description: Expiration timeout in seconds for the cache plugin data. Set to 0 to never expire.
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_TIMEOUT
+    ini:
+      - key: fact_caching_timeout
+        section: defaults
+    type: float
+  _batch_size:
+    description:
+      - Number of writes grouped into one transaction.
+      - Pending writes are also written when O(_batch_interval) has passed, when keys are listed, and when the process exits.
+      - Set to V(1) to commit every write immediately.
+    type: integer
+    default: 100
+    env:
+      - name: ANSIBLE_CACHE_SQLITE_BATCH_SIZE
+    ini:
+      - key: fact_caching_sqlite_batch_size
+        section: defaults
+  _batch_interval:
+    description: Maximum age in seconds of buffered writes, checked on every write.
+    type: float
+    default: 1.0
+    env:
+      - name: ANSIBLE_CACHE_SQLITE_BATCH_INTERVAL
+    ini:
+      - key: fact_caching_sqlite_batch_interval
+        section: defaults
+  _busy_timeout:
+    description: Number of seconds to wait for a lock held by another process before failing.
+    type: float
+    default: 30
+    env:
+      - name: ANSIBLE_CACHE_SQLITE_BUSY_TIMEOUT
+    ini:
+      - key: fact_caching_sqlite_busy_timeout
+        section: defaults
+notes:
+  - The database file must be on a local filesystem, since SQLite's write-ahead logging does not work over network
+    filesystems.
+"""
+
+import atexit
+import os
+import sqlite3
+import time
+import weakref
+
+from ansible.errors import AnsibleError
+from ansible.plugins.cache import BaseCacheModule
+
+from ansible_collections.community.general.plugins.plugin_utils._cache_serialization import CacheSerializer
+
+# Cache instances with buffered writes; they are committed by one atexit handler per process
+_INSTANCES: weakref.WeakSet[CacheModule] = weakref.WeakSet()
+_ATEXIT_REGISTERED = False
+
+
+def _commit_instances():
+    for instance in list(_INSTANCES):
+        instance._commit()
+
+
+def _register_instance(instance):
+    global _ATEXIT_REGISTERED
+    _INSTANCES.add(instance)
+    if not _ATEXIT_REGISTERED:
+        atexit.register(_commit_instances)
+        _ATEXIT_REGISTERED = True
+
+
+class CacheModule(BaseCacheModule):
+    """
+    A caching module backed by a SQLite database.
+
+    Every entry has an absolute expiry time, which is NULL for entries that
+    never expire. Writes are buffered until the batch is full, so the write
+    lock is only held while a whole batch is inserted; the in-memory cache
+    makes buffered writes visible to this process meanwhile.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._path = self.get_option("_uri")
+        self._prefix = self.get_option("_prefix") or ""
+        self._timeout = float(self.get_option("_timeout"))
+        self._batch_size = max(1, self.get_option("_batch_size"))
+        self._batch_interval = float(self.get_option("_batch_interval"))
+        self._busy_timeout = float(self.get_option("_busy_timeout"))
+        self._serializer = CacheSerializer(
+            "sqlite", self.get_option("_serializer") or "json", self.get_option("_compression")
+        )
+
+        self._cache = {}
+        self._conn = None
+        self._pid = None
+        self._pending = {}
+        self._pending_started = 0.0
+        self._connect()
+        _register_instance(self)
+
+    def _connect(self):
+        directory = os.path.dirname(self._path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ansible_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ansible_cache_expires ON ansible_cache (expires)")
+        except sqlite3.Error as e:
+            raise AnsibleError(f"Error in 'sqlite' cache plugin while opening {self._path}: {e}") from e
+        self._conn = conn
+        self._pid = os.getpid()
+        self._pending = {}
+
+    def _db(self):
+        # a connection must not be shared with a forked child
+        if self._pid != os.getpid():
+            self._connect()
+        return self._conn
+
+    def _commit(self):
+        if not self._pending or self._pid != os.getpid():
+            return
+        rows = list(self._pending.values())
+        # take the write lock right away instead of upgrading a read lock later, which can deadlock
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany("INSERT OR REPLACE INTO ansible_cache (key, value, expires) VALUES (?, ?, ?)", rows)
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
+        # only forget the rows once they are stored, so a busy database does not lose them
+        self._pending = {}
+
+    def _make_key(self, key):
+        return f"{self._prefix}{key}"
+
+    def get(self, key):
+        if key not in self._cache:
+            row = (
+                self._db()
+                .execute(
+                    "SELECT value FROM ansible_cache WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                    (self._make_key(key), time.time()),
+                )
+                .fetchone()
+            )
+            if row is None:
+                raise KeyError
+            self._cache[key] = CacheSerializer.decode(row[0])
+
+        return self._cache.get(key)
+
+    def set(self, key, value):
+        self._db()
+        if not self._pending:
+            self._pending_started = time.time()
+        expires = time.time() + self._timeout if self._timeout > 0 else None
+        db_key = self._make_key(key)
+        self._pending[db_key] = (db_key, sqlite3.Binary(self._serializer.encode(value)), expires)
+        self._cache[key] = value
+        if len(self._pending) >= self._batch_size or time.time() - self._pending_started >= self._batch_interval:
+            self._commit()
+
+    def keys(self):
+        db = self._db()
+        self._commit()
+        db.execute("DELETE FROM ansible_cache WHERE expires <= ?", (time.time(),))
+        prefix_length = len(self._prefix)
+        rows = db.execute(
+            "SELECT key FROM ansible_cache WHERE substr(key, 1, ?) = ?", (prefix_length, self._prefix)
+        ).fetchall()
+        return [row[0][prefix_length:] for row in rows]
+
+    def contains(self, key):
+        if key in self._cache:
+            return True
+        row = (
+            self._db()
+            .execute(
+                "SELECT 1 FROM ansible_cache WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (self._make_key(key), time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def delete(self, key):
+        db = self._db()
+        self._commit()
+        self._cache.pop(key, None)
+        db.execute("DELETE FROM ansible_cache WHERE key = ?", (self._make_key(key),))
+
+    def flush(self):
+        db = self._db()
+        self._commit()
+        self._cache = {}
+        db.execute("DELETE FROM ansible_cache WHERE substr(key, 1, ?) = ?", (len(self._prefix), self._prefix))
+
+    def copy(self):
+        return {key: self.get(key) for key in self.keys()}
+
+    def __getstate__(self):
+        return dict()
+
+    def __setstate__(self, data):
+        self.__init__()
@@ -20,10 +20,17 @@ notes:
   - Requires ansible to be run from within a C(cgroup), such as with C(cgexec -g memory:ansible_profile ansible-playbook ...).
   - This C(cgroup) should only be used by Ansible to get accurate results.
   - To create the C(cgroup), first use a command such as C(sudo cgcreate -a ec2-user:ec2-user -t ec2-user:ec2-user -g memory:ansible_profile).
+  - With O(cgroup_dir) set, the C(cgroup) v2 files C(memory.current), C(memory.peak), C(cpu.stat) and C(io.stat) of that
+    directory are used, and the recap also shows the CPU time and the bytes read and written per task. The C(cpu) and C(io)
+    controllers have to be enabled for the C(cgroup) to get these numbers.
+  - On C(cgroup) v2, C(memory.peak) is the peak since the C(cgroup) was created, so use a fresh C(cgroup) for every run.
+  - One sampler thread reads the current memory usage every O(sample_interval) seconds. The last O(buffer_size) samples of
+    a task are kept to compute the median and the 95th percentile. The peak of a task covers all of its samples.
 options:
   max_mem_file:
-    required: true
-    description: Path to cgroups C(memory.max_usage_in_bytes) file. Example V(/sys/fs/cgroup/memory/ansible_profile/memory.max_usage_in_bytes).
+    description:
+      - Path to cgroups C(memory.max_usage_in_bytes) file. Example V(/sys/fs/cgroup/memory/ansible_profile/memory.max_usage_in_bytes).
+      - Required unless O(cgroup_dir) is set.
     type: str
     env:
       - name: CGROUP_MAX_MEM_FILE
@@ -31,38 +38,197 @@ options:
       - section: callback_cgroupmemrecap
         key: max_mem_file
   cur_mem_file:
-    required: true
-    description: Path to C(memory.usage_in_bytes) file. Example V(/sys/fs/cgroup/memory/ansible_profile/memory.usage_in_bytes).
+    description:
+      - Path to C(memory.usage_in_bytes) file. Example V(/sys/fs/cgroup/memory/ansible_profile/memory.usage_in_bytes).
+      - Required unless O(cgroup_dir) is set.
     type: str
     env:
       - name: CGROUP_CUR_MEM_FILE
     ini:
       - section: callback_cgroupmemrecap
         key: cur_mem_file
+  cgroup_dir:
+    description:
+      - Path to the directory of a C(cgroup) v2. Example V(/sys/fs/cgroup/ansible_profile).
+      - If set, O(max_mem_file) and O(cur_mem_file) are ignored.
+    type: path
+    env:
+      - name: CGROUP_DIR
+    ini:
+      - section: callback_cgroupmemrecap
+        key: cgroup_dir
+    version_added: 13.4.0
+  sample_interval:
+    description: Seconds between two samples of the current memory usage.
+    type: float
+    default: 0.001
+    env:
+      - name: CGROUP_SAMPLE_INTERVAL
+    ini:
+      - section: callback_cgroupmemrecap
+        key: sample_interval
+    version_added: 13.4.0
+  buffer_size:
+    description: Number of samples kept per task to compute the percentiles.
+    type: int
+    default: 65536
+    env:
+      - name: CGROUP_BUFFER_SIZE
+    ini:
+      - section: callback_cgroupmemrecap
+        key: buffer_size
+    version_added: 13.4.0
+  json_file:
+    description:
+      - If set, the recap is also written to this file as JSON.
+      - Memory usage is given in bytes there.
+    type: path
+    env:
+      - name: CGROUP_JSON_FILE
+    ini:
+      - section: callback_cgroupmemrecap
+        key: json_file
+    version_added: 13.4.0
 """
 
+import json
+import os
 import threading
-import time
+from array import array
+from dataclasses import asdict, dataclass
 
+from ansible.errors import AnsibleError
 from ansible.plugins.callback import CallbackBase
 
+MB = 1024 * 1024
 
-class MemProf(threading.Thread):
-    """Python thread for recording memory usage"""
 
-    def __init__(self, path, obj=None):
-        threading.Thread.__init__(self)
-        self.obj = obj
+class CgroupFile:
+    """A cgroup file that is kept open and re-read with pread()"""
+
+    def __init__(self, path):
         self.path = path
-        self.results = []
-        self.running = True
+        self.fd = os.open(path, os.O_RDONLY)
+
+    def read(self):
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(self.fd, 4096, offset)
+            chunks.append(chunk)
+            if len(chunk) < 4096:
+                return b"".join(chunks).decode("ascii")
+            offset += len(chunk)
+
+    def read_int(self):
+        return int(os.pread(self.fd, 64, 0))
+
+    def close(self):
+        os.close(self.fd)
+
+
+def parse_cpu_stat(content):
+    """Return the CPU time from the content of cpu.stat in seconds"""
+    for line in content.splitlines():
+        key, dummy, value = line.partition(" ")
+        if key == "usage_usec":
+            return int(value) / 1000000
+    return 0.0
+
+
+def parse_io_stat(content):
+    """Return the sum of the bytes read and written of all devices from the content of io.stat"""
+    total = 0
+    for line in content.splitlines():
+        for field in line.split()[1:]:
+            key, dummy, value = field.partition("=")
+            if key in ("rbytes", "wbytes"):
+                total += int(value)
+    return total
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of a sorted, non-empty sequence"""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class RingBuffer:
+    """Fixed-size buffer of the last samples"""
+
+    def __init__(self, size):
+        self.size = size
+        self.samples = array("d", bytes(8 * size))
+        self.count = 0
+
+    def append(self, value):
+        self.samples[self.count % self.size] = value
+        self.count += 1
+
+    def values(self):
+        return self.samples[: min(self.count, self.size)]
+
+    def clear(self):
+        self.count = 0
+
+
+@dataclass
+class TaskProfile:
+    name: str
+    uuid: str
+    samples: int
+    peak: int
+    p50: int
+    p95: int
+    cpu_seconds: float | None = None
+    io_bytes: int | None = None
+
+
+class MemProf(threading.Thread):
+    """Python thread for recording memory usage
+
+    A single thread samples for the whole run, switch() moves it to the next task.
+    """
+
+    def __init__(self, current_file, interval=0.001, buffer_size=65536):
+        super().__init__(name="cgroup_memory_recap", daemon=True)
+        self.current_file = current_file
+        self.interval = interval
+        self.obj = None
+        self.buffer = RingBuffer(buffer_size)
+        self.peak = 0.0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def _sample(self):
+        value = self.current_file.read_int()
+        self.buffer.append(value)
+        if value > self.peak:
+            self.peak = value
 
     def run(self):
-        while self.running:
-            with open(self.path) as f:
-                val = f.read()
-            self.results.append(int(val.strip()) / 1024 / 1024)
-            time.sleep(0.001)
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                if self.obj is not None:
+                    self._sample()
+
+    def switch(self, obj=None):
+        """Start recording for obj and return (obj, samples, peak) of the previous task, if any"""
+        with self._lock:
+            previous = None
+            if self.obj is not None:
+                self._sample()
+                previous = (self.obj, self.buffer.values(), self.peak)
+            self.obj = obj
+            self.buffer.clear()
+            self.peak = 0.0
+            if obj is not None:
+                self._sample()
+        return previous
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
 
 
 class CallbackModule(CallbackBase):
@@ -75,46 +241,113 @@ class CallbackModule(CallbackBase):
         super().__init__(display)
 
         self._task_memprof = None
+        self._cgroup_files = {}
+        self._task_start = None
 
         self.task_results = []
 
     def set_options(self, task_keys=None, var_options=None, direct=None):
         super().set_options(task_keys=task_keys, var_options=var_options, direct=direct)
 
-        self.cgroup_max_file = self.get_option("max_mem_file")
-        self.cgroup_current_file = self.get_option("cur_mem_file")
+        cgroup_dir = self.get_option("cgroup_dir")
+        if cgroup_dir:
+            self.cgroup_max_file = os.path.join(cgroup_dir, "memory.peak")
+            self.cgroup_current_file = os.path.join(cgroup_dir, "memory.current")
+        else:
+            self.cgroup_max_file = self.get_option("max_mem_file")
+            self.cgroup_current_file = self.get_option("cur_mem_file")
+            if not self.cgroup_max_file or not self.cgroup_current_file:
+                raise AnsibleError(
+                    "The cgroup_memory_recap callback needs either cgroup_dir, or both max_mem_file and cur_mem_file"
+                )
+            with open(self.cgroup_max_file, "w+") as f:
+                f.write("0")
+
+        self._cgroup_files["current"] = CgroupFile(self.cgroup_current_file)
+        if cgroup_dir:
+            for name in ("cpu.stat", "io.stat"):
+                try:
+                    self._cgroup_files[name] = CgroupFile(os.path.join(cgroup_dir, name))
+                except OSError:
+                    self._display.warning(f"Cannot open {name} in {cgroup_dir}, is the controller enabled?")
+
+        self._task_memprof = MemProf(
+            self._cgroup_files["current"],
+            interval=self.get_option("sample_interval"),
+            buffer_size=self.get_option("buffer_size"),
+        )
+        self._task_memprof.start()
 
-        with open(self.cgroup_max_file, "w+") as f:
-            f.write("0")
+    def _read_counters(self):
+        counters = {}
+        if "cpu.stat" in self._cgroup_files:
+            counters["cpu_seconds"] = parse_cpu_stat(self._cgroup_files["cpu.stat"].read())
+        if "io.stat" in self._cgroup_files:
+            counters["io_bytes"] = parse_io_stat(self._cgroup_files["io.stat"].read())
+        return counters
 
     def _profile_memory(self, obj=None):
-        prev_task = None
-        results = None
-        try:
-            self._task_memprof.running = False
-            results = self._task_memprof.results
-            prev_task = self._task_memprof.obj
-        except AttributeError:
-            pass
+        if self._task_memprof is None:
+            return
+
+        previous = self._task_memprof.switch(obj)
+        counters = self._read_counters()
 
-        if obj is not None:
-            self._task_memprof = MemProf(self.cgroup_current_file, obj=obj)
-            self._task_memprof.start()
+        if previous is not None:
+            prev_task, samples, peak = previous
+            samples = sorted(samples)
+            profile = TaskProfile(
+                name=prev_task.get_name(),
+                uuid=prev_task._uuid,
+                samples=len(samples),
+                peak=int(peak),
+                p50=int(percentile(samples, 50)),
+                p95=int(percentile(samples, 95)),
+            )
+            for key, value in counters.items():
+                setattr(profile, key, value - self._task_start[key])
+            self.task_results.append(profile)
 
-        if results is not None:
-            self.task_results.append((prev_task, max(results)))
+        self._task_start = counters
 
     def v2_playbook_on_task_start(self, task, is_conditional):
         self._profile_memory(task)
 
+    def _execution_maximum(self):
+        try:
+            with open(self.cgroup_max_file) as f:
+                return int(f.read().strip())
+        except OSError:
+            # memory.peak is only available with Linux 5.19 and newer
+            return max((profile.peak for profile in self.task_results), default=0)
+
     def v2_playbook_on_stats(self, stats):
         self._profile_memory()
+        self._task_memprof.stop()
+        for cgroup_file in self._cgroup_files.values():
+            cgroup_file.close()
 
-        with open(self.cgroup_max_file) as f:
-            max_results = int(f.read().strip()) / 1024 / 1024
+        max_results = self._execution_maximum()
 
         self._display.banner("CGROUP MEMORY RECAP")
-        self._display.display(f"Execution Maximum: {max_results:0.2f}MB\n\n")
+        self._display.display(f"Execution Maximum: {max_results / MB:0.2f}MB\n\n")
+
+        for profile in self.task_results:
+            details = [f"p50: {profile.p50 / MB:0.2f}MB", f"p95: {profile.p95 / MB:0.2f}MB"]
+            if profile.cpu_seconds is not None:
+                details.append(f"cpu: {profile.cpu_seconds:0.2f}s")
+            if profile.io_bytes is not None:
+                details.append(f"io: {profile.io_bytes}B")
+            self._display.display(f"{profile.name} ({profile.uuid}): {profile.peak / MB:0.2f}MB ({', '.join(details)})")
 
-        for task, memory in self.task_results:
-            self._display.display(f"{task.get_name()} ({task._uuid}): {memory:0.2f}MB")
+        json_file = self.get_option("json_file")
+        if json_file:
+            with open(json_file, "w") as f:
+                json.dump(
+                    {
+                        "execution_maximum": max_results,
+                        "tasks": [asdict(profile) for profile in self.task_results],
+                    },
+                    f,
+                    indent=2,
+                )
@@ -814,6 +814,17 @@ class CallbackModule(Default):
 
     DIY_NS = "ansible_callback_diy"
 
+    TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # variables of the host/task pairs that are running, shared by their item and retry events
+        self._diy_vars_cache = {}
+        # option value -> whether it has to be templated
+        self._diy_template_cache = {}
+        self._diy_templar = None
+
     @contextmanager
     def _suppress_stdout(self, enabled):
         saved_stdout = sys.stdout
@@ -832,6 +843,10 @@ class CallbackModule(Default):
             _option_name = f"{_callback_type}_{option}"
             _option_template = variables.get(f"{self.DIY_NS}_{_option_name}", self.get_option(_option_name))
             _ret.update({option: self._template(loader=loader, template=_option_template, variables=variables)})
+            if option == "msg" and _ret["msg"] is None:
+                # the default callback is used for this event, so the color is not needed
+                _ret.update({"msg_color": None})
+                break
 
         _ret.update({"vars": variables})
 
@@ -846,9 +861,24 @@ class CallbackModule(Default):
     def _parent_has_callback(self):
         return hasattr(super(), sys._getframe(1).f_code.co_name)
 
+    def _is_template(self, template):
+        try:
+            return self._diy_template_cache[template]
+        except KeyError:
+            _is_template = any(marker in template for marker in self.TEMPLATE_MARKERS)
+            self._diy_template_cache[template] = _is_template
+            return _is_template
+
     def _template(self, loader, template, variables):
-        _templar = Templar(loader=loader, variables=variables)
-        return _templar.template(template, preserve_trailing_newlines=True, convert_data=False, escape_backslashes=True)
+        if not isinstance(template, str) or not self._is_template(template):
+            return template
+
+        if self._diy_templar is None:
+            self._diy_templar = Templar(loader=loader)
+        self._diy_templar.available_variables = variables
+        return self._diy_templar.template(
+            template, preserve_trailing_newlines=True, convert_data=False, escape_backslashes=True
+        )
 
     def _output(self, spec, stderr=False):
         _msg = to_text(spec["msg"])
@@ -866,6 +896,7 @@ class CallbackModule(Default):
         result=None,
         stats=None,
         remove_attr_ref_loop=True,
+        reuse_vars=False,
     ):
         def _get_value(obj, attr=None, method=None):
             if attr:
@@ -891,13 +922,17 @@ class CallbackModule(Default):
 
         _ret = {}
 
-        _variable_manager = VariableManager(loader=playbook.get_loader())
-
-        _all = _variable_manager.get_vars()
         if play:
-            _all = play.get_variable_manager().get_vars(
-                play=play, host=(host if host else getattr(result, "_host", None)), task=(handler if handler else task)
+            _all = self._get_play_vars(
+                play=play,
+                host=(host if host else getattr(result, "_host", None)),
+                task=(handler if handler else task),
+                reuse=reuse_vars,
+                store=(host is not None and task is not None),
+                release=(result is not None and not reuse_vars),
             )
+        else:
+            _all = VariableManager(loader=playbook.get_loader()).get_vars()
         _ret.update(_all)
 
         _ret.update(_ret.get(self.DIY_NS, {self.DIY_NS: {} if SUPPORTS_DATA_TAGGING else CallbackDIYDict()}))
@@ -1131,6 +1166,27 @@ class CallbackModule(Default):
 
         return _ret
 
+    def _get_play_vars(self, play, host, task, reuse, store, release):
+        """
+        Variables from the play's variable manager.
+
+        A host starting a task stores its variables, which are reused by the item and retry events of that task.
+        They are dropped when the task's final result comes in, as facts and registered variables have changed then.
+        """
+        _key = (play._uuid, getattr(host, "name", host), getattr(task, "_uuid", None))
+
+        if reuse and _key in self._diy_vars_cache:
+            return self._diy_vars_cache[_key]
+
+        _all = play.get_variable_manager().get_vars(play=play, host=host, task=task)
+
+        if reuse or store:
+            self._diy_vars_cache[_key] = _all
+        elif release:
+            self._diy_vars_cache.pop(_key, None)
+
+        return _all
+
     def v2_on_any(self, *args, **kwargs):
         self._diy_spec = self._get_output_specification(loader=self._diy_loader, variables=self._diy_spec["vars"])
 
@@ -1222,6 +1278,7 @@ class CallbackModule(Default):
                 task=self._diy_task,
                 result=result,
                 remove_attr_ref_loop=False,
+                reuse_vars=True,
             ),
         )
 
@@ -1241,6 +1298,7 @@ class CallbackModule(Default):
                 task=self._diy_task,
                 result=result,
                 remove_attr_ref_loop=False,
+                reuse_vars=True,
             ),
         )
 
@@ -1260,6 +1318,7 @@ class CallbackModule(Default):
                 task=self._diy_task,
                 result=result,
                 remove_attr_ref_loop=False,
+                reuse_vars=True,
             ),
         )
 
@@ -1274,7 +1333,11 @@ class CallbackModule(Default):
         self._diy_spec = self._get_output_specification(
             loader=self._diy_loader,
             variables=self._get_vars(
-                playbook=self._diy_playbook, play=self._diy_play, task=self._diy_task, result=result
+                playbook=self._diy_playbook,
+                play=self._diy_play,
+                task=self._diy_task,
+                result=result,
+                reuse_vars=True,
             ),
         )
 
@@ -1306,6 +1369,7 @@ class CallbackModule(Default):
     def v2_playbook_on_start(self, playbook):
         self._diy_playbook = playbook
         self._diy_loader = self._diy_playbook.get_loader()
+        self._diy_templar = None
 
         self._diy_spec = self._get_output_specification(
             loader=self._diy_loader, variables=self._get_vars(playbook=self._diy_playbook)
@@ -1423,6 +1487,7 @@ class CallbackModule(Default):
 
     def v2_playbook_on_play_start(self, play):
         self._diy_play = play
+        self._diy_vars_cache.clear()
 
         self._diy_spec = self._get_output_specification(
             loader=self._diy_loader, variables=self._get_vars(playbook=self._diy_playbook, play=self._diy_play)
@@ -25,6 +25,81 @@ options:
     ini:
       - section: callback_log_plays
         key: log_folder
+  log_format:
+    default: text
+    description:
+      - The format of the log files.
+      - V(text) writes one block of text per result.
+      - V(json) writes one JSON object per line (JSON Lines), with the keys C(time), C(playbook), C(task_name), C(task_action),
+        C(category), C(invocation) and C(result).
+    type: str
+    choices:
+      - text
+      - json
+    env:
+      - name: ANSIBLE_LOG_PLAYS_FORMAT
+    ini:
+      - section: callback_log_plays
+        key: log_format
+    version_added: 13.4.0
+  max_open_files:
+    default: 100
+    description:
+      - The number of log files that are kept open between results.
+      - When another file is needed, the least recently used one is closed.
+    type: int
+    env:
+      - name: ANSIBLE_LOG_PLAYS_MAX_OPEN_FILES
+    ini:
+      - section: callback_log_plays
+        key: max_open_files
+    version_added: 13.4.0
+  flush_interval:
+    default: 1.0
+    description:
+      - Writes are buffered, and flushed to the log files once this many seconds have passed since the last flush.
+      - Use V(0) to flush after every result.
+      - All files are flushed and closed at the end of the playbook.
+    type: float
+    env:
+      - name: ANSIBLE_LOG_PLAYS_FLUSH_INTERVAL
+    ini:
+      - section: callback_log_plays
+        key: flush_interval
+    version_added: 13.4.0
+  max_size:
+    default: 0
+    description:
+      - Rotate a log file before it grows beyond this many bytes. The current file is renamed to C(<host>.1), older files
+        are shifted to C(<host>.2) and so on.
+      - Use V(0) to never rotate.
+    type: int
+    env:
+      - name: ANSIBLE_LOG_PLAYS_MAX_SIZE
+    ini:
+      - section: callback_log_plays
+        key: max_size
+    version_added: 13.4.0
+  backup_count:
+    default: 5
+    description: The number of rotated log files kept per host.
+    type: int
+    env:
+      - name: ANSIBLE_LOG_PLAYS_BACKUP_COUNT
+    ini:
+      - section: callback_log_plays
+        key: backup_count
+    version_added: 13.4.0
+  compress:
+    default: false
+    description: Whether to compress rotated log files with gzip. They get a C(.gz) suffix.
+    type: bool
+    env:
+      - name: ANSIBLE_LOG_PLAYS_COMPRESS
+    ini:
+      - section: callback_log_plays
+        key: compress
+    version_added: 13.4.0
 """
 
 import json
@@ -37,6 +112,8 @@ from ansible.parsing.ajson import AnsibleJSONEncoder
 from ansible.plugins.callback import CallbackBase
 from ansible.utils.path import makedirs_safe
 
+from ansible_collections.community.general.plugins.plugin_utils._log_writer import LogFilePool
+
 # NOTE: in Ansible 1.2 or later general logging is available without
 # this plugin, just set ANSIBLE_LOG_PATH as an environment variable
 # or log_path in the DEFAULTS section of your ansible configuration
@@ -62,6 +139,7 @@ class CallbackModule(CallbackBase):
 
     def __init__(self):
         super().__init__()
+        self._log_files = None
 
     def set_options(self, task_keys=None, var_options=None, direct=None):
         super().set_options(task_keys=task_keys, var_options=var_options, direct=direct)
@@ -71,7 +149,45 @@ class CallbackModule(CallbackBase):
         if not os.path.exists(self.log_folder):
             makedirs_safe(self.log_folder)
 
+        self.log_format = self.get_option("log_format")
+
+        self._log_files = LogFilePool(
+            max_open=self.get_option("max_open_files"),
+            flush_interval=self.get_option("flush_interval"),
+            max_size=self.get_option("max_size"),
+            backup_count=self.get_option("backup_count"),
+            compress=self.get_option("compress"),
+        )
+
+    def _make_json_msg(self, now, result, category):
+        data = result._result
+        invocation = None
+        if isinstance(data, MutableMapping):
+            if "_ansible_verbose_override" in data:
+                # avoid logging extraneous data
+                data = "omitted"
+            else:
+                data = data.copy()
+                invocation = data.pop("invocation", None)
+        record = {
+            "time": now,
+            "playbook": self.playbook,
+            "task_name": result._task.name,
+            "task_action": result._task.action,
+            "category": category,
+            "invocation": invocation,
+            "result": data,
+        }
+        return f"{json.dumps(record, cls=AnsibleJSONEncoder)}\n"
+
     def log(self, result, category):
+        path = os.path.join(self.log_folder, result._host.get_name())
+        now = time.strftime(self.TIME_FORMAT, time.localtime())
+
+        if self.log_format == "json":
+            self._log_files.write(path, to_bytes(self._make_json_msg(now, result, category)))
+            return
+
         data = result._result
         if isinstance(data, MutableMapping):
             if "_ansible_verbose_override" in data:
@@ -84,12 +200,8 @@ class CallbackModule(CallbackBase):
                 if invocation is not None:
                     data = f"{json.dumps(invocation)} => {data} "
 
-        path = os.path.join(self.log_folder, result._host.get_name())
-        now = time.strftime(self.TIME_FORMAT, time.localtime())
-
         msg = to_bytes(self._make_msg(now, self.playbook, result._task.name, result._task.action, category, data))
-        with open(path, "ab") as fd:
-            fd.write(msg)
+        self._log_files.write(path, msg)
 
     def v2_runner_on_failed(self, result, ignore_errors=False):
         self.log(result, "FAILED")
@@ -114,3 +226,6 @@ class CallbackModule(CallbackBase):
 
     def v2_playbook_on_not_import_for_host(self, result, missing_file):
         self.log(result, "NOTIMPORTED", missing_file)
+
+    def v2_playbook_on_stats(self, stats):
+        self._log_files.close()
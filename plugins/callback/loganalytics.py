@@ -35,6 +35,19 @@ options:
     ini:
       - section: callback_loganalytics
         key: shared_key
+  keep_alive:
+    description:
+      - Whether to keep the connection to the collector open and reuse it for the following requests, instead of opening
+        a new connection for every request.
+      - Proxy settings from the environment are ignored if this is enabled.
+    type: bool
+    default: false
+    env:
+      - name: WORKSPACE_KEEP_ALIVE
+    ini:
+      - section: callback_loganalytics
+        key: keep_alive
+    version_added: 13.4.0
 deprecated:
   removed_in: 14.0.0
   why: The "HTTP Data Collector API" used by the plugin has been deprecated in Azure Monitor and replaced with the "Logs Ingestion API".
@@ -72,6 +85,7 @@ from ansible.plugins.callback import CallbackBase
 from ansible_collections.community.general.plugins.module_utils._datetime import (
     now,
 )
+from ansible_collections.community.general.plugins.plugin_utils._http_pool import HTTPConnectionPool
 
 
 class AzureLogAnalyticsSource:
@@ -82,6 +96,7 @@ class AzureLogAnalyticsSource:
         self.host = socket.gethostname()
         self.user = getpass.getuser()
         self.extra_vars = ""
+        self.http = None
 
     def __build_signature(self, date, workspace_id, shared_key, content_length):
         # Build authorisation signature for Azure log analytics API call
@@ -139,15 +154,19 @@ class AzureLogAnalyticsSource:
         signature = self.__build_signature(rfc1123date, workspace_id, shared_key, content_length)
         workspace_url = self.__build_workspace_url(workspace_id)
 
+        headers = {
+            "content-type": "application/json",
+            "Authorization": signature,
+            "Log-Type": "ansible_playbook",
+            "x-ms-date": rfc1123date,
+        }
+        if self.http is not None:
+            self.http.request(workspace_url, jsondata, headers=headers)
+            return
         open_url(
             workspace_url,
             jsondata,
-            headers={
-                "content-type": "application/json",
-                "Authorization": signature,
-                "Log-Type": "ansible_playbook",
-                "x-ms-date": rfc1123date,
-            },
+            headers=headers,
             method="POST",
         )
 
@@ -172,6 +191,8 @@ class CallbackModule(CallbackBase):
         super().set_options(task_keys=task_keys, var_options=var_options, direct=direct)
         self.workspace_id = self.get_option("workspace_id")
         self.shared_key = self.get_option("shared_key")
+        if self.get_option("keep_alive"):
+            self.loganalytics.http = HTTPConnectionPool()
 
     def v2_playbook_on_play_start(self, play):
         vm = play.get_variable_manager()
@@ -187,6 +208,10 @@ class CallbackModule(CallbackBase):
     def v2_playbook_on_handler_task_start(self, task):
         self.start_datetimes[task._uuid] = now()
 
+    def v2_playbook_on_stats(self, stats):
+        if self.loganalytics.http is not None:
+            self.loganalytics.http.close()
+
     def v2_runner_on_ok(self, result, **kwargs):
         self.loganalytics.send_event(
             self.workspace_id, self.shared_key, "OK", result, self._seconds_since_start(result)
@@ -20,6 +20,8 @@ requirements:
   - The callback plugin has been enabled.
   - An Azure Log Analytics workspace has been established.
   - A Data Collection Rule (DCR) and custom table are created.
+extends_documentation_fragment:
+  - community.general._event_shipping.loganalytics
 options:
   dce_url:
     description: URL of the Data Collection Endpoint (DCE) for Azure Logs Ingestion API.
@@ -122,6 +124,19 @@ options:
     ini:
       - section: callback_loganalytics
         key: timeout
+  keep_alive:
+    description:
+      - Whether to keep the connection to the collector open and reuse it for the following requests, instead of opening
+        a new connection for every request.
+      - Proxy settings from the environment are ignored if this is enabled.
+    type: bool
+    default: false
+    env:
+      - name: ANSIBLE_LOGANALYTICS_KEEP_ALIVE
+    ini:
+      - section: callback_loganalytics
+        key: keep_alive
+    version_added: 13.4.0
 seealso:
   - name: Logs Ingestion API
     description: Overview of Logs Ingestion API in Azure Monitor
@@ -129,6 +144,8 @@ seealso:
 notes:
   - Triple verbosity logging (C(-vvv)) can be used to generate JSON sample data for creating the table schema in Azure Log Analytics.
     Search for the string C(Event Data:) in the output in order to locate the data sample.
+  - If O(queue_size) is positive, events are sent in batches by a background thread. All queued events are sent at the
+    end of the playbook run.
 """
 
 EXAMPLES = """
@@ -157,6 +174,9 @@ from ansible.module_utils.urls import open_url
 from ansible.plugins.callback import CallbackBase
 from ansible.utils.display import Display
 
+from ansible_collections.community.general.plugins.plugin_utils._event_shipping import EventShipper
+from ansible_collections.community.general.plugins.plugin_utils._http_pool import HTTPConnectionPool
+
 display = Display()
 
 
@@ -194,6 +214,8 @@ class AzureLogAnalyticsIngestionSource:
         self.user = getpass.getuser()
         self.timeout = timeout
         self.fqcn = fqcn
+        self.shipper = None
+        self.http = None
 
         self.bearer_token = self.get_bearer_token()
 
@@ -223,13 +245,48 @@ class AzureLogAnalyticsIngestionSource:
     # Method to send event data to the Azure Logs Ingestion API
     # This replaces the legacy API call and now uses the Logs Ingestion API endpoint
     def send_event(self, event_data):
+        if self.shipper is None:
+            self.post(json.dumps(event_data))
+        else:
+            for record in event_data:
+                self.shipper.put(json.dumps(record).encode("utf-8"))
+
+    def post(self, data, headers=None):
         if not self.is_token_valid():
             self.bearer_token = self.get_bearer_token()
         ingestion_url = (
             f"{self.dce_url}/dataCollectionRules/{self.dcr_id}/streams/{self.stream_name}?api-version=2023-01-01"
         )
-        headers = {"Authorization": f"Bearer {self.bearer_token}", "Content-Type": "application/json"}
-        open_url(ingestion_url, data=json.dumps(event_data), headers=headers, method="POST", timeout=self.timeout)
+        headers = {
+            "Authorization": f"Bearer {self.bearer_token}",
+            "Content-Type": "application/json",
+            **(headers or {}),
+        }
+        if self.http is not None:
+            self.http.request(ingestion_url, data, headers=headers, timeout=self.timeout)
+            return
+        open_url(ingestion_url, data=data, headers=headers, method="POST", timeout=self.timeout)
+
+    def start_shipper(self, **kwargs):
+        """Send the events in batches from a background thread, see EventShipper for the arguments."""
+        self.shipper = EventShipper(
+            self.fqcn,
+            lambda key, body, headers: self.post(body, headers=headers),
+            # the API expects a JSON array of records
+            lambda records: b"[" + b",".join(records) + b"]",
+            **kwargs,
+        )
+
+    def stop_shipper(self):
+        if self.shipper is not None:
+            self.shipper.close()
+            self._report_shipper_errors()
+        if self.http is not None:
+            self.http.close()
+
+    def _report_shipper_errors(self):
+        for error in self.shipper.pop_errors():
+            self._handle_failure(error)
 
     def _rfc1123date(self):
         return datetime.now(UTC).strftime("%a, %d %b %Y %H:%M:%S GMT")
@@ -238,19 +295,28 @@ class AzureLogAnalyticsIngestionSource:
     def send_to_loganalytics(self, playbook_name, result, state):
         if self.disabled:
             return
+        if self.shipper is not None:
+            # failures of the background thread count like those of synchronous requests
+            self._report_shipper_errors()
+            if self.disabled:
+                self.shipper.close()
+                return
         try:
             self._send_to_loganalytics(playbook_name, result, state)
         except Exception as e:
-            display.warning(f"{self.fqcn} callback plugin failure: {e}.")
-            if self.disable_on_failure:
-                self.failures += 1
-                if self.failures >= self.disable_attempts:
-                    display.warning(
-                        f"{self.fqcn} callback plugin failures exceed maximum of '{self.disable_attempts}'!  Disabling plugin!"
-                    )
-                    self.disabled = True
-                else:
-                    display.v(f"{self.fqcn} callback plugin failure {self.failures}/{self.disable_attempts}")
+            self._handle_failure(e)
+
+    def _handle_failure(self, error):
+        display.warning(f"{self.fqcn} callback plugin failure: {error}.")
+        if self.disable_on_failure and not self.disabled:
+            self.failures += 1
+            if self.failures >= self.disable_attempts:
+                display.warning(
+                    f"{self.fqcn} callback plugin failures exceed maximum of '{self.disable_attempts}'!  Disabling plugin!"
+                )
+                self.disabled = True
+            else:
+                display.v(f"{self.fqcn} callback plugin failure {self.failures}/{self.disable_attempts}")
 
     def _send_to_loganalytics(self, playbook_name, result, state):
         ansible_role = str(result._task._role) if result._task._role else None
@@ -331,9 +397,26 @@ class CallbackModule(CallbackBase):
             self.fqcn,
         )
 
+        if self.get_option("keep_alive"):
+            self.azure_loganalytics.http = HTTPConnectionPool()
+
+        if self.get_option("queue_size") > 0:
+            self.azure_loganalytics.start_shipper(
+                queue_size=self.get_option("queue_size"),
+                max_events=self.get_option("flush_events"),
+                max_bytes=self.get_option("flush_bytes"),
+                interval=self.get_option("flush_interval"),
+                compress=self.get_option("compress"),
+                retries=self.get_option("retries"),
+                spool_dir=self.get_option("spool_dir"),
+            )
+
     def v2_playbook_on_start(self, playbook):
         self.playbook_name = basename(playbook._file_name)
 
+    def v2_playbook_on_stats(self, stats):
+        self.azure_loganalytics.stop_shipper()
+
     # Build event data and send it to the Logs Ingestion API
     def v2_runner_on_failed(self, result, **kwargs):
         self.azure_loganalytics.send_to_loganalytics(self.playbook_name, result, "FAILED")
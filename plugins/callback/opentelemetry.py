@@ -109,6 +109,83 @@ options:
       - section: callback_opentelemetry
         key: otel_exporter_otlp_traces_protocol
     version_added: 9.0.0
+  streaming:
+    default: false
+    type: bool
+    description:
+      - Export the span of a task on a host as soon as the result of the host arrives, instead of creating all spans at the
+        end of the playbook.
+      - The result of a host is dropped once its span has been exported. This keeps the memory usage bounded for large runs.
+      - Spans that have already been exported are also delivered when the playbook does not finish.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_STREAMING
+    ini:
+      - section: callback_opentelemetry
+        key: streaming
+    version_added: 13.4.0
+  batch_max_queue_size:
+    type: int
+    description:
+      - The maximum number of spans kept in the queue of the batch span processor. Spans are dropped when the queue is full.
+      - If not set, E(OTEL_BSP_MAX_QUEUE_SIZE) or the default of the OpenTelemetry SDK is used.
+      - Not used when O(store_spans_in_file) is set.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_BATCH_MAX_QUEUE_SIZE
+    ini:
+      - section: callback_opentelemetry
+        key: batch_max_queue_size
+    version_added: 13.4.0
+  batch_max_export_batch_size:
+    type: int
+    description:
+      - The maximum number of spans exported in one request by the batch span processor.
+      - If not set, E(OTEL_BSP_MAX_EXPORT_BATCH_SIZE) or the default of the OpenTelemetry SDK is used.
+      - Not used when O(store_spans_in_file) is set.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_BATCH_MAX_EXPORT_BATCH_SIZE
+    ini:
+      - section: callback_opentelemetry
+        key: batch_max_export_batch_size
+    version_added: 13.4.0
+  batch_schedule_delay:
+    type: int
+    description:
+      - The delay in milliseconds between two exports of the batch span processor.
+      - If not set, E(OTEL_BSP_SCHEDULE_DELAY) or the default of the OpenTelemetry SDK is used.
+      - Not used when O(store_spans_in_file) is set.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_BATCH_SCHEDULE_DELAY
+    ini:
+      - section: callback_opentelemetry
+        key: batch_schedule_delay
+    version_added: 13.4.0
+  sampling_filter:
+    type: list
+    elements: str
+    default: []
+    description:
+      - Only create spans for the tasks whose name matches one of these shell-style patterns.
+      - "The name is matched as C(<play name>: <task name>), for example V(Deploy*: *) or V(*: Install packages)."
+      - If empty, all tasks are considered.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_SAMPLING_FILTER
+    ini:
+      - section: callback_opentelemetry
+        key: sampling_filter
+    version_added: 13.4.0
+  sampling_ratio:
+    type: float
+    default: 1.0
+    description:
+      - The ratio of the tasks matching O(sampling_filter) for which spans are created.
+      - The decision is taken once per task when it starts, so a task has either spans for all of its hosts or none.
+      - The results of tasks that are not sampled are not kept.
+    env:
+      - name: ANSIBLE_OPENTELEMETRY_SAMPLING_RATIO
+    ini:
+      - section: callback_opentelemetry
+        key: sampling_ratio
+    version_added: 13.4.0
 requirements:
   - opentelemetry-api (Python library)
   - opentelemetry-exporter-otlp (Python library)
@@ -136,7 +213,9 @@ import json
 import os
 import socket
 import uuid
+import zlib
 from collections import OrderedDict
+from fnmatch import fnmatchcase
 from os.path import basename
 from time import time_ns
 from urllib.parse import urlparse
@@ -168,7 +247,7 @@ class TaskData:
     Data about an individual task.
     """
 
-    def __init__(self, uuid, name, path, play, action, args):
+    def __init__(self, uuid, name, path, play, action, args, sampled=True):
         self.uuid = uuid
         self.name = name
         self.path = path
@@ -178,6 +257,7 @@ class TaskData:
         self.action = action
         self.args = args
         self.dump = None
+        self.sampled = sampled
 
     def add_host(self, host):
         if host.uuid in self.host_data:
@@ -223,12 +303,32 @@ class OpenTelemetrySource:
 
         self._display = display
 
+        self.tracer = None
+        self.tracer_provider = None
+        self.otel_exporter = None
+        self.parent_span = None
+        self.parent_context = None
+
     def traceparent_context(self, traceparent):
         carrier = dict()
         carrier["traceparent"] = traceparent
         return TraceContextTextMapPropagator().extract(carrier=carrier)
 
-    def start_task(self, tasks_data, hide_task_arguments, play_name, task, host):
+    @staticmethod
+    def is_sampled(play_name, task_name, task_uuid, sampling_filter=None, sampling_ratio=1.0):
+        """head-based sampling decision for a task"""
+
+        if sampling_filter and not any(
+            fnmatchcase(f"{play_name}: {task_name}", pattern) for pattern in sampling_filter
+        ):
+            return False
+        if sampling_ratio >= 1.0:
+            return True
+        return zlib.crc32(task_uuid.encode("utf-8")) / 0x100000000 < sampling_ratio
+
+    def start_task(
+        self, tasks_data, hide_task_arguments, play_name, task, host, sampling_filter=None, sampling_ratio=1.0
+    ):
         """record the start of a task for one or more hosts"""
 
         uuid = task._uuid
@@ -245,11 +345,12 @@ class OpenTelemetrySource:
         if not task.no_log and not hide_task_arguments:
             args = task.args
 
-        tasks_data[uuid] = TaskData(uuid, name, path, play_name, action, args)
+        sampled = self.is_sampled(play_name, name, uuid, sampling_filter, sampling_ratio)
+        tasks_data[uuid] = TaskData(uuid, name, path, play_name, action, args, sampled=sampled)
         tasks_data[uuid].add_host(HostData(host._uuid, host.name, "started"))
 
     def finish_task(self, tasks_data, status, result, dump):
-        """record the results of a task for a single host"""
+        """record the results of a task for a single host, and return its HostData if the task is sampled"""
 
         task_uuid = result._task._uuid
 
@@ -262,31 +363,24 @@ class OpenTelemetrySource:
 
         task = tasks_data[task_uuid]
 
+        if not task.sampled:
+            task.host_data.pop(host_uuid, None)
+            return None
+
         task.dump = dump
         task.add_host(HostData(host_uuid, host_name, status, result))
+        return task.host_data[host_uuid]
 
-    def generate_distributed_traces(
-        self,
-        otel_service_name,
-        ansible_playbook,
-        tasks_data,
-        status,
-        traceparent,
-        disable_logs,
-        disable_attributes_in_logs,
-        otel_exporter_otlp_traces_protocol,
-        store_spans_in_file,
+    def init_tracer(
+        self, otel_service_name, otel_exporter_otlp_traces_protocol, store_spans_in_file, batch_processor_options=None
     ):
-        """generate distributed traces from the collected TaskData and HostData"""
+        """set up the tracer provider and its span processor once, and return the span exporter"""
 
-        tasks = []
-        parent_start_time = None
-        for task in tasks_data.values():
-            if parent_start_time is None:
-                parent_start_time = task.start
-            tasks.append(task)
+        if self.tracer_provider is not None:
+            return self.otel_exporter
 
-        trace.set_tracer_provider(TracerProvider(resource=Resource.create({SERVICE_NAME: otel_service_name})))
+        self.tracer_provider = TracerProvider(resource=Resource.create({SERVICE_NAME: otel_service_name}))
+        trace.set_tracer_provider(self.tracer_provider)
 
         otel_exporter = None
         if store_spans_in_file:
@@ -297,31 +391,80 @@ class OpenTelemetrySource:
                 otel_exporter = GRPCOTLPSpanExporter()
             else:
                 otel_exporter = HTTPOTLPSpanExporter()
-            processor = BatchSpanProcessor(otel_exporter)
+            processor = BatchSpanProcessor(otel_exporter, **(batch_processor_options or {}))
+
+        self.tracer_provider.add_span_processor(processor)
 
-        trace.get_tracer_provider().add_span_processor(processor)
+        # set_tracer_provider() only has an effect the first time, so do not rely on the global provider
+        self.tracer = self.tracer_provider.get_tracer(__name__)
+        self.otel_exporter = otel_exporter
 
-        tracer = trace.get_tracer(__name__)
+        return otel_exporter
+
+    def start_playbook_span(self, ansible_playbook, traceparent, start_time=None):
+        """start the parent span of the playbook, the task spans are created as its children"""
 
-        with tracer.start_as_current_span(
+        self.parent_span = self.tracer.start_span(
             ansible_playbook,
             context=self.traceparent_context(traceparent),
-            start_time=parent_start_time,
+            start_time=start_time,
             kind=SpanKind.SERVER,
-        ) as parent:
-            parent.set_status(status)
-            # Populate trace metadata attributes
-            parent.set_attribute("ansible.version", ansible_version)
-            parent.set_attribute("ansible.session", self.session)
-            parent.set_attribute("ansible.host.name", self.host)
-            if self.ip_address is not None:
-                parent.set_attribute("ansible.host.ip", self.ip_address)
-            parent.set_attribute("ansible.host.user", self.user)
-            for task in tasks:
-                for host_data in task.host_data.values():
-                    start = host_data.start or task.start
-                    with tracer.start_as_current_span(task.name, start_time=start, end_on_exit=False) as span:
-                        self.update_span_data(task, host_data, span, disable_logs, disable_attributes_in_logs)
+        )
+        # Populate trace metadata attributes
+        self.parent_span.set_attribute("ansible.version", ansible_version)
+        self.parent_span.set_attribute("ansible.session", self.session)
+        self.parent_span.set_attribute("ansible.host.name", self.host)
+        if self.ip_address is not None:
+            self.parent_span.set_attribute("ansible.host.ip", self.ip_address)
+        self.parent_span.set_attribute("ansible.host.user", self.user)
+        self.parent_context = trace.set_span_in_context(self.parent_span)
+
+    def export_host_span(self, task_data, host_data, disable_logs, disable_attributes_in_logs):
+        """create and end the span of a task on a host"""
+
+        start = host_data.start or task_data.start
+        span = self.tracer.start_span(task_data.name, context=self.parent_context, start_time=start)
+        self.update_span_data(task_data, host_data, span, disable_logs, disable_attributes_in_logs)
+
+    def end_playbook_span(self, tasks_data, status, disable_logs, disable_attributes_in_logs):
+        """export the spans of the hosts that are left, end the parent span and flush the span processor"""
+
+        for task in tasks_data.values():
+            for host_data in task.host_data.values():
+                self.export_host_span(task, host_data, disable_logs, disable_attributes_in_logs)
+            task.host_data.clear()
+
+        self.parent_span.set_status(status)
+        self.parent_span.end()
+        self.parent_span = None
+        self.parent_context = None
+        self.tracer_provider.force_flush()
+
+    def generate_distributed_traces(
+        self,
+        otel_service_name,
+        ansible_playbook,
+        tasks_data,
+        status,
+        traceparent,
+        disable_logs,
+        disable_attributes_in_logs,
+        otel_exporter_otlp_traces_protocol,
+        store_spans_in_file,
+        batch_processor_options=None,
+    ):
+        """generate distributed traces from the collected TaskData and HostData"""
+
+        parent_start_time = None
+        for task in tasks_data.values():
+            parent_start_time = task.start
+            break
+
+        otel_exporter = self.init_tracer(
+            otel_service_name, otel_exporter_otlp_traces_protocol, store_spans_in_file, batch_processor_options
+        )
+        self.start_playbook_span(ansible_playbook, traceparent, start_time=parent_start_time)
+        self.end_playbook_span(tasks_data, status, disable_logs, disable_attributes_in_logs)
 
         return otel_exporter
 
@@ -511,6 +654,11 @@ class CallbackModule(CallbackBase):
         self.traceparent = False
         self.store_spans_in_file = False
         self.otel_exporter_otlp_traces_protocol = None
+        self.streaming = False
+        self.batch_processor_options = None
+        self.sampling_filter = None
+        self.sampling_ratio = 1.0
+        self.otel_exporter = None
 
         if OTEL_LIBRARY_IMPORT_ERROR:
             raise AnsibleError(
@@ -549,6 +697,21 @@ class CallbackModule(CallbackBase):
 
         self.otel_exporter_otlp_traces_protocol = self.get_option("otel_exporter_otlp_traces_protocol")
 
+        self.streaming = self.get_option("streaming")
+
+        self.batch_processor_options = {}
+        for option, argument in (
+            ("batch_max_queue_size", "max_queue_size"),
+            ("batch_max_export_batch_size", "max_export_batch_size"),
+            ("batch_schedule_delay", "schedule_delay_millis"),
+        ):
+            if self.get_option(option) is not None:
+                self.batch_processor_options[argument] = self.get_option(option)
+
+        self.sampling_filter = self.get_option("sampling_filter")
+
+        self.sampling_ratio = self.get_option("sampling_ratio")
+
     def dump_results(self, task, result):
         """dump the results if disable_logs is not enabled"""
         if self.disable_logs:
@@ -563,14 +726,52 @@ class CallbackModule(CallbackBase):
             save.pop("content")
         return self._dump_results(save)
 
+    def finish_task(self, status, result, dump=None):
+        """record the result of a host, and export its span right away in streaming mode"""
+        task_data = self.tasks_data[result._task._uuid]
+        if dump is None:
+            dump = self.dump_results(task_data, result) if task_data.sampled else ""
+
+        host_data = self.opentelemetry.finish_task(self.tasks_data, status, result, dump)
+
+        if self.streaming and host_data is not None:
+            self.opentelemetry.export_host_span(
+                task_data, host_data, self.disable_logs, self.disable_attributes_in_logs
+            )
+            # drop the result, everything needed has been added to the span
+            task_data.host_data.pop(host_data.uuid, None)
+            task_data.dump = None
+
     def v2_playbook_on_start(self, playbook):
         self.ansible_playbook = basename(playbook._file_name)
 
+        if self.streaming:
+            self.otel_exporter = self.opentelemetry.init_tracer(
+                self.otel_service_name,
+                self.otel_exporter_otlp_traces_protocol,
+                self.store_spans_in_file,
+                self.batch_processor_options,
+            )
+            # with import_playbook, every playbook gets its own parent span
+            if self.opentelemetry.parent_span is not None:
+                self.opentelemetry.end_playbook_span(
+                    self.tasks_data, self._status(), self.disable_logs, self.disable_attributes_in_logs
+                )
+            self.opentelemetry.start_playbook_span(self.ansible_playbook, self.traceparent)
+
     def v2_playbook_on_play_start(self, play):
         self.play_name = play.get_name()
 
     def v2_runner_on_start(self, host, task):
-        self.opentelemetry.start_task(self.tasks_data, self.hide_task_arguments, self.play_name, task, host)
+        self.opentelemetry.start_task(
+            self.tasks_data,
+            self.hide_task_arguments,
+            self.play_name,
+            task,
+            host,
+            sampling_filter=self.sampling_filter,
+            sampling_ratio=self.sampling_ratio,
+        )
 
     def v2_runner_on_failed(self, result, ignore_errors=False):
         if ignore_errors:
@@ -579,45 +780,47 @@ class CallbackModule(CallbackBase):
             status = "failed"
             self.errors += 1
 
-        self.opentelemetry.finish_task(
-            self.tasks_data, status, result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self.finish_task(status, result)
 
     def v2_runner_on_ok(self, result):
-        self.opentelemetry.finish_task(
-            self.tasks_data, "ok", result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self.finish_task("ok", result)
 
     def v2_runner_on_skipped(self, result):
-        self.opentelemetry.finish_task(
-            self.tasks_data, "skipped", result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self.finish_task("skipped", result)
 
     def v2_runner_on_unreachable(self, result):
         self.errors += 1
-        self.opentelemetry.finish_task(
-            self.tasks_data, "failed", result, self.dump_results(self.tasks_data[result._task._uuid], result)
-        )
+        self.finish_task("failed", result)
 
     def v2_playbook_on_include(self, included_file):
-        self.opentelemetry.finish_task(self.tasks_data, "included", included_file, "")
+        self.finish_task("included", included_file, dump="")
 
-    def v2_playbook_on_stats(self, stats):
+    def _status(self):
         if self.errors == 0:
-            status = Status(status_code=StatusCode.OK)
+            return Status(status_code=StatusCode.OK)
+        return Status(status_code=StatusCode.ERROR)
+
+    def v2_playbook_on_stats(self, stats):
+        status = self._status()
+
+        if self.streaming:
+            otel_exporter = self.otel_exporter
+            self.opentelemetry.end_playbook_span(
+                self.tasks_data, status, self.disable_logs, self.disable_attributes_in_logs
+            )
         else:
-            status = Status(status_code=StatusCode.ERROR)
-        otel_exporter = self.opentelemetry.generate_distributed_traces(
-            self.otel_service_name,
-            self.ansible_playbook,
-            self.tasks_data,
-            status,
-            self.traceparent,
-            self.disable_logs,
-            self.disable_attributes_in_logs,
-            self.otel_exporter_otlp_traces_protocol,
-            self.store_spans_in_file,
-        )
+            otel_exporter = self.opentelemetry.generate_distributed_traces(
+                self.otel_service_name,
+                self.ansible_playbook,
+                self.tasks_data,
+                status,
+                self.traceparent,
+                self.disable_logs,
+                self.disable_attributes_in_logs,
+                self.otel_exporter_otlp_traces_protocol,
+                self.store_spans_in_file,
+                self.batch_processor_options,
+            )
 
         if self.store_spans_in_file:
             spans = [json.loads(span.to_json()) for span in otel_exporter.get_finished_spans()]
@@ -17,6 +17,8 @@ requirements:
   - Whitelisting this callback plugin
   - 'Create a HTTP Event Collector in Splunk'
   - 'Define the URL and token in C(ansible.cfg)'
+extends_documentation_fragment:
+  - community.general._event_shipping.splunk
 options:
   url:
     description: URL to the Splunk HTTP collector source.
@@ -67,6 +69,22 @@ options:
         key: batch
     type: str
     version_added: 3.3.0
+  keep_alive:
+    description:
+      - Whether to keep the connection to the collector open and reuse it for the following requests, instead of opening
+        a new connection for every request.
+      - Proxy settings from the environment are ignored if this is enabled.
+    type: bool
+    default: false
+    env:
+      - name: SPLUNK_KEEP_ALIVE
+    ini:
+      - section: callback_splunk
+        key: keep_alive
+    version_added: 13.4.0
+notes:
+  - If O(queue_size) is positive, events are sent in batches by a background thread. All queued events are sent at the
+    end of the playbook run.
 """
 
 EXAMPLES = r"""
@@ -97,6 +115,8 @@ from ansible.plugins.callback import CallbackBase
 from ansible_collections.community.general.plugins.module_utils._datetime import (
     now,
 )
+from ansible_collections.community.general.plugins.plugin_utils._event_shipping import EventShipper
+from ansible_collections.community.general.plugins.plugin_utils._http_pool import HTTPConnectionPool
 
 
 class SplunkHTTPCollectorSource:
@@ -107,6 +127,21 @@ class SplunkHTTPCollectorSource:
         self.host = socket.gethostname()
         self.ip_address = socket.gethostbyname(socket.gethostname())
         self.user = getpass.getuser()
+        self.shipper = None
+        self.http = None
+
+    def post(self, url, authtoken, validate_certs, data, headers=None):
+        headers = {"Content-type": "application/json", "Authorization": f"Splunk {authtoken}", **(headers or {})}
+        if self.http is not None:
+            self.http.request(url, data, headers=headers, validate_certs=validate_certs)
+            return
+        open_url(
+            url,
+            data,
+            headers=headers,
+            method="POST",
+            validate_certs=validate_certs,
+        )
 
     def send_event(self, url, authtoken, validate_certs, include_milliseconds, batch, state, result, runtime):
         if result._task_fields["args"].get("_ansible_check_mode") is True:
@@ -148,13 +183,10 @@ class SplunkHTTPCollectorSource:
         # This wraps the json payload in and outer json event needed by Splunk
         jsondata = json.dumps({"event": data}, cls=AnsibleJSONEncoder, sort_keys=True)
 
-        open_url(
-            url,
-            jsondata,
-            headers={"Content-type": "application/json", "Authorization": f"Splunk {authtoken}"},
-            method="POST",
-            validate_certs=validate_certs,
-        )
+        if self.shipper is None:
+            self.post(url, authtoken, validate_certs, jsondata)
+        else:
+            self.shipper.put(jsondata.encode("utf-8"))
 
 
 class CallbackModule(CallbackBase):
@@ -209,6 +241,26 @@ class CallbackModule(CallbackBase):
 
         self.batch = self.get_option("batch")
 
+        if self.get_option("keep_alive"):
+            self.splunk.http = HTTPConnectionPool()
+
+        if not self.disabled and self.get_option("queue_size") > 0:
+            # HEC accepts several events in one request, simply concatenated
+            self.splunk.shipper = EventShipper(
+                self.CALLBACK_NAME,
+                lambda key, body, headers: self.splunk.post(
+                    self.url, self.authtoken, self.validate_certs, body, headers=headers
+                ),
+                b"\n".join,
+                queue_size=self.get_option("queue_size"),
+                max_events=self.get_option("flush_events"),
+                max_bytes=self.get_option("flush_bytes"),
+                interval=self.get_option("flush_interval"),
+                compress=self.get_option("compress"),
+                retries=self.get_option("retries"),
+                spool_dir=self.get_option("spool_dir"),
+            )
+
     def v2_playbook_on_start(self, playbook):
         self.splunk.ansible_playbook = basename(playbook._file_name)
 
@@ -218,6 +270,14 @@ class CallbackModule(CallbackBase):
     def v2_playbook_on_handler_task_start(self, task):
         self.start_datetimes[task._uuid] = now()
 
+    def v2_playbook_on_stats(self, stats):
+        if self.splunk.shipper is not None:
+            self.splunk.shipper.close()
+            for error in self.splunk.shipper.pop_errors():
+                self._display.warning(error)
+        if self.splunk.http is not None:
+            self.splunk.http.close()
+
     def v2_runner_on_ok(self, result, **kwargs):
         self.splunk.send_event(
             self.url,
@@ -15,6 +15,8 @@ requirements:
   - Whitelisting this callback plugin
   - 'Create a HTTP collector source in Sumologic and specify a custom timestamp format of V(yyyy-MM-dd HH:mm:ss ZZZZ) and
     a custom timestamp locator of V("timestamp": "(.*\)")'
+extends_documentation_fragment:
+  - community.general._event_shipping.sumologic
 options:
   url:
     description: URL to the Sumologic HTTP collector source.
@@ -24,6 +26,22 @@ options:
     ini:
       - section: callback_sumologic
         key: url
+  keep_alive:
+    description:
+      - Whether to keep the connection to the collector open and reuse it for the following requests, instead of opening
+        a new connection for every request.
+      - Proxy settings from the environment are ignored if this is enabled.
+    type: bool
+    default: false
+    env:
+      - name: SUMOLOGIC_KEEP_ALIVE
+    ini:
+      - section: callback_sumologic
+        key: keep_alive
+    version_added: 13.4.0
+notes:
+  - If O(queue_size) is positive, events are sent in batches by a background thread. All queued events are sent at the
+    end of the playbook run.
 """
 
 EXAMPLES = r"""
@@ -54,6 +72,8 @@ from ansible.plugins.callback import CallbackBase
 from ansible_collections.community.general.plugins.module_utils._datetime import (
     now,
 )
+from ansible_collections.community.general.plugins.plugin_utils._event_shipping import EventShipper
+from ansible_collections.community.general.plugins.plugin_utils._http_pool import HTTPConnectionPool
 
 
 class SumologicHTTPCollectorSource:
@@ -64,6 +84,20 @@ class SumologicHTTPCollectorSource:
         self.host = socket.gethostname()
         self.ip_address = socket.gethostbyname(socket.gethostname())
         self.user = getpass.getuser()
+        self.shipper = None
+        self.http = None
+
+    def post(self, url, host, data, headers=None):
+        headers = {"Content-type": "application/json", "X-Sumo-Host": host, **(headers or {})}
+        if self.http is not None:
+            self.http.request(url, data, headers=headers)
+            return
+        open_url(
+            url,
+            data=data,
+            headers=headers,
+            method="POST",
+        )
 
     def send_event(self, url, state, result, runtime):
         if result._task_fields["args"].get("_ansible_check_mode") is True:
@@ -94,12 +128,13 @@ class SumologicHTTPCollectorSource:
         data["ansible_task"] = result._task_fields
         data["ansible_result"] = result._result
 
-        open_url(
-            url,
-            data=json.dumps(data, cls=AnsibleJSONEncoder, sort_keys=True),
-            headers={"Content-type": "application/json", "X-Sumo-Host": data["ansible_host"]},
-            method="POST",
-        )
+        jsondata = json.dumps(data, cls=AnsibleJSONEncoder, sort_keys=True)
+
+        if self.shipper is None:
+            self.post(url, data["ansible_host"], jsondata)
+        else:
+            # events are batched per host, since the host is sent in a header
+            self.shipper.put(jsondata.encode("utf-8"), key=data["ansible_host"])
 
 
 class CallbackModule(CallbackBase):
@@ -132,6 +167,24 @@ class CallbackModule(CallbackBase):
                 "in the ansible.cfg file."
             )
 
+        if self.get_option("keep_alive"):
+            self.sumologic.http = HTTPConnectionPool()
+
+        if not self.disabled and self.get_option("queue_size") > 0:
+            # the collector treats every line of a request as a separate message
+            self.sumologic.shipper = EventShipper(
+                self.CALLBACK_NAME,
+                lambda key, body, headers: self.sumologic.post(self.url, key, body, headers=headers),
+                b"\n".join,
+                queue_size=self.get_option("queue_size"),
+                max_events=self.get_option("flush_events"),
+                max_bytes=self.get_option("flush_bytes"),
+                interval=self.get_option("flush_interval"),
+                compress=self.get_option("compress"),
+                retries=self.get_option("retries"),
+                spool_dir=self.get_option("spool_dir"),
+            )
+
     def v2_playbook_on_start(self, playbook):
         self.sumologic.ansible_playbook = basename(playbook._file_name)
 
@@ -141,6 +194,14 @@ class CallbackModule(CallbackBase):
     def v2_playbook_on_handler_task_start(self, task):
         self.start_datetimes[task._uuid] = now()
 
+    def v2_playbook_on_stats(self, stats):
+        if self.sumologic.shipper is not None:
+            self.sumologic.shipper.close()
+            for error in self.sumologic.shipper.pop_errors():
+                self._display.warning(error)
+        if self.sumologic.http is not None:
+            self.sumologic.http.close()
+
     def v2_runner_on_ok(self, result, **kwargs):
         self.sumologic.send_event(self.url, "OK", result, self._runtime(result))
 
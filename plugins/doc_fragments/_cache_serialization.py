@@ -0,0 +1,53 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this doc fragment is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+
+class ModuleDocFragment:
+    # Serialization options for key-value store cache plugins
+    DOCUMENTATION = r"""
+options:
+  _serializer:
+    description:
+      - Format used to serialize the cached values.
+      - V(msgpack) requires the C(msgpack) Python library.
+      - V(pickle) must only be used when everyone with write access to the cache is trusted, since loading a manipulated
+        entry can execute arbitrary code.
+      - If not set, values are stored in the default format of the cache plugin, unless O(_compression) is set, in which
+        case V(json) is used.
+      - Entries written with any serializer or compression can be read back independently of the current settings, since
+        the format is recorded in a header byte.
+    type: string
+    choices:
+      - json
+      - msgpack
+      - pickle
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_SERIALIZER
+    ini:
+      - key: fact_caching_serializer
+        section: defaults
+    version_added: 13.4.0
+  _compression:
+    description:
+      - Compression applied to the serialized values.
+      - V(zstd) requires Python 3.14+ or the C(zstandard) Python library.
+    type: string
+    default: none
+    choices:
+      - none
+      - zlib
+      - lzma
+      - zstd
+    env:
+      - name: ANSIBLE_CACHE_PLUGIN_COMPRESSION
+    ini:
+      - key: fact_caching_compression
+        section: defaults
+    version_added: 13.4.0
+"""
@@ -0,0 +1,98 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this doc fragment is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+# Batching and shipping options of callbacks using plugin_utils._event_shipping.EventShipper.
+# Every callback reads them from its own environment variables and ini section.
+_OPTIONS = r"""
+options:
+  queue_size:
+    description:
+      - Maximum number of events waiting to be sent by a background thread.
+      - If set to a positive number, events are sent in batches by a background thread. When the queue is full,
+        the callback waits until the background thread has made room.
+      - With the default V(0), every event is sent synchronously in its own request.
+    type: int
+    default: 0
+    env:
+      - name: {env}_QUEUE_SIZE
+    ini:
+      - section: {section}
+        key: queue_size
+    version_added: 13.4.0
+  flush_events:
+    description: Maximum number of events sent in one request.
+    type: int
+    default: 100
+    env:
+      - name: {env}_FLUSH_EVENTS
+    ini:
+      - section: {section}
+        key: flush_events
+    version_added: 13.4.0
+  flush_bytes:
+    description: Maximum size in bytes of the uncompressed body of one request.
+    type: int
+    default: 1000000
+    env:
+      - name: {env}_FLUSH_BYTES
+    ini:
+      - section: {section}
+        key: flush_bytes
+    version_added: 13.4.0
+  flush_interval:
+    description: Maximum number of seconds an event waits in the queue before it is sent.
+    type: float
+    default: 5
+    env:
+      - name: {env}_FLUSH_INTERVAL
+    ini:
+      - section: {section}
+        key: flush_interval
+    version_added: 13.4.0
+  compress:
+    description: Whether to compress the requests with gzip.
+    type: bool
+    default: false
+    env:
+      - name: {env}_COMPRESS
+    ini:
+      - section: {section}
+        key: compress
+    version_added: 13.4.0
+  retries:
+    description: Number of times a failed request is retried, with exponential backoff.
+    type: int
+    default: 3
+    env:
+      - name: {env}_RETRIES
+    ini:
+      - section: {section}
+        key: retries
+    version_added: 13.4.0
+  spool_dir:
+    description:
+      - Directory in which events that could not be sent after O(retries) retries are saved.
+      - Saved events are sent first the next time the callback runs.
+      - If not set, such events are dropped.
+    type: path
+    env:
+      - name: {env}_SPOOL_DIR
+    ini:
+      - section: {section}
+        key: spool_dir
+    version_added: 13.4.0
+"""
+
+
+class ModuleDocFragment:
+    SPLUNK = _OPTIONS.format(env="SPLUNK", section="callback_splunk")
+
+    SUMOLOGIC = _OPTIONS.format(env="SUMOLOGIC", section="callback_sumologic")
+
+    LOGANALYTICS = _OPTIONS.format(env="ANSIBLE_LOGANALYTICS", section="callback_loganalytics")
@@ -64,6 +64,17 @@ options:
     env:
       - name: OP_SERVICE_ACCOUNT_TOKEN
         version_added: 8.2.0
+  cache:
+    description:
+      - Keep the items fetched from 1Password, and the sign in, in memory for the lookups that also set this option.
+      - Lookups run in the worker processes, so the cache is mostly shared between the terms of one lookup and between lookups
+        of the same task.
+      - Looking up several fields of the same item then runs C(op) only once for that item.
+      - If several terms are given, the items that are not cached yet are fetched concurrently.
+      - Changes made to an item in 1Password while Ansible runs are not seen by lookups that find the item in the cache.
+    type: bool
+    default: false
+    version_added: 13.4.0
 notes:
   - This lookup uses an existing 1Password session if one exists. If not, and you have already performed an initial sign in
     (meaning C(~/.op/config), C(~/.config/op/config) or C(~/.config/.op/config) exists), then only the O(master_password)
@@ -47,6 +47,21 @@ options:
       - When using this parameter, you change the default value used by O(dialect).
       - The default value depends on the dialect used.
     type: bool
+  columns:
+    description:
+      - Only keep these columns, in this order.
+      - By default, all columns are kept.
+    type: list
+    elements: str
+    version_added: 13.4.0
+  column_types:
+    description:
+      - A dictionary mapping column names to the type their values are converted to.
+      - Possible types are V(str), V(int), V(float), and V(bool).
+      - Empty values of columns that are not V(str) are converted to V(null).
+      - Columns not mentioned here stay strings.
+    type: dict
+    version_added: 13.4.0
 """
 
 EXAMPLES = r"""
@@ -68,6 +83,25 @@ EXAMPLES = r"""
   #     "Column 1": "bar",
   #     "Value": "42",
   #   }
+
+- name: Only keep some columns of a CSV file and convert them
+  ansible.builtin.debug:
+    msg: >-
+      {{ csv_data | community.general.from_csv(columns=['name', 'uid'], column_types={'uid': 'int'}) }}
+  vars:
+    csv_data: |
+      name,uid,gid,gecos
+      dag,500,500,Dag Wieërs
+      jeroen,501,500,Jeroen Hoekx
+  # Produces the following list of dictionaries:
+  #   {
+  #     "name": "dag",
+  #     "uid": 500,
+  #   },
+  #   {
+  #     "name": "jeroen",
+  #     "uid": 501,
+  #   }
 """
 
 RETURN = r"""
@@ -80,15 +114,25 @@ _value:
 from ansible.errors import AnsibleFilterError
 
 from ansible_collections.community.general.plugins.module_utils._csv import (
+    ColumnError,
     CSVError,
+    CSVRowReader,
     CustomDialectFailureError,
     DialectNotAvailableError,
     initialize_dialect,
-    read_csv,
 )
 
 
-def from_csv(data, dialect="excel", fieldnames=None, delimiter=None, skipinitialspace=None, strict=None):
+def from_csv(
+    data,
+    dialect="excel",
+    fieldnames=None,
+    delimiter=None,
+    skipinitialspace=None,
+    strict=None,
+    columns=None,
+    column_types=None,
+):
     dialect_params = {
         "delimiter": delimiter,
         "skipinitialspace": skipinitialspace,
@@ -100,18 +144,14 @@ def from_csv(data, dialect="excel", fieldnames=None, delimiter=None, skipinitial
     except (CustomDialectFailureError, DialectNotAvailableError) as e:
         raise AnsibleFilterError(str(e)) from e
 
-    reader = read_csv(data, dialect, fieldnames)
-
-    data_list = []
-
     try:
-        for row in reader:
-            data_list.append(row)
+        reader = CSVRowReader(data, dialect, fieldnames, columns=columns, column_types=column_types)
+        return [reader.to_dict(row) for row in reader]
+    except ColumnError as e:
+        raise AnsibleFilterError(str(e)) from e
     except CSVError as e:
         raise AnsibleFilterError(f"Unable to process file: {e}") from e
 
-    return data_list
-
 
 class FilterModule:
     def filters(self):
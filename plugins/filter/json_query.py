@@ -105,6 +105,8 @@ _value:
   type: any
 """
 
+from functools import lru_cache
+
 from ansible.errors import AnsibleError, AnsibleFilterError
 
 try:
@@ -115,6 +117,46 @@ except ImportError:
     HAS_LIB = False
 
 
+# Names of the Ansible types that have to be accepted like the Python types jmespath knows about.
+# See issues https://github.com/ansible-collections/community.general/issues/320
+# and https://github.com/ansible/ansible/issues/85600.
+ANSIBLE_TYPE_NAMES = {
+    "string": ("AnsibleUnicode", "AnsibleUnsafeText", "_AnsibleTaggedStr"),
+    "array": ("AnsibleSequence", "_AnsibleLazyTemplateList"),
+    "object": ("AnsibleMapping", "_AnsibleLazyTemplateDict"),
+}
+
+if HAS_LIB:
+
+    class AnsibleFunctions(jmespath.functions.Functions):
+        """The built-in jmespath functions, accepting the Ansible types as well."""
+
+        _allowed_pytypes_cache: dict[tuple[str, ...], tuple[list[str], list[tuple[str, ...]]]] = {}
+
+        def _get_allowed_pytypes(self, types):
+            key = tuple(types)
+            allowed = self._allowed_pytypes_cache.get(key)
+            if allowed is None:
+                allowed_types, allowed_subtypes = super()._get_allowed_pytypes(types)
+                for type_name in types:
+                    allowed_types.extend(ANSIBLE_TYPE_NAMES.get(type_name.split("-", 1)[0], ()))
+                # allowed_subtypes has one entry per type with a subtype, like "array-string"
+                subtype_names = [type_name.split("-", 1)[1] for type_name in types if "-" in type_name]
+                allowed_subtypes = [
+                    tuple(subtypes) + ANSIBLE_TYPE_NAMES.get(subtype_name, ())
+                    for subtype_name, subtypes in zip(subtype_names, allowed_subtypes)
+                ]
+                allowed = self._allowed_pytypes_cache[key] = (allowed_types, allowed_subtypes)
+            return allowed
+
+    JMESPATH_OPTIONS = jmespath.Options(custom_functions=AnsibleFunctions())
+
+
+@lru_cache(maxsize=256)
+def _compile(expr):
+    return jmespath.compile(expr)
+
+
 def json_query(data, expr):
     """Query data using jmespath query language ( http://jmespath.org ). Example:
     - ansible.builtin.debug: msg="{{ instance | json_query(tagged_instances[*].block_device_mapping.*.volume_id') }}"
@@ -122,24 +164,8 @@ def json_query(data, expr):
     if not HAS_LIB:
         raise AnsibleError('You need to install "jmespath" prior to running json_query filter')
 
-    # Hack to handle Ansible Unsafe text, AnsibleMapping and AnsibleSequence
-    # See issues https://github.com/ansible-collections/community.general/issues/320
-    # and https://github.com/ansible/ansible/issues/85600.
-    jmespath.functions.REVERSE_TYPES_MAP["string"] = jmespath.functions.REVERSE_TYPES_MAP["string"] + (
-        "AnsibleUnicode",
-        "AnsibleUnsafeText",
-        "_AnsibleTaggedStr",
-    )
-    jmespath.functions.REVERSE_TYPES_MAP["array"] = jmespath.functions.REVERSE_TYPES_MAP["array"] + (
-        "AnsibleSequence",
-        "_AnsibleLazyTemplateList",
-    )
-    jmespath.functions.REVERSE_TYPES_MAP["object"] = jmespath.functions.REVERSE_TYPES_MAP["object"] + (
-        "AnsibleMapping",
-        "_AnsibleLazyTemplateDict",
-    )
     try:
-        return jmespath.search(expr, data)
+        return _compile(expr).search(data, options=JMESPATH_OPTIONS)
     except jmespath.exceptions.JMESPathError as e:
         raise AnsibleFilterError(f"JMESPathError in json_query filter plugin:\n{e}") from e
     except Exception as e:
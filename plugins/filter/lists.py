@@ -7,24 +7,66 @@ from __future__ import annotations
 from ansible.errors import AnsibleFilterError
 from ansible.module_utils.common.collections import is_sequence
 
+# Markers that keep the frozen forms of lists, tuples and dicts apart,
+# since for example [1] != (1,) in Python
+_LIST = object()
+_TUPLE = object()
+_DICT = object()
+
+
+def freeze(item):
+    """Return a hashable value that is equal to ``freeze(other)`` exactly when ``item == other``.
+
+    Hashable values are returned as they are. Raises ``TypeError`` for unhashable values
+    other than lists, tuples, dicts and sets.
+    """
+    if isinstance(item, dict):
+        return (_DICT, frozenset((key, freeze(value)) for key, value in item.items()))
+    if isinstance(item, list):
+        return (_LIST, tuple(freeze(value) for value in item))
+    if isinstance(item, set):
+        # set elements are always hashable, and {1} == frozenset({1})
+        return frozenset(item)
+    try:
+        hash(item)
+    except TypeError:
+        if isinstance(item, tuple):
+            return (_TUPLE, tuple(freeze(value) for value in item))
+        raise
+    return item
+
+
+def freeze_all(lst):
+    """Return the frozen forms of all items of lst, or None if one of them cannot be frozen."""
+    try:
+        return [freeze(item) for item in lst]
+    except TypeError:
+        return None
+
 
 def remove_duplicates(lst):
+    lst = list(lst)
+    keys = freeze_all(lst)
+    if keys is None:
+        return _remove_duplicates_unhashable(lst)
+
     seen = set()
     seen_add = seen.add
     result = []
+    for key, item in zip(keys, lst):
+        if key not in seen:
+            seen_add(key)
+            result.append(item)
+    return result
+
+
+def _remove_duplicates_unhashable(lst):
+    seen = []
+    result = []
     for item in lst:
-        try:
-            if item not in seen:
-                seen_add(item)
-                result.append(item)
-        except TypeError:
-            # This happens for unhashable values `item`. If this happens,
-            # convert `seen` to a list and continue.
-            seen = list(seen)
-            seen_add = seen.append
-            if item not in seen:
-                seen_add(item)
-                result.append(item)
+        if item not in seen:
+            seen.append(item)
+            result.append(item)
     return result
 
 
@@ -93,16 +135,17 @@ def lists_intersect(*args, **kwargs):
 
 
 def do_intersect(a, b):
-    isect = []
-    try:
-        other = set(b)
-        isect = [item for item in a if item in other]
-    except TypeError:
-        # This happens for unhashable values,
-        # use a list instead and redo.
+    a = list(a)
+    keys = freeze_all(a)
+    other = freeze_all(b)
+    if keys is None or other is None:
+        # This happens for values that cannot be frozen,
+        # use a list instead.
         other = list(b)
-        isect = [item for item in a if item in other]
-    return isect
+        return [item for item in a if item in other]
+
+    other = set(other)
+    return [item for key, item in zip(keys, a) if key in other]
 
 
 def lists_difference(*args, **kwargs):
@@ -129,16 +172,17 @@ def lists_difference(*args, **kwargs):
 
 
 def do_difference(a, b):
-    diff = []
-    try:
-        other = set(b)
-        diff = [item for item in a if item not in other]
-    except TypeError:
-        # This happens for unhashable values,
-        # use a list instead and redo.
+    a = list(a)
+    keys = freeze_all(a)
+    other = freeze_all(b)
+    if keys is None or other is None:
+        # This happens for values that cannot be frozen,
+        # use a list instead.
         other = list(b)
-        diff = [item for item in a if item not in other]
-    return diff
+        return [item for item in a if item not in other]
+
+    other = set(other)
+    return [item for key, item in zip(keys, a) if key not in other]
 
 
 def lists_symmetric_difference(*args, **kwargs):
@@ -165,18 +209,19 @@ def lists_symmetric_difference(*args, **kwargs):
 
 
 def do_symmetric_difference(a, b):
-    sym_diff = []
     union = lists_union(a, b)
-    try:
-        isect = set(a) & set(b)
-        sym_diff = [item for item in union if item not in isect]
-    except TypeError:
-        # This happens for unhashable values,
+    keys = freeze_all(union)
+    a_keys = freeze_all(a)
+    b_keys = freeze_all(b)
+    if keys is None or a_keys is None or b_keys is None:
+        # This happens for values that cannot be frozen,
         # build the intersection of `a` and `b` backed
         # by a list instead of a set and redo.
         isect = lists_intersect(a, b)
-        sym_diff = [item for item in union if item not in isect]
-    return sym_diff
+        return [item for item in union if item not in isect]
+
+    isect = set(a_keys) & set(b_keys)
+    return [item for key, item in zip(keys, union) if key not in isect]
 
 
 class FilterModule:
@@ -194,30 +194,128 @@ _value:
   elements: dictionary
 """
 
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+from itertools import chain
 from operator import itemgetter
 
 from ansible.errors import AnsibleFilterError
 from ansible.utils.vars import merge_hash
 
+LIST_MERGE_CHOICES = ("replace", "keep", "append", "prepend", "append_rp", "prepend_rp")
 
-def list_mergeby(x, y, index, recursive=False, list_merge="replace"):
-    """Merge 2 lists by attribute 'index'. The function 'merge_hash'
-    from ansible.utils.vars is used.  This function is used by the
-    function lists_mergeby.
-    """
 
-    d = defaultdict(dict)
-    for lst in (x, y):
+# Whether a type is a MutableMapping ("dict"), a MutableSequence ("list") or neither (None).
+# Checking against the abstract base classes is slow, so the result is kept per type.
+_KINDS: dict[type, str | None] = {}
+
+
+def _kind(value):
+    cls = type(value)
+    kind = _KINDS.get(cls, False)
+    if kind is False:
+        if issubclass(cls, MutableMapping):
+            kind = "dict"
+        elif issubclass(cls, MutableSequence):
+            kind = "list"
+        else:
+            kind = None
+        _KINDS[cls] = kind
+    return kind
+
+
+def _check_element(elem):
+    if type(elem) is not dict and not isinstance(elem, Mapping):
+        raise AnsibleFilterError(
+            f"Elements of list arguments for lists_mergeby must be dictionaries. {elem} is {type(elem)}"
+        )
+
+
+def _merge_into(x, y, recursive, list_merge):
+    """Merge y into x in place. This is x.update(merge_hash(x, y, recursive, list_merge))
+    without copying x. Nested dictionaries are merged with merge_hash, so only x itself
+    is modified.
+    """
+    if x == y:
+        # merge_hash() returns y in this case, even if lists would be appended otherwise
+        x.update(y)
+        return
+
+    for key, y_value in y.items():
+        if key not in x:
+            x[key] = y_value
+            continue
+
+        x_value = x[key]
+        kind = _kind(x_value)
+        if kind is None or kind != _kind(y_value):
+            x[key] = y_value
+        elif kind == "dict":
+            x[key] = merge_hash(x_value, y_value, recursive, list_merge) if recursive else y_value
+        else:
+            if list_merge == "replace":
+                x[key] = y_value
+            elif list_merge == "append":
+                x[key] = x_value + y_value
+            elif list_merge == "prepend":
+                x[key] = y_value + x_value
+            elif list_merge == "append_rp":
+                x[key] = [z for z in x_value if z not in y_value] + y_value
+            elif list_merge == "prepend_rp":
+                x[key] = y_value + [z for z in x_value if z not in y_value]
+            # else keep
+
+
+def merge_lists_by(lists, index, recursive=False, list_merge="replace"):
+    """Merge the lists by attribute 'index' in one pass. Later lists take
+    precedence, the result is sorted by 'index'. Elements without 'index'
+    are dropped.
+    """
+    if list_merge not in LIST_MERGE_CHOICES:
+        raise AnsibleFilterError(f"'list_merge' must be one of {', '.join(LIST_MERGE_CHOICES)}, not {list_merge!r}.")
+
+    merged = {}
+
+    if not recursive and list_merge == "replace":
+        # merge_hash() is plain dict.update() here, which is associative,
+        # so the lists can be merged from low to high priority in place
+        for lst in lists:
+            for elem in lst:
+                _check_element(elem)
+                if index in elem:
+                    key = elem[index]
+                    if key in merged:
+                        merged[key].update(elem)
+                    else:
+                        merged[key] = dict(elem)
+        return sorted(merged.values(), key=itemgetter(index))
+
+    # Otherwise merge_hash() is not associative (for example with list_merge=keep,
+    # or when a value changes its type). Keep the order of the pairwise merges
+    # from high to low priority: the elements of the last two lists are merged
+    # one after the other, then every other list is merged into that result.
+    lists = list(lists)
+    for lst in [chain(*lists[-2:])] + lists[-3::-1]:
+        folded = {}
         for elem in lst:
-            if not isinstance(elem, Mapping):
-                raise AnsibleFilterError(
-                    f"Elements of list arguments for lists_mergeby must be dictionaries. {elem} is {type(elem)}"
-                )
-            if index in elem.keys():
-                d[elem[index]].update(merge_hash(d[elem[index]], elem, recursive, list_merge))
-    return sorted(d.values(), key=itemgetter(index))
+            _check_element(elem)
+            if index in elem:
+                key = elem[index]
+                if key in folded:
+                    _merge_into(folded[key], elem, recursive, list_merge)
+                else:
+                    folded[key] = dict(elem)
+        for key, value in folded.items():
+            if key in merged:
+                _merge_into(value, merged[key], recursive, list_merge)
+            merged[key] = value
+    return sorted(merged.values(), key=itemgetter(index))
+
+
+def list_mergeby(x, y, index, recursive=False, list_merge="replace"):
+    """Merge 2 lists by attribute 'index'. Elements of y take precedence.
+    This is the same as merge_lists_by([x, y], ...).
+    """
+    return merge_lists_by([x, y], index, recursive, list_merge)
 
 
 def lists_mergeby(*terms, **kwargs):
@@ -261,12 +359,7 @@ def lists_mergeby(*terms, **kwargs):
             f"First argument after the lists for community.general.lists_mergeby must be string. {index} is {type(index)}"
         )
 
-    high_to_low_prio_list_iterator = reversed(lists)
-    result = next(high_to_low_prio_list_iterator)
-    for list in high_to_low_prio_list_iterator:
-        result = list_mergeby(list, result, index, recursive, list_merge)
-
-    return result
+    return merge_lists_by(lists, index, recursive, list_merge)
 
 
 class FilterModule:
@@ -17,6 +17,19 @@ options:
     type: list
     elements: string
     required: true
+  unique:
+    description:
+      - Whether to remove duplicate strings from the result, keeping the first one.
+    type: bool
+    default: false
+    version_added: 13.4.0
+  latest_n:
+    description:
+      - Only return the O(latest_n) latest versions.
+      - The result is the same as sorting the whole list and keeping the last O(latest_n) elements, but faster for
+        long lists.
+    type: int
+    version_added: 13.4.0
 """
 
 EXAMPLES = r"""
@@ -24,6 +37,11 @@ EXAMPLES = r"""
   ansible.builtin.set_fact:
     sorted_list: "{{ ['2.1', '2.10', '2.9'] | community.general.version_sort }}"
     # Result is ['2.1', '2.9', '2.10']
+
+- name: Get the three latest image tags
+  ansible.builtin.set_fact:
+    latest_tags: "{{ ['1.2', '1.10', '1.10', '1.9', '1.11'] | community.general.version_sort(unique=true, latest_n=3) }}"
+    # Result is ['1.9', '1.10', '1.11']
 """
 
 RETURN = r"""
@@ -33,12 +51,46 @@ _value:
   elements: string
 """
 
-from ansible_collections.community.general.plugins.module_utils._version import LooseVersion
+import heapq
+import re
+from functools import lru_cache
+
+from ansible.errors import AnsibleFilterError
+
+# Same components as LooseVersion: numbers, lowercase words, and whatever is between them, except dots
+_COMPONENT_RE = re.compile(r"(\d+|[a-z]+|\.)")
+
 
+@lru_cache(maxsize=65536)
+def _version_key(vstring):
+    """
+    Sort key that orders strings like LooseVersion does.
 
-def version_sort(value, reverse=False):
+    Numbers are tagged with 0 and other components with 1, so that a number and a string
+    at the same position can be compared; LooseVersion raises a TypeError in that case.
+    """
+    return tuple(
+        (0, int(component)) if component.isdecimal() else (1, component)
+        for component in _COMPONENT_RE.split(vstring)
+        if component and component != "."
+    )
+
+
+def version_sort(value, reverse=False, unique=False, latest_n=None):
     """Sort a list according to loose versions so that e.g. 2.9 is smaller than 2.10"""
-    return sorted(value, key=LooseVersion, reverse=reverse)
+    if unique:
+        value = list(dict.fromkeys(value))
+
+    if latest_n is None:
+        return sorted(value, key=_version_key, reverse=reverse)
+
+    if not isinstance(latest_n, int) or isinstance(latest_n, bool) or latest_n < 0:
+        raise AnsibleFilterError(f"latest_n must be a non-negative integer, got {latest_n!r}")
+    if reverse:
+        return heapq.nlargest(latest_n, value, key=_version_key)
+    # Break ties by position, so the result is the same as the tail of the stable sort
+    latest = heapq.nlargest(latest_n, enumerate(value), key=lambda item: (_version_key(item[1]), item[0]))
+    return [elt for dummy, elt in reversed(latest)]
 
 
 class FilterModule:
@@ -54,6 +54,7 @@ options:
     default: ["local"]
 extends_documentation_fragment:
   - ansible.builtin.constructed
+  - ansible.builtin.inventory_cache
 """
 
 EXAMPLES = r"""
@@ -82,18 +83,26 @@ plugin: community.general.incus
 remotes:
   - remote-1
   - remote-2:default
+
+---
+# Cache the instance list for ten minutes
+plugin: community.general.incus
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible/incus
+cache_timeout: 600
 """
 
 from json import loads
 from subprocess import check_output
 
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible.utils.display import Display
 
 display = Display()
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Host inventory parser for Incus."""
 
     NAME = "community.general.incus"
@@ -113,18 +122,44 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         return valid
 
     def parse(self, inventory, loader, path, cache=True):
-        super().parse(inventory, loader, path)
+        super().parse(inventory, loader, path, cache=cache)
 
         self._read_config_data(path)
 
-        self.populate()
+        cache_key = self.get_cache_key(path)
 
-    def populate(self):
-        # Create top-level "incus" group if missing.
-        default_groups = self.get_option("default_groups")
-        if default_groups:
-            self.inventory.add_group("incus")
+        # cache may be True or False at this point to indicate if the inventory is being refreshed
+        # get the user's cache option too to see if we should save the cache if it is changing
+        user_cache_setting = self.get_option("cache")
+
+        # read if the user has caching enabled and the cache isn't being refreshed
+        attempt_to_read_cache = user_cache_setting and cache
+        # update if the user has caching enabled and the cache is being refreshed; update this value to True if the cache has expired below
+        cache_needs_update = user_cache_setting and not cache
+
+        remotes = None
+        if attempt_to_read_cache:
+            try:
+                remotes = self._cache[cache_key]
+            except KeyError:
+                # This occurs if the cache_key is not in the cache or if the cache_key expired, so the cache needs to be updated
+                cache_needs_update = True
+
+        if remotes is None:
+            remotes = self.get_remotes()
+
+        if cache_needs_update:
+            self._cache[cache_key] = remotes
+
+        self.populate(remotes)
 
+    def get_remotes(self):
+        """Return the instances of every project of the configured remotes.
+
+        The result is a list with one entry per configured remote, each a dict with the remote name
+        and a dict mapping the project names to the output of C(incus list) for that project.
+        """
+        remotes = []
         for remote in self.get_option("remotes"):
             # Split the remote name from the project name (if specified).
             remote_name = ""
@@ -137,12 +172,6 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             else:
                 remote_name = fields[0]
 
-            # Create the remote-specific group if missing.
-            group_remote = f"incus_{remote_name}"
-            if default_groups:
-                self.inventory.add_group(group_remote)
-                self.inventory.add_child("incus", group_remote)
-
             # Get a list of projects.
             projects = []
             if project_name:
@@ -150,22 +179,47 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             else:
                 projects = [entry["name"] for entry in self._run_incus("project", "list", f"{remote_name}:")]
 
-            # Get a list of instances.
+            # List the instances.
+            instances = {}
             for project in projects:
-                # Create the project-specific group if missing.
-                group_project = f"{group_remote}_{project}"
-                if default_groups:
-                    self.inventory.add_group(group_project)
-                    self.inventory.add_child(group_remote, group_project)
-
-                # List the instances.
                 list_cmd = [
                     "list",
                     f"{remote_name}:",
                     "--project",
                     project,
                 ] + self.get_option("filters")
-                for instance in self._run_incus(*list_cmd):
+                instances[project] = self._run_incus(*list_cmd)
+
+            remotes.append({"name": remote_name, "projects": instances})
+
+        return remotes
+
+    def populate(self, remotes=None):
+        if remotes is None:
+            remotes = self.get_remotes()
+
+        # Create top-level "incus" group if missing.
+        default_groups = self.get_option("default_groups")
+        if default_groups:
+            self.inventory.add_group("incus")
+
+        for remote in remotes:
+            remote_name = remote["name"]
+
+            # Create the remote-specific group if missing.
+            group_remote = f"incus_{remote_name}"
+            if default_groups:
+                self.inventory.add_group(group_remote)
+                self.inventory.add_child("incus", group_remote)
+
+            for project, instances in remote["projects"].items():
+                # Create the project-specific group if missing.
+                group_project = f"{group_remote}_{project}"
+                if default_groups:
+                    self.inventory.add_group(group_project)
+                    self.inventory.add_child(group_remote, group_project)
+
+                for instance in instances:
                     # Compute the host name.
                     host_name = instance["name"]
                     if self.get_option("host_fqdn"):
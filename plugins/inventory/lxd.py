@@ -15,6 +15,8 @@ author: "Frank Dornheim (@conloos)"
 requirements:
   - ipaddress
   - lxd >= 4.0
+extends_documentation_fragment:
+  - ansible.builtin.inventory_cache
 options:
   plugin:
     description: Token that ensures this is a source file for the 'lxd' plugin.
@@ -103,6 +105,17 @@ options:
         C(type), C(vlanid).
       - See example for syntax.
     type: dict
+  cache_revalidate:
+    description:
+      - When the inventory is read from the cache, list the instances with one request and fetch only the instances that
+        have been created or changed since the cache was written. Removed instances are dropped.
+      - An instance counts as changed if its configuration, status, or last use time differ from the cached data. The network
+        addresses of all other instances are taken from the cache.
+      - The cache is written again if any instance has changed.
+      - Has no effect if O(cache) is not enabled.
+    type: bool
+    default: false
+    version_added: 13.4.0
 """
 
 EXAMPLES = r"""
@@ -164,18 +177,30 @@ groupby:
   projectInternals:
     type: project
     attribute: internals
+
+---
+# lxd.yml with an inventory cache that is revalidated on every run
+plugin: community.general.lxd
+url: unix:/var/snap/lxd/common/lxd/unix.socket
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible/lxd
+cache_timeout: 3600
+cache_revalidate: true
 """
 
 import json
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
 
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.module_utils.common.dict_transformations import dict_merge
 from ansible.module_utils.common.text.converters import to_native, to_text
-from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable
 
 from ansible_collections.community.general.plugins.module_utils._lxd import LXDClient, LXDClientException
 from ansible_collections.community.general.plugins.plugin_utils._unsafe import make_unsafe
@@ -189,11 +214,13 @@ else:
     IPADDRESS_IMPORT_ERROR = None
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Cacheable):
     DEBUG = 4
     NAME = "community.general.lxd"
     SNAP_SOCKET_URL = "unix:/var/snap/lxd/common/lxd/unix.socket"
     SOCKET_URL = "unix:/var/lib/lxd/unix.socket"
+    # number of connections used to fetch instances when the server does not support recursion=2
+    FETCH_WORKERS = 8
 
     @staticmethod
     def load_json_data(path):
@@ -369,7 +396,36 @@ class InventoryModule(BaseInventoryPlugin):
 
         return [m.split("/")[3] for m in instances["metadata"]]
 
-    def _get_config(self, branch, name):
+    def _get_instances_recursive(self):
+        """Get config and state of all instances
+
+        Get the configuration and the state of all instances with one request using recursion=2
+
+        Args:
+            None
+        Kwargs:
+            None
+        Source:
+            https://documentation.ubuntu.com/lxd/en/latest/rest-api/#recursion
+        Raises:
+            None
+        Returns:
+            list(instances): instance objects including their state, or None if the server does not provide them"""
+        params = {"recursion": 2}
+        if self.project:
+            params["project"] = self.project
+        try:
+            instances = self.socket.do("GET", f"/1.0/instances?{urlencode(params)}")
+        except LXDClientException:
+            return None
+        metadata = instances.get("metadata")
+        if not isinstance(metadata, list) or not all(
+            isinstance(instance, dict) and isinstance(instance.get("state"), dict) for instance in metadata
+        ):
+            return None
+        return metadata
+
+    def _get_config(self, branch, name, socket=None):
         """Get inventory of instance
 
         Get config of instance
@@ -378,33 +434,64 @@ class InventoryModule(BaseInventoryPlugin):
             str(branch): Name oft the API-Branch
             str(name): Name of instance
         Kwargs:
-            None
+            LXDClient(socket): connection to use instead of self.socket
         Source:
             https://documentation.ubuntu.com/lxd/en/latest/rest-api/
         Raises:
             None
         Returns:
             dict(config): Config of the instance"""
+        if socket is None:
+            socket = self.socket
         config = {}
         if isinstance(branch, (tuple, list)):
             config[name] = {
-                branch[1]: self.socket.do(
+                branch[1]: socket.do(
                     "GET",
                     f"/1.0/{to_native(branch[0])}/{to_native(name)}/{to_native(branch[1])}?{urlencode(dict(project=self.project))}",
                 )
             }
         else:
             config[name] = {
-                branch: self.socket.do(
+                branch: socket.do(
                     "GET", f"/1.0/{to_native(branch)}/{to_native(name)}?{urlencode(dict(project=self.project))}"
                 )
             }
         return config
 
+    def get_all_instance_data(self):
+        """Create Inventory of all instances
+
+        Collect the information of all instances with one request. Falls back to get_instance_data()
+        for servers that do not support recursion=2.
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            None
+        Returns:
+            None"""
+        instances = self._get_instances_recursive()
+        if instances is None:
+            self.get_instance_data(self._get_instances())
+            return
+
+        instance_data = self.data.setdefault("instances", {})
+        for instance in instances:
+            state = instance.pop("state")
+            # the same layout as the responses of /1.0/instances/<name> and /1.0/instances/<name>/state
+            instance_data[instance["name"]] = {
+                "instances": {"type": "sync", "status": "Success", "status_code": 200, "metadata": instance},
+                "state": {"type": "sync", "status": "Success", "status_code": 200, "metadata": state},
+            }
+
     def get_instance_data(self, names):
         """Create Inventory of the instance
 
         Iterate through the different branches of the instances and collect Information.
+        The instances are fetched concurrently over up to FETCH_WORKERS connections.
 
         Args:
             list(names): List of instance names
@@ -417,11 +504,79 @@ class InventoryModule(BaseInventoryPlugin):
         # tuple(('instances','metadata/templates')) to get section in branch
         # e.g. /1.0/instances/<name>/metadata/templates
         branches = ["instances", ("instances", "state")]
-        instance_config = {}
-        for branch in branches:
-            for name in names:
-                instance_config["instances"] = self._get_config(branch, name)
-                self.data = dict_merge(instance_config, self.data)
+        local = threading.local()
+
+        def fetch(name):
+            # http.client connections must not be shared between threads
+            if not hasattr(local, "socket"):
+                local.socket = self._connect_to_socket()
+            config = {}
+            for branch in branches:
+                config.update(self._get_config(branch, name, socket=local.socket)[name])
+            return name, config
+
+        instance_data = self.data.setdefault("instances", {})
+        with ThreadPoolExecutor(max_workers=max(1, min(self.FETCH_WORKERS, len(names)))) as executor:
+            for name, config in executor.map(fetch, names):
+                instance_data[name] = config
+
+    def get_data(self):
+        """Create Inventory of all instances and networks
+
+        Connect to the server and collect the information of all instances and networks.
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            AnsibleError
+        Returns:
+            None"""
+        self.socket = self._connect_to_socket()
+        self.get_all_instance_data()
+        self.get_network_data(self._get_networks())
+
+    def revalidate_instance_data(self):
+        """Update cached instance data
+
+        List the instances with one request and fetch the configuration and the state of the instances
+        that are new or have changed compared to the cached data. Instances that no longer exist are removed.
+
+        Args:
+            None
+        Kwargs:
+            None
+        Raises:
+            None
+        Returns:
+            bool(changed): True if any instance or network has been added, changed, or removed"""
+        params = {"recursion": 1}
+        if self.project:
+            params["project"] = self.project
+        instances = self.socket.do("GET", f"/1.0/instances?{urlencode(params)}")["metadata"]
+
+        cached = self.data["instances"]
+        names = [instance["name"] for instance in instances]
+        changed = []
+        for instance in instances:
+            metadata = cached.get(instance["name"], {}).get("instances", {}).get("metadata", {})
+            # the cached data might contain more fields, for example those only returned with recursion=2
+            if any(metadata.get(key) != value for key, value in instance.items()):
+                changed.append(instance["name"])
+
+        modified = bool(changed) or len(names) != len(cached)
+        self.data["instances"] = {name: cached[name] for name in names if name not in changed}
+        if changed:
+            self.get_instance_data(changed)
+            self.data["instances"] = {name: self.data["instances"][name] for name in names}
+
+        networks = self._get_networks()
+        new_networks = [name for name in networks if name not in self.data["networks"]]
+        modified = modified or bool(new_networks) or len(networks) != len(self.data["networks"])
+        self.data["networks"] = {name: self.data["networks"][name] for name in networks if name not in new_networks}
+        self.get_network_data(new_networks)
+        return modified
 
     def get_network_data(self, names):
         """Create Inventory of the instance
@@ -439,14 +594,18 @@ class InventoryModule(BaseInventoryPlugin):
         # tuple(('instances','metadata/templates')) to get section in branch
         # e.g. /1.0/instances/<name>/metadata/templates
         branches = [("networks", "state")]
-        network_config = {}
+        network_data = self.data.setdefault("networks", {})
         for branch in branches:
             for name in names:
                 try:
-                    network_config["networks"] = self._get_config(branch, name)
+                    config = self._get_config(branch, name)[name]
                 except LXDClientException:
-                    network_config["networks"] = {name: None}
-                self.data = dict_merge(network_config, self.data)
+                    network_data[name] = None
+                    continue
+                if isinstance(network_data.get(name), dict):
+                    network_data[name].update(config)
+                else:
+                    network_data[name] = config
 
     def extract_network_information_from_instance_config(self, instance_name):
         """Returns the network interface configuration
@@ -1143,10 +1302,8 @@ class InventoryModule(BaseInventoryPlugin):
         Returns:
             None"""
 
-        if len(self.data) == 0:  # If no data is injected by unittests open socket
-            self.socket = self._connect_to_socket()
-            self.get_instance_data(self._get_instances())
-            self.get_network_data(self._get_networks())
+        if len(self.data) == 0:  # If no data is injected by unittests or read from the cache open socket
+            self.get_data()
 
         # The first version of the inventory only supported containers.
         # This will change in the future.
@@ -1181,7 +1338,7 @@ class InventoryModule(BaseInventoryPlugin):
         if IPADDRESS_IMPORT_ERROR:
             raise AnsibleError("another_library must be installed to use this plugin") from IPADDRESS_IMPORT_ERROR
 
-        super().parse(inventory, loader, path, cache=False)
+        super().parse(inventory, loader, path, cache=cache)
         # Read the inventory YAML file
         self._read_config_data(path)
         try:
@@ -1205,5 +1362,37 @@ class InventoryModule(BaseInventoryPlugin):
             self.url = self.get_option("url")
         except Exception as err:
             raise AnsibleParserError(f"All correct options required: {err}") from err
+
+        cache_key = self.get_cache_key(path)
+        # cache may be True or False at this point to indicate if the inventory is being refreshed
+        # get the user's cache option too to see if we should save the cache if it is changing
+        user_cache_setting = self.get_option("cache")
+        # read if the user has caching enabled and the cache isn't being refreshed
+        attempt_to_read_cache = user_cache_setting and cache
+        # update if the user has caching enabled and the cache is being refreshed; update this value to True if the cache has expired below
+        cache_needs_update = user_cache_setting and not cache
+
+        if attempt_to_read_cache:
+            try:
+                cached = self._cache[cache_key]
+            except KeyError:
+                # This occurs if the cache_key is not in the cache or if the cache_key expired, so the cache needs to be updated
+                cache_needs_update = True
+            else:
+                # _populate() removes and adds entries, the cached data must stay untouched
+                self.data = {"instances": dict(cached["instances"]), "networks": dict(cached["networks"])}
+                if self.get_option("cache_revalidate"):
+                    self.socket = self._connect_to_socket()
+                    cache_needs_update = self.revalidate_instance_data()
+
+        if not self.data:
+            self.get_data()
+
+        if cache_needs_update:
+            self._cache[cache_key] = {
+                "instances": dict(self.data["instances"]),
+                "networks": dict(self.data["networks"]),
+            }
+
         # Call our internal helper to populate the dynamic inventory
         self._populate()
@@ -12,6 +12,7 @@ requirements:
   - be logged into bitwarden
   - bitwarden vault unlocked
   - E(BW_SESSION) environment variable set
+  - cryptography (Python library), if O(cache_file) is set
 short_description: Retrieve secrets from Bitwarden
 version_added: 5.4.0
 description:
@@ -64,6 +65,36 @@ options:
     type: bool
     default: false
     version_added: 13.2.0
+  cache:
+    description:
+      - If set to V(true), all items of the organization and collection are fetched with one C(bw list items) call, and all
+        terms are looked up in that list instead of calling C(bw) for every term.
+      - The list is kept in memory for O(cache_ttl) seconds, and in O(cache_file) if that is set.
+      - With O(sync=true), the cached lists are dropped before looking up the terms.
+    type: bool
+    default: false
+    version_added: 13.4.0
+  cache_ttl:
+    description: Number of seconds a fetched list of items is used for, if O(cache=true).
+    type: int
+    default: 300
+    version_added: 13.4.0
+  cache_file:
+    description:
+      - Path of a file to also keep the fetched lists of items in, if O(cache=true). This shares them between tasks and
+        between runs of C(ansible-playbook).
+      - The file is encrypted with a key derived from the session key, O(bw_session) or E(BW_SESSION). Unlocking the vault
+        again gives a new session key, which makes the lookup ignore the old content of the file.
+      - Requires the Python C(cryptography) library.
+    type: path
+    version_added: 13.4.0
+  serve_url:
+    description:
+      - URL of a running C(bw serve) instance, for example V(http://localhost:8087).
+      - If set together with O(cache=true), the status of the vault and the lists of items are fetched from C(bw serve)
+        instead of running C(bw) for them.
+    type: str
+    version_added: 13.4.0
 """
 
 EXAMPLES = r"""
@@ -111,6 +142,12 @@ EXAMPLES = r"""
   ansible.builtin.debug:
     msg: >-
       {{ lookup('community.general.bitwarden', 'a_test', result_count=1) }}
+
+- name: "Get many passwords with a single call of the Bitwarden CLI, cached for all tasks of the next 10 minutes"
+  ansible.builtin.debug:
+    msg: >-
+      {{ lookup('community.general.bitwarden', 'a_test', 'b_test', field='password', cache=true,
+                cache_ttl=600, cache_file='~/.cache/ansible-bitwarden') }}
 """
 
 RETURN = r"""
@@ -123,25 +160,69 @@ _raw:
   elements: list
 """
 
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
 from subprocess import PIPE, Popen
+from urllib.parse import urlencode
 
 from ansible.errors import AnsibleError, AnsibleOptionsError
-from ansible.module_utils.common.text.converters import to_bytes, to_text
+from ansible.module_utils.common.text.converters import to_bytes, to_native, to_text
+from ansible.module_utils.urls import open_url
 from ansible.parsing.ajson import AnsibleJSONDecoder
 from ansible.plugins.lookup import LookupBase
 
 from ansible_collections.community.general.plugins.plugin_utils._lookup import check_for_wrong_terms
 
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
 
 class BitwardenException(AnsibleError):
     pass
 
 
+class BitwardenItemIndex:
+    """All items of an organization/collection, indexed by ID and name."""
+
+    def __init__(self, items, fetched=None):
+        self.items = items
+        self.fetched = time.time() if fetched is None else fetched
+        self.by_id = {}
+        self.by_name = {}
+        for item in items:
+            self.by_id[item.get("id")] = item
+            self.by_name.setdefault(item.get("name"), []).append(item)
+
+    def find(self, search_value, search_field):
+        if not search_value or not search_field:
+            return list(self.items)
+        if search_field == "id":
+            item = self.by_id.get(search_value)
+            return [] if item is None else [item]
+        if search_field == "name":
+            return list(self.by_name.get(search_value, []))
+        return [item for item in self.items if item.get(search_field) == search_value]
+
+
 class Bitwarden:
     def __init__(self, path="bw"):
         self._cli_path = path
         self._session = None
 
+        self.cache = False
+        self.cache_ttl = 300
+        self.cache_file = None
+        self.serve_url = None
+        self._item_indexes = {}
+
     @property
     def cli_path(self):
         return self._cli_path
@@ -156,14 +237,127 @@ class Bitwarden:
 
     @property
     def unlocked(self):
+        if self.cache and self.serve_url:
+            return self._serve_request("/status")["template"]["status"] == "unlocked"
         out, err = self._run(["status"], stdin="")
         decoded = AnsibleJSONDecoder().raw_decode(out)[0]
         return decoded["status"] == "unlocked"
 
     def sync(self):
+        if self.cache:
+            self.clear_cache()
+            if self.serve_url:
+                return self._serve_request("/sync", method="POST")
         out, err = self._run(["sync"], stdin="")
         return out
 
+    def _serve_request(self, path, params=None, method="GET"):
+        url = f"{self.serve_url.rstrip('/')}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        try:
+            response = open_url(url, method=method, headers={"Accept": "application/json"})
+            decoded = AnsibleJSONDecoder().decode(to_text(response.read(), errors="surrogate_or_strict"))
+        except Exception as e:
+            raise BitwardenException(f"Request to bw serve at {url} failed: {to_native(e)}") from e
+        if not decoded.get("success"):
+            raise BitwardenException(f"Request to bw serve at {url} failed: {decoded.get('message')}")
+        return decoded.get("data")
+
+    def _cache_key(self, collection_id, organization_id):
+        return f"{organization_id or ''}/{collection_id or ''}"
+
+    def _cache_fernet(self):
+        if not HAS_CRYPTOGRAPHY:
+            raise AnsibleError(
+                'Python cryptography library is required for cache_file. Please install using "pip install cryptography"'
+            )
+        session = self.session or os.environ.get("BW_SESSION")
+        if not session:
+            raise AnsibleError("cache_file needs a session key, set bw_session or BW_SESSION")
+        key = hashlib.sha256(b"ansible-bitwarden-cache:" + to_bytes(session)).digest()
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def _read_cache_file(self):
+        try:
+            with open(self.cache_file, "rb") as f:
+                token = f.read()
+        except FileNotFoundError:
+            return {}
+        fernet = self._cache_fernet()
+        try:
+            return json.loads(fernet.decrypt(token))
+        except (InvalidToken, ValueError):
+            # written with another session key, or not by us
+            return {}
+
+    def _write_cache_file(self, key, index):
+        entries = self._read_cache_file()
+        now = time.time()
+        entries = {k: v for k, v in entries.items() if now - v["fetched"] < self.cache_ttl}
+        entries[key] = {"fetched": index.fetched, "items": index.items}
+        token = self._cache_fernet().encrypt(to_bytes(json.dumps(entries)))
+
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".bitwarden-cache-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, self.cache_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def clear_cache(self):
+        self._item_indexes.clear()
+        if self.cache_file and os.path.exists(self.cache_file):
+            os.remove(self.cache_file)
+
+    def _fetch_items(self, collection_id=None, organization_id=None):
+        if self.serve_url:
+            params = {}
+            if collection_id:
+                params["collectionId"] = collection_id
+            if organization_id:
+                params["organizationId"] = organization_id
+            return self._serve_request("/list/object/items", params)["data"]
+
+        params = ["list", "items"]
+        if collection_id:
+            params.extend(["--collectionid", collection_id])
+        if organization_id:
+            params.extend(["--organizationid", organization_id])
+        out, err = self._run(params)
+        return AnsibleJSONDecoder().raw_decode(out)[0]
+
+    def get_item_index(self, collection_id=None, organization_id=None):
+        """Return the index of all items of the organization and collection, fetching them only if needed."""
+
+        key = self._cache_key(collection_id, organization_id)
+        # the session is part of the key, so that another account's session never gets these items
+        memory_key = (self.session or os.environ.get("BW_SESSION"), key)
+        now = time.time()
+
+        index = self._item_indexes.get(memory_key)
+        if index is not None and now - index.fetched < self.cache_ttl:
+            return index
+
+        if self.cache_file:
+            entry = self._read_cache_file().get(key)
+            if entry is not None and now - entry["fetched"] < self.cache_ttl:
+                index = BitwardenItemIndex(entry["items"], fetched=entry["fetched"])
+                self._item_indexes[memory_key] = index
+                return index
+
+        if not self.unlocked:
+            raise AnsibleError("Bitwarden Vault locked. Run 'bw unlock'.")
+
+        index = BitwardenItemIndex(self._fetch_items(collection_id, organization_id))
+        self._item_indexes[memory_key] = index
+        if self.cache_file:
+            self._write_cache_file(key, index)
+        return index
+
     def _run(self, args, stdin=None, expected_rc=0):
         if self.session:
             args += ["--session", self.session]
@@ -180,6 +374,9 @@ class Bitwarden:
     def _get_matches(self, search_value, search_field, collection_id=None, organization_id=None):
         """Return matching records whose search_field is equal to key."""
 
+        if self.cache:
+            return self.get_item_index(collection_id, organization_id).find(search_value, search_field)
+
         # Prepare set of params for Bitwarden CLI
         if search_field == "id":
             params = ["get", "item", search_value]
@@ -274,8 +471,13 @@ class LookupModule(LookupBase):
         result_count = self.get_option("result_count")
         _bitwarden.session = self.get_option("bw_session")
         sync = self.get_option("sync")
+        _bitwarden.cache = self.get_option("cache")
+        _bitwarden.cache_ttl = self.get_option("cache_ttl")
+        _bitwarden.cache_file = self.get_option("cache_file")
+        _bitwarden.serve_url = self.get_option("serve_url")
 
-        if not _bitwarden.unlocked:
+        # with the cache, the vault status is only checked when items have to be fetched
+        if not _bitwarden.cache and not _bitwarden.unlocked:
             raise AnsibleError("Bitwarden Vault locked. Run 'bw unlock'.")
 
         if sync:
@@ -104,6 +104,26 @@ options:
       python_none: Return a Python V(null)/V(None) value.
       empty_string: Return an empty string.
     version_added: 13.1.0
+  prefetch_prefix:
+    description:
+      - If set, all keys with this prefix are read with one recursive request, and terms whose key starts with this prefix
+        are looked up in the result instead of asking Consul for every term.
+      - Terms that do not start with this prefix, that set C(index), or that set a different C(token) or C(datacenter)
+        than the lookup options are looked up in Consul as usual.
+    type: str
+    version_added: 13.4.0
+  prefetch_ttl:
+    description:
+      - Number of seconds the keys read for O(prefetch_prefix) are kept in memory, so that further lookups with the same
+        connection parameters and prefix do not read them again.
+      - Lookups run in the worker processes, so the keys are mostly shared between lookups of the same task.
+      - With V(0), the keys are only used for the terms of the current lookup.
+    type: int
+    default: 0
+    version_added: 13.4.0
+notes:
+  - Connections are reused for all terms of a lookup and, since lookups run in the worker processes, mostly between
+    lookups of the same task with the same connection parameters.
 """
 
 EXAMPLES = r"""
@@ -118,6 +138,10 @@ EXAMPLES = r"""
   with_community.general.consul_kv:
     - 'key/to recurse=true token=E6C060A9-26FB-407A-B83E-12DDAFCB4D98'
 
+- name: Read all keys below ansible/ once and look up several of them
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.general.consul_kv', 'ansible/db/user', 'ansible/db/password', prefetch_prefix='ansible/') }}"
+
 - name: retrieving a KV from a remote cluster on non default port
   ansible.builtin.debug:
     msg: "{{ lookup('community.general.consul_kv', 'my/key', host='10.10.10.10', port=2000) }}"
@@ -130,6 +154,8 @@ _raw:
   type: dict
 """
 
+import time
+import typing as t
 from urllib.parse import urlparse
 
 from ansible.errors import AnsibleAssertionError, AnsibleError
@@ -152,6 +178,19 @@ _EMPTY_VALUE_MAP = {
     "empty_string": "",
 }
 
+# Clients per connection parameters
+_CLIENTS: dict[tuple, t.Any] = {}
+
+# Entries read for prefetch_prefix per (connection parameters, prefix, token, datacenter), with the time they were read
+_PREFIX_SNAPSHOTS: dict[tuple, tuple[float, dict[str, t.Any]]] = {}
+
+
+def get_client(host, port, scheme, verify, client_cert):
+    client_key = (host, port, scheme, verify, client_cert)
+    if client_key not in _CLIENTS:
+        _CLIENTS[client_key] = consul.Consul(host=host, port=port, scheme=scheme, verify=verify, cert=client_cert)
+    return _CLIENTS[client_key]
+
 
 class LookupModule(LookupBase):
     def run(self, terms, variables=None, **kwargs):
@@ -183,19 +222,30 @@ class LookupModule(LookupBase):
         verify = (ca_path or validate_certs) if validate_certs else False
 
         empty_value = _EMPTY_VALUE_MAP[self.get_option("empty_value")]
+        connection = (host, port, scheme, verify, client_cert)
         values = []
+        snapshot = None
         try:
             for term in terms:
                 params = self.parse_params(term)
-                consul_api = consul.Consul(host=host, port=port, scheme=scheme, verify=verify, cert=client_cert)
-
-                results = consul_api.kv.get(
-                    params["key"],
-                    token=params["token"],
-                    index=params["index"],
-                    recurse=params["recurse"],
-                    dc=params["datacenter"],
-                )
+                consul_api = get_client(*connection)
+
+                if self.can_use_snapshot(params):
+                    if snapshot is None:
+                        snapshot = self.get_prefix_snapshot(consul_api, connection)
+                    if params["recurse"]:
+                        entries = [entry for key, entry in snapshot.items() if key.startswith(params["key"])]
+                    else:
+                        entries = snapshot.get(params["key"])
+                    results = (None, entries)
+                else:
+                    results = consul_api.kv.get(
+                        params["key"],
+                        token=params["token"],
+                        index=params["index"],
+                        recurse=params["recurse"],
+                        dc=params["datacenter"],
+                    )
                 if results[1]:
                     # responds with a single or list of result maps
                     if isinstance(results[1], list):
@@ -210,6 +260,35 @@ class LookupModule(LookupBase):
 
         return values
 
+    def can_use_snapshot(self, params):
+        prefetch_prefix = self.get_option("prefetch_prefix")
+        return (
+            bool(prefetch_prefix)
+            and params["key"].startswith(prefetch_prefix)
+            and params["index"] is None
+            and params["token"] == self.get_option("token")
+            and params["datacenter"] == self.get_option("datacenter")
+        )
+
+    def get_prefix_snapshot(self, consul_api, connection):
+        prefetch_prefix = self.get_option("prefetch_prefix")
+        token = self.get_option("token")
+        datacenter = self.get_option("datacenter")
+        ttl = self.get_option("prefetch_ttl")
+
+        snapshot_key = (connection, prefetch_prefix, token, datacenter)
+        if ttl > 0 and snapshot_key in _PREFIX_SNAPSHOTS:
+            read_at, snapshot = _PREFIX_SNAPSHOTS[snapshot_key]
+            if time.monotonic() - read_at < ttl:
+                return snapshot
+
+        dummy, entries = consul_api.kv.get(prefetch_prefix, token=token, recurse=True, dc=datacenter)
+        snapshot = {entry["Key"]: entry for entry in entries or []}
+
+        if ttl > 0:
+            _PREFIX_SNAPSHOTS[snapshot_key] = (time.monotonic(), snapshot)
+        return snapshot
+
     def parse_params(self, term):
         params = term.split(" ")
 
@@ -101,6 +101,23 @@ options:
     default: 53
     type: int
     version_added: 9.5.0
+  cache:
+    description:
+      - Keep the answers in memory until their TTL expires, and reuse them for further queries of dig lookups that use the
+        same nameservers, port, and O(retry_servfail).
+      - Lookups run in the worker processes, so the answers are mostly shared between the terms of one lookup and between
+        lookups of the same task.
+    default: false
+    type: bool
+    version_added: 13.4.0
+  max_workers:
+    description:
+      - If multiple domains are queried, query up to this number of domains at the same time.
+      - The results are returned in the order of the domains in any case.
+      - V(1) queries the domains one after the other.
+    default: 8
+    type: int
+    version_added: 13.4.0
 notes:
   - V(ALL) is not a record in itself, merely the listed fields are available for any record results you retrieve in the form
     of a dictionary.
@@ -156,6 +173,10 @@ EXAMPLES = r"""
     msg: "XMPP service for gmail.com. is available at {{ item.target }} on port {{ item.port }}"
   with_items: "{{ lookup('community.general.dig', '_xmpp-server._tcp.gmail.com./SRV', flat=0, wantlist=true) }}"
 
+- name: Lookup the same name for every host, but only query the DNS server again once the answer has expired
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.general.dig', 'example.org.', cache=true) }}"
+
 - name: Retry nameservers that return SERVFAIL
   ansible.builtin.debug:
     msg: "{{ lookup('community.general.dig', 'example.org./A', retry_servfail=true) }}"
@@ -241,6 +262,7 @@ _list:
 """
 
 import socket
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleError
 from ansible.module_utils.parsing.convert_bool import boolean
@@ -286,6 +308,9 @@ except ImportError:
 
 display = Display()
 
+# Resolvers per (nameservers, port, retry_servfail, cache), shared by the lookups of the same worker process
+_RESOLVERS: dict[tuple, dns.resolver.Resolver] = {}
+
 
 def make_rdata_dict(rdata):
     """While the 'dig' lookup plugin supports anything which dnspython supports
@@ -347,6 +372,29 @@ def make_rdata_dict(rdata):
     return rd
 
 
+def get_resolver(nameservers, port, retry_servfail, cache):
+    """Return a resolver for the given settings.
+
+    Resolvers are kept for the lifetime of the worker process. With cache, every resolver has its own
+    answer cache, since the cache does not know which nameservers have been asked.
+    """
+    key = (tuple(nameservers), port, retry_servfail, cache)
+    if key not in _RESOLVERS:
+        # Create Resolver object so that we can set NS if necessary
+        myres = dns.resolver.Resolver(configure=True)
+        edns_size = 4096
+        myres.use_edns(0, ednsflags=dns.flags.DO, payload=edns_size)
+        myres.retry_servfail = retry_servfail
+        if port:
+            myres.port = port
+        if len(nameservers) > 0:
+            myres.nameservers = nameservers
+        if cache:
+            myres.cache = dns.resolver.LRUCache()
+        _RESOLVERS[key] = myres
+    return _RESOLVERS[key]
+
+
 # ==============================================================
 # dig: Lookup DNS records
 #
@@ -375,11 +423,6 @@ class LookupModule(LookupBase):
         self.set_options(var_options=variables, direct=kwargs)
         check_for_wrong_terms(self, direct=kwargs)
 
-        # Create Resolver object so that we can set NS if necessary
-        myres = dns.resolver.Resolver(configure=True)
-        edns_size = 4096
-        myres.use_edns(0, ednsflags=dns.flags.DO, payload=edns_size)
-
         domains = []
         nameservers = []
         qtype = self.get_option("qtype")
@@ -392,7 +435,7 @@ class LookupModule(LookupBase):
             rdclass = dns.rdataclass.from_text(self.get_option("class"))
         except Exception as e:
             raise AnsibleError(f"dns lookup illegal CLASS: {e}") from e
-        myres.retry_servfail = self.get_option("retry_servfail")
+        retry_servfail = self.get_option("retry_servfail")
 
         for t in terms:
             if t.startswith("@"):  # e.g. "@10.0.1.2,192.0.2.1" is ok.
@@ -427,7 +470,7 @@ class LookupModule(LookupBase):
                     except Exception as e:
                         raise AnsibleError(f"dns lookup illegal CLASS: {e}") from e
                 elif opt == "retry_servfail":
-                    myres.retry_servfail = boolean(arg)
+                    retry_servfail = boolean(arg)
                 elif opt == "fail_on_error":
                     fail_on_error = boolean(arg)
                 elif opt == "real_empty":
@@ -448,10 +491,7 @@ class LookupModule(LookupBase):
 
         # print "--- domain = {domain} qtype={qtype} rdclass={rdclass}"
 
-        if port:
-            myres.port = port
-        if len(nameservers) > 0:
-            myres.nameservers = nameservers
+        myres = get_resolver(nameservers, port, retry_servfail, self.get_option("cache"))
 
         if qtype.upper() == "PTR":
             reversed_domains = []
@@ -468,43 +508,58 @@ class LookupModule(LookupBase):
         if len(domains) > 1:
             real_empty = True
 
+        def query(domain):
+            return self._query(myres, domain, qtype, rdclass, tcp, flat, fail_on_error, real_empty)
+
+        max_workers = self.get_option("max_workers")
+        if len(domains) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(domains))) as executor:
+                results = list(executor.map(query, domains))
+        else:
+            results = [query(domain) for domain in domains]
+
         ret = []
+        for result in results:
+            ret.extend(result)
+        return ret
 
-        for domain in domains:
-            try:
-                answers = myres.query(domain, qtype, rdclass=rdclass, tcp=tcp)
-                for rdata in answers:
-                    s = rdata.to_text()
-                    if qtype.upper() == "TXT":
-                        s = s[1:-1]  # Strip outside quotes on TXT rdata
-
-                    if flat:
-                        ret.append(s)
-                    else:
-                        try:
-                            rd = make_rdata_dict(rdata)
-                            rd["owner"] = answers.canonical_name.to_text()
-                            rd["type"] = dns.rdatatype.to_text(rdata.rdtype)
-                            rd["ttl"] = answers.rrset.ttl
-                            rd["class"] = dns.rdataclass.to_text(rdata.rdclass)
-
-                            ret.append(rd)
-                        except Exception as err:
-                            if fail_on_error:
-                                raise AnsibleError(f"Lookup failed: {err}") from err
-                            ret.append(str(err))
-
-            except dns.resolver.NXDOMAIN as err:
-                if fail_on_error:
-                    raise AnsibleError(f"Lookup failed: {err}") from err
-                if not real_empty:
-                    ret.append("NXDOMAIN")
-            except (dns.resolver.NoAnswer, dns.resolver.Timeout, dns.resolver.NoNameservers) as err:
-                if fail_on_error:
-                    raise AnsibleError(f"Lookup failed: {err}") from err
-                if not real_empty:
-                    ret.append("")
-            except dns.exception.DNSException as err:
-                raise AnsibleError(f"dns.resolver unhandled exception {err}") from err
+    @staticmethod
+    def _query(myres, domain, qtype, rdclass, tcp, flat, fail_on_error, real_empty):
+        ret = []
+        try:
+            answers = myres.query(domain, qtype, rdclass=rdclass, tcp=tcp)
+            for rdata in answers:
+                s = rdata.to_text()
+                if qtype.upper() == "TXT":
+                    s = s[1:-1]  # Strip outside quotes on TXT rdata
+
+                if flat:
+                    ret.append(s)
+                else:
+                    try:
+                        rd = make_rdata_dict(rdata)
+                        rd["owner"] = answers.canonical_name.to_text()
+                        rd["type"] = dns.rdatatype.to_text(rdata.rdtype)
+                        rd["ttl"] = answers.rrset.ttl
+                        rd["class"] = dns.rdataclass.to_text(rdata.rdclass)
+
+                        ret.append(rd)
+                    except Exception as err:
+                        if fail_on_error:
+                            raise AnsibleError(f"Lookup failed: {err}") from err
+                        ret.append(str(err))
+
+        except dns.resolver.NXDOMAIN as err:
+            if fail_on_error:
+                raise AnsibleError(f"Lookup failed: {err}") from err
+            if not real_empty:
+                ret.append("NXDOMAIN")
+        except (dns.resolver.NoAnswer, dns.resolver.Timeout, dns.resolver.NoNameservers) as err:
+            if fail_on_error:
+                raise AnsibleError(f"Lookup failed: {err}") from err
+            if not real_empty:
+                ret.append("")
+        except dns.exception.DNSException as err:
+            raise AnsibleError(f"dns.resolver unhandled exception {err}") from err
 
         return ret
@@ -90,6 +90,22 @@ options:
     env:
       - name: ETCDCTL_PASSWORD
     type: str
+  prefetch_prefix:
+    description:
+      - If set, all keys with this prefix are read with one request, and terms that start with this prefix are looked up in
+        the result instead of asking the etcd3 server for every term.
+      - Terms that do not start with this prefix are looked up on the etcd3 server as usual.
+    type: str
+    version_added: 13.4.0
+  prefetch_ttl:
+    description:
+      - Number of seconds the keys read for O(prefetch_prefix) are kept in memory, so that further lookups with the same
+        connection parameters and prefix do not read them again.
+      - Lookups run in the worker processes, so the keys are mostly shared between lookups of the same task.
+      - With V(0), the keys are only used for the terms of the current lookup.
+    type: int
+    default: 0
+    version_added: 13.4.0
 
 notes:
   - O(host) and O(port) options take precedence over O(endpoints) option.
@@ -97,6 +113,8 @@ notes:
     O(host), and O(port) unused.
   - To connect to an HTTPS etcd3 endpoint, the O(ca_cert) option must be provided. Merely specifying V(https://) in
     O(endpoints) is not sufficient to enable TLS.
+  - Connections are reused for all terms of a lookup and, since lookups run in the worker processes, mostly between
+    lookups of the same task with the same connection parameters.
 seealso:
   - module: community.general.etcd3
   - plugin: community.general.etcd
@@ -123,6 +141,10 @@ EXAMPLES = r"""
   ansible.builtin.debug:
     msg: "{{ lookup('community.general.etcd3', 'foo/bar', cert_cert='/etc/ssl/etcd/client.pem', cert_key='/etc/ssl/etcd/client.key') }}"
 
+- name: "read all keys below /foo once and look up several of them"
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.general.etcd3', '/foo/bar', '/foo/baz', prefetch_prefix='/foo/', prefetch_ttl=60) }}"
+
 - name: "connect to etcd3 over HTTPS"
   ansible.builtin.debug:
     msg: "{{ lookup('community.general.etcd3', 'foo/bar', endpoints='https://etcd.example.com:2379', ca_cert='/etc/ssl/etcd/ca.pem') }}"
@@ -144,6 +166,8 @@ _raw:
 """
 
 import re
+import time
+import typing as t
 
 from ansible.errors import AnsibleLookupError
 from ansible.module_utils.basic import missing_required_lib
@@ -175,6 +199,13 @@ etcd3_cnx_opts = (
 )
 
 
+# Clients per connection parameters
+_CLIENTS: dict[tuple, t.Any] = {}
+
+# Keys and values read for prefetch_prefix per (connection parameters, prefix), with the time they were read
+_PREFIX_SNAPSHOTS: dict[tuple, tuple[float, dict[str, str]]] = {}
+
+
 def etcd3_client(client_params):
     try:
         etcd = etcd3.client(**client_params)
@@ -184,6 +215,30 @@ def etcd3_client(client_params):
     return etcd
 
 
+def get_client(client_params):
+    client_key = tuple(sorted(client_params.items()))
+    if client_key not in _CLIENTS:
+        _CLIENTS[client_key] = etcd3_client(client_params)
+    return _CLIENTS[client_key]
+
+
+def get_prefix_snapshot(etcd, client_params, prefix, ttl):
+    snapshot_key = (tuple(sorted(client_params.items())), prefix)
+    if ttl > 0 and snapshot_key in _PREFIX_SNAPSHOTS:
+        read_at, snapshot = _PREFIX_SNAPSHOTS[snapshot_key]
+        if time.monotonic() - read_at < ttl:
+            return snapshot
+
+    snapshot = {}
+    for val, meta in etcd.get_prefix(prefix):
+        if val and meta:
+            snapshot[to_native(meta.key)] = to_native(val)
+
+    if ttl > 0:
+        _PREFIX_SNAPSHOTS[snapshot_key] = (time.monotonic(), snapshot)
+    return snapshot
+
+
 class LookupModule(LookupBase):
     def run(self, terms, variables, **kwargs):
         self.set_options(var_options=variables, direct=kwargs)
@@ -240,13 +295,26 @@ class LookupModule(LookupBase):
             cnx_log["password"] = "<redacted>"
         display.verbose(f"etcd3 connection parameters: {cnx_log}")
 
-        # connect to etcd3 server
-        etcd = etcd3_client(client_params)
+        # connect to etcd3 server, or reuse the connection of a previous lookup
+        etcd = get_client(client_params)
+
+        prefetch_prefix = self.get_option("prefetch_prefix")
+        snapshot = None
+        if prefetch_prefix and any(term.startswith(prefetch_prefix) for term in terms):
+            try:
+                snapshot = get_prefix_snapshot(etcd, client_params, prefetch_prefix, self.get_option("prefetch_ttl"))
+            except Exception as exp:
+                display.warning(f"Caught except during etcd3.get_prefix: {exp}")
 
         ret = []
         # we can pass many keys to lookup
         for term in terms:
-            if self.get_option("prefix"):
+            if snapshot is not None and term.startswith(prefetch_prefix):
+                if self.get_option("prefix"):
+                    ret.extend({"key": key, "value": value} for key, value in snapshot.items() if key.startswith(term))
+                elif term in snapshot:
+                    ret.append({"key": term, "value": snapshot[term]})
+            elif self.get_option("prefix"):
                 try:
                     for val, meta in etcd.get_prefix(term):
                         if val and meta:
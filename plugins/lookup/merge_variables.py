@@ -306,25 +306,58 @@ class LookupModule(LookupBase):
         self._type_conflict_merge = self.get_option("type_conflict_merge", "replace")
         self._default_merge = self.get_option("default_merge", "replace")
         self._list_transformations = self.get_option("list_transformations", [])
+        self._merger = self._build_merger()
+        self._var_matchers: dict[str, Callable[[str], bool]] = {}
+
+        if self._templar is None:
+            raise AnsibleError("Templar is not available")
 
         ret = []
+        if not self._groups:  # consider only own variables
+            for term in terms:
+                self._check_term(term)
+                ret.append(self._merge_vars(term, initial_value, variables))
+            return ret
+
+        # consider variables of hosts in given groups
+        hosts = self._get_allowed_hosts(variables)
+        all_host_variables = None
         for term in terms:
-            if not isinstance(term, str):
-                raise AnsibleError(f"Non-string type '{type(term)}' passed, only 'str' types are allowed!")
+            self._check_term(term)
+            if all_host_variables is None:
+                all_host_variables = []
+                for host in hosts:
+                    host_variables = dict(variables["hostvars"].raw_get(host))
+                    host_variables["hostvars"] = variables["hostvars"]  # re-add hostvars
+                    all_host_variables.append(host_variables)
 
-            if not self._groups:  # consider only own variables
-                ret.append(self._merge_vars(term, initial_value, variables))
-            else:  # consider variables of hosts in given groups
-                cross_host_merge_result = initial_value
-                for host in variables["hostvars"]:
-                    if self._is_host_in_allowed_groups(variables["hostvars"][host]["group_names"]):
-                        host_variables = dict(variables["hostvars"].raw_get(host))
-                        host_variables["hostvars"] = variables["hostvars"]  # re-add hostvars
-                        cross_host_merge_result = self._merge_vars(term, cross_host_merge_result, host_variables)
-                ret.append(cross_host_merge_result)
+            cross_host_merge_result = initial_value
+            for host_variables in all_host_variables:
+                cross_host_merge_result = self._merge_vars(term, cross_host_merge_result, host_variables)
+
+            ret.append(cross_host_merge_result)
 
         return ret
 
+    @staticmethod
+    def _check_term(term: t.Any) -> None:
+        if not isinstance(term, str):
+            raise AnsibleError(f"Non-string type '{type(term)}' passed, only 'str' types are allowed!")
+
+    def _get_allowed_hosts(self, variables: dict[str, t.Any]) -> list[str]:
+        hostvars = variables["hostvars"]
+        if "all" in self._groups:
+            return list(hostvars)
+
+        if "groups" in variables:
+            # use the group memberships of the inventory instead of fetching the variables of every host
+            allowed_hosts = set()
+            for group in self._groups:
+                allowed_hosts.update(variables["groups"].get(group, []))
+            return [host for host in hostvars if host in allowed_hosts]
+
+        return [host for host in hostvars if self._is_host_in_allowed_groups(hostvars[host]["group_names"])]
+
     def _is_host_in_allowed_groups(self, host_groups: list[str]) -> bool:
         if "all" in self._groups:
             return True
@@ -332,28 +365,23 @@ class LookupModule(LookupBase):
         group_intersection = [host_group_name for host_group_name in host_groups if host_group_name in self._groups]
         return bool(group_intersection)
 
-    def _var_matches(self, key: str, search_pattern: str) -> bool:
+    def _var_matcher(self, search_pattern: str) -> Callable[[str], bool]:
+        if search_pattern not in self._var_matchers:
+            self._var_matchers[search_pattern] = self._compile_pattern(search_pattern)
+        return self._var_matchers[search_pattern]
+
+    def _compile_pattern(self, search_pattern: str) -> Callable[[str], bool]:
         if self._pattern_type == "prefix":
-            return key.startswith(search_pattern)
+            return lambda key: key.startswith(search_pattern)
         elif self._pattern_type == "suffix":
-            return key.endswith(search_pattern)
+            return lambda key: key.endswith(search_pattern)
         elif self._pattern_type == "regex":
             matcher = re.compile(search_pattern)
-            return matcher.search(key) is not None
-
-        return False
-
-    def _merge_vars(self, search_pattern: str, initial_value: t.Any, variables: dict[str, t.Any]) -> t.Any:
-        display.vvv(f"Merge variables with {self._pattern_type}: {search_pattern}")
-        var_merge_names = sorted([key for key in variables.keys() if self._var_matches(key, search_pattern)])
-        display.vvv(f"The following variables will be merged: {var_merge_names}")
-        prev_var_type = None
-        result = None
+            return lambda key: matcher.search(key) is not None
 
-        if initial_value is not None:
-            prev_var_type = _verify_and_get_type(initial_value)
-            result = initial_value
+        return lambda key: False
 
+    def _build_merger(self) -> Merger:
         builder = (
             MergerBuilder()
             .with_type_strategy(list, ListMergeStrategies.from_name(self._list_merge))
@@ -381,11 +409,25 @@ class LookupModule(LookupBase):
                     f"Transformations must be specified through values of type 'str' or 'dict', but a value of type '{type(transformation)}' was given"
                 )
 
-        merger = builder.build()
+        return builder.build()
+
+    def _merge_vars(self, search_pattern: str, initial_value: t.Any, variables: dict[str, t.Any]) -> t.Any:
+        display.vvv(f"Merge variables with {self._pattern_type}: {search_pattern}")
+        var_matches = self._var_matcher(search_pattern)
+        var_merge_names = sorted([key for key in variables.keys() if var_matches(key)])
+        display.vvv(f"The following variables will be merged: {var_merge_names}")
+        prev_var_type = None
+        result = None
+
+        if initial_value is not None:
+            prev_var_type = _verify_and_get_type(initial_value)
+            result = initial_value
+
+        if not var_merge_names:
+            return result
 
         if self._templar is None:
             raise AnsibleError("Templar is not available")
-
         templar = self._templar.copy_with_new_env(available_variables=variables)
 
         for var_name in var_merge_names:
@@ -401,7 +443,7 @@ class LookupModule(LookupBase):
                 result = var_value
                 continue
 
-            result = merger.merge(path=[var_name], left=result, right=var_value)
+            result = self._merger.merge(path=[var_name], left=result, right=var_value)
 
         return result
 
@@ -77,9 +77,11 @@ _raw:
 """
 
 import abc
+import hashlib
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleLookupError, AnsibleOptionsError
 from ansible.module_utils.common.process import get_bin_path
@@ -101,6 +103,9 @@ def _lower_if_possible(value):
 class OnePassCLIBase(metaclass=abc.ABCMeta):
     bin = "op"
 
+    # op version per binary path, the version does not change while Ansible runs
+    _current_versions: dict[str, str] = {}
+
     def __init__(
         self,
         subdomain=None,
@@ -204,12 +209,16 @@ class OnePassCLIBase(metaclass=abc.ABCMeta):
         except ValueError as e:
             raise AnsibleLookupError(f"Unable to locate '{cls.bin}' command line tool") from e
 
+        if bin_path in cls._current_versions:
+            return cls._current_versions[bin_path]
+
         try:
             b_out = subprocess.check_output([bin_path, "--version"], stderr=subprocess.PIPE)
         except subprocess.CalledProcessError as cpe:
             raise AnsibleLookupError(f"Unable to get the op version: {cpe}") from cpe
 
-        return to_text(b_out).strip()
+        version = cls._current_versions[bin_path] = to_text(b_out).strip()
+        return version
 
 
 class OnePassCLIv2(OnePassCLIBase):
@@ -457,7 +466,21 @@ class OnePassCLIv2(OnePassCLIBase):
         return self._run(args, command_input=to_bytes(self.master_password))
 
 
+def _hash_secret(value):
+    if not value:
+        return None
+    return hashlib.sha256(to_bytes(value)).hexdigest()
+
+
 class OnePass:
+    # Shared by the lookups of this process if they enable the cache option. Lookups run in the worker
+    # processes, so this is mostly the terms of one lookup and the lookups of the same task.
+    # Keys start with the account key, see _account_key().
+    _results: dict[tuple, bytes | str] = {}
+    _tokens: dict[tuple, bytes | str | None] = {}
+
+    PREFETCH_WORKERS = 4
+
     def __init__(
         self,
         subdomain=None,
@@ -470,6 +493,7 @@ class OnePass:
         connect_host=None,
         connect_token=None,
         cli_class=None,
+        cache=False,
     ):
         self.subdomain = subdomain
         self.domain = domain
@@ -483,6 +507,7 @@ class OnePass:
 
         self.logged_in = False
         self.token = None
+        self.cache = cache
 
         self._config = OnePasswordConfig()
         self._cli = self._get_cli_class(cli_class)
@@ -548,7 +573,31 @@ class OnePass:
             rc, out, err = self._cli.full_signin()
             self.token = out.strip()
 
+    @classmethod
+    def clear_cache(cls):
+        cls._results.clear()
+        cls._tokens.clear()
+
+    def _account_key(self):
+        return (
+            self.subdomain,
+            self.domain,
+            self.username,
+            self.account_id,
+            self.connect_host,
+            _hash_secret(self.service_account_token),
+            _hash_secret(self.connect_token),
+        )
+
+    def _result_key(self, *args):
+        return self._account_key() + (type(self._cli).__name__,) + args
+
     def assert_logged_in(self):
+        if self.cache and self._account_key() in self._tokens:
+            self.logged_in = True
+            self.token = self._tokens[self._account_key()]
+            return
+
         logged_in = self._cli.assert_logged_in()
         if logged_in:
             self.logged_in = logged_in
@@ -556,10 +605,38 @@ class OnePass:
         else:
             self.set_token()
 
+        if self.cache:
+            self._tokens[self._account_key()] = self.token
+
     def get_raw(self, item_id, vault=None):
+        if self.cache:
+            key = self._result_key("get_raw", _lower_if_possible(vault), item_id)
+            if key in self._results:
+                return self._results[key]
+
         rc, out, err = self._cli.get_raw(item_id, vault, self.token)
+
+        if self.cache:
+            self._results[key] = out
         return out
 
+    def prefetch(self, item_ids, vault=None):
+        """Fetch the items that are not cached yet concurrently, so that get_raw() finds them in the cache"""
+        if not self.cache:
+            return
+
+        missing = [
+            item_id
+            for item_id in dict.fromkeys(item_ids)
+            if self._result_key("get_raw", _lower_if_possible(vault), item_id) not in self._results
+        ]
+        if len(missing) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.PREFETCH_WORKERS, len(missing))) as executor:
+            for dummy in executor.map(lambda item_id: self.get_raw(item_id, vault), missing):
+                pass
+
     def get_field(self, item_id, field, section=None, vault=None):
         output = self.get_raw(item_id, vault)
         if output:
@@ -578,8 +655,17 @@ class OnePass:
         if len(path_parts) not in (3, 4):
             raise AnsibleLookupError("Not a valid secret reference")
 
+        if self.cache:
+            key = self._result_key("get_secret_reference", reference)
+            if key in self._results:
+                return self._results[key]
+
         rc, out, err = self._cli.get_secret_reference(reference, self.token)
-        return to_text(out).strip()
+        value = to_text(out).strip()
+
+        if self.cache:
+            self._results[key] = value
+        return value
 
 
 class LookupModule(LookupBase):
@@ -610,8 +696,10 @@ class LookupModule(LookupBase):
             account_id=account_id,
             connect_host=connect_host,
             connect_token=connect_token,
+            cache=self.get_option("cache"),
         )
         op.assert_logged_in()
+        op.prefetch([term for term in terms if not term.startswith("op://")], vault)
 
         values = []
         for term in terms:
@@ -79,8 +79,10 @@ class LookupModule(LookupBase):
             connect_host=connect_host,
             connect_token=connect_token,
             cli_class=OnePassCLIv2Doc,
+            cache=self.get_option("cache"),
         )
         op.assert_logged_in()
+        op.prefetch(terms, vault)
 
         values = []
         for term in terms:
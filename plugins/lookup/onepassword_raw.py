@@ -84,8 +84,10 @@ class LookupModule(LookupBase):
             account_id=account_id,
             connect_host=connect_host,
             connect_token=connect_token,
+            cache=self.get_option("cache"),
         )
         op.assert_logged_in()
+        op.prefetch(terms, vault)
 
         values = []
         for term in terms:
@@ -125,6 +125,36 @@ options:
     type: str
     default: 15m
     version_added: 4.5.0
+  lock_scope:
+    description:
+      - What O(lock) synchronizes on.
+      - V(global) uses one lock for all entries of all password stores of the user.
+      - V(entry) uses one lock per entry of a password store, so operations on different entries do not wait for each other.
+        With O(lock=readwrite), C(gpg-agent) can then be called in parallel for different entries.
+      - Do not use V(entry) to create or update entries in a password store that is a git repository, since the commits
+        done by C(pass) for different entries can then run at the same time and fail.
+    ini:
+      - section: passwordstore_lookup
+        key: lock_scope
+    type: str
+    default: global
+    choices:
+      - global
+      - entry
+    version_added: 13.4.0
+  cache:
+    description:
+      - Keep the decrypted content of entries in memory, and only decrypt an entry once per process.
+      - The content is never written to disk. Entries created or updated by this lookup are decrypted again the next time
+        they are looked up.
+      - Lookups run in the worker processes, so the cache is mostly shared between the terms of one lookup and between lookups
+        of the same task. Changes done to the password store by other means during that time are not seen.
+    ini:
+      - section: passwordstore_lookup
+        key: cache
+    type: bool
+    default: false
+    version_added: 13.4.0
   backend:
     description:
       - Specify which backend to use.
@@ -254,6 +284,7 @@ _raw:
   elements: str
 """
 
+import hashlib
 import os
 import re
 import subprocess
@@ -274,6 +305,12 @@ from ansible_collections.community.general.plugins.plugin_utils._lookup import c
 
 display = Display()
 
+# Results of '<backend> --version' per backend command
+_REAL_PASS: dict[str, bool] = {}
+
+# Decrypted content of entries per (backend, directory, passname), only used with cache=true
+_DECRYPTED: dict[tuple[str, str, str], str] = {}
+
 
 def run_backend_cmd(cmd, *, input=None, env=None):
     result = subprocess.run(
@@ -301,16 +338,41 @@ class LookupModule(LookupBase):
 
     def is_real_pass(self):
         if self.realpass is None:
-            try:
-                passoutput = to_text(
-                    run_backend_cmd([self.pass_cmd, "--version"], env=self.env), errors="surrogate_or_strict"
-                )
-                self.realpass = "pass: the standard unix password manager" in passoutput
-            except subprocess.CalledProcessError as e:
-                raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
+            if self.pass_cmd not in _REAL_PASS:
+                try:
+                    passoutput = to_text(
+                        run_backend_cmd([self.pass_cmd, "--version"], env=self.env), errors="surrogate_or_strict"
+                    )
+                except subprocess.CalledProcessError as e:
+                    raise AnsibleError(
+                        f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}"
+                    ) from e
+                _REAL_PASS[self.pass_cmd] = "pass: the standard unix password manager" in passoutput
+            self.realpass = _REAL_PASS[self.pass_cmd]
 
         return self.realpass
 
+    def _cache_key(self):
+        return (self.backend, self.paramvals["directory"], self.passname)
+
+    def show_pass(self, use_cache=True):
+        # the decrypted content is only kept if the cache option is enabled
+        if self.cache and use_cache and self._cache_key() in _DECRYPTED:
+            return _DECRYPTED[self._cache_key()]
+        raw_output = to_text(
+            run_backend_cmd([self.pass_cmd, "show"] + [self.passname], env=self.env), errors="surrogate_or_strict"
+        )
+        if self.cache:
+            _DECRYPTED[self._cache_key()] = raw_output
+        return raw_output
+
+    def insert_pass(self, msg):
+        _DECRYPTED.pop(self._cache_key(), None)
+        try:
+            run_backend_cmd([self.pass_cmd, "insert", "-f", "-m", self.passname], input=msg, env=self.env)
+        except subprocess.CalledProcessError as e:
+            raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
+
     def parse_params(self, term):
         # I went with the "traditional" param followed with space separated KV pairs.
         # Waiting for final implementation of lookup parameter parsing.
@@ -367,11 +429,9 @@ class LookupModule(LookupBase):
                 else:
                     self.env["PASSWORD_STORE_UMASK"] = self.paramvals["umask"]
 
-    def check_pass(self):
+    def check_pass(self, use_cache=True):
         try:
-            raw_output = to_text(
-                run_backend_cmd([self.pass_cmd, "show"] + [self.passname], env=self.env), errors="surrogate_or_strict"
-            )
+            raw_output = self.show_pass(use_cache=use_cache)
             self.passoutput_had_trailing_newline = raw_output.endswith("\n")
             self.passoutput = raw_output.splitlines()
             self.password = self.passoutput[0]
@@ -456,10 +516,7 @@ class LookupModule(LookupBase):
                 if self.paramvals["timestamp"] and self.paramvals["backup"]:
                     msg += f"lookup_pass: old password was {self.password} (Updated on {datetime})\n"
 
-        try:
-            run_backend_cmd([self.pass_cmd, "insert", "-f", "-m", self.passname], input=msg, env=self.env)
-        except subprocess.CalledProcessError as e:
-            raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
+        self.insert_pass(msg)
         return newpass
 
     def generate_password(self):
@@ -477,10 +534,7 @@ class LookupModule(LookupBase):
         if self.paramvals["timestamp"]:
             msg += f"\nlookup_pass: First generated by ansible on {datetime}\n"
 
-        try:
-            run_backend_cmd([self.pass_cmd, "insert", "-f", "-m", self.passname], input=msg, env=self.env)
-        except subprocess.CalledProcessError as e:
-            raise AnsibleError(f"exit code {e.returncode} while running {e.cmd}. Error output: {e.output}") from e
+        self.insert_pass(msg)
 
         return newpass
 
@@ -513,7 +567,11 @@ class LookupModule(LookupBase):
         if self.get_option("lock") == type:
             tmpdir = os.environ.get("TMPDIR", "/tmp")
             user = os.environ.get("USER")
-            lockfile = os.path.join(tmpdir, f".{user}.passwordstore.lock")
+            if self.get_option("lock_scope") == "entry":
+                entry = hashlib.sha256(to_bytes(f"{self.paramvals['directory']}\0{self.passname}")).hexdigest()[:16]
+                lockfile = os.path.join(tmpdir, f".{user}.passwordstore.{entry}.lock")
+            else:
+                lockfile = os.path.join(tmpdir, f".{user}.passwordstore.lock")
             with FileLock().lock_file(lockfile, tmpdir, self.lock_timeout):
                 self.locked = type
                 yield
@@ -524,6 +582,7 @@ class LookupModule(LookupBase):
     def setup(self, variables):
         self.backend = self.get_option("backend")
         self.pass_cmd = self.backend  # pass and gopass are commands as well
+        self.cache = self.get_option("cache")
         self.locked = None
         timeout = self.get_option("locktimeout")
         if not re.match("^[0-9]+[smh]$", timeout):
@@ -585,8 +644,8 @@ class LookupModule(LookupBase):
                 else:  # password does not exist
                     if self.paramvals["missing"] == "create":
                         with self.opt_lock("write"):
-                            if (
-                                self.locked == "write" and self.check_pass()
+                            if self.locked == "write" and self.check_pass(
+                                use_cache=False
                             ):  # lookup password again if under write lock
                                 result.append(self.get_passresult())
                             else:
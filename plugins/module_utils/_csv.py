@@ -11,11 +11,13 @@ from __future__ import annotations
 import csv
 import typing as t
 from io import StringIO
+from operator import itemgetter
 
 from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.parsing.convert_bool import boolean
 
 if t.TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Iterator, Mapping, Sequence
 
     class DialectParamsOrNone(t.TypedDict):
         delimiter: t.NotRequired[str | None]
@@ -36,6 +38,10 @@ class DialectNotAvailableError(Exception):
     pass
 
 
+class ColumnError(Exception):
+    pass
+
+
 CSVError = csv.Error
 
 
@@ -79,3 +85,144 @@ def read_csv(data: str, dialect: str, fieldnames: Sequence[str] | None = None) -
     reader = csv.DictReader(fake_fh, fieldnames=fieldnames, dialect=dialect)
 
     return reader
+
+
+def open_csv(path: str) -> t.TextIO:
+    """Open a CSV file for reading it row by row. Like read_csv(), this skips a UTF-8 BOM."""
+    return open(path, encoding="utf-8-sig", errors="surrogateescape", newline="")
+
+
+def _to_bool(value: str) -> bool:
+    return boolean(value, strict=True)
+
+
+COLUMN_TYPES: dict[str, t.Callable[[str], t.Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+}
+
+
+class CSVRowReader:
+    """
+    Read CSV rows as tuples that share one header, instead of one dictionary per row.
+
+    Only the ``columns`` are kept, in this order; by default all fields are kept. The values of the columns in
+    ``column_types`` are converted to one of the types in ``COLUMN_TYPES``, empty values of columns that are not
+    ``str`` become ``None``. If ``filters`` is given, only rows whose values are in ``filters[column]`` for all
+    of its columns are returned. These columns do not need to be in ``columns``.
+
+    Like ``csv.DictReader``, empty rows are skipped, missing values are ``None``, and with duplicate field names
+    the last column wins. Without ``columns``, values beyond the header are kept and ``to_dict()`` returns them
+    as a list under the ``None`` key.
+    """
+
+    def __init__(
+        self,
+        data: str | bytes | t.TextIO,
+        dialect: str,
+        fieldnames: Sequence[str] | None = None,
+        columns: Sequence[str] | None = None,
+        column_types: Mapping[str, str] | None = None,
+        filters: Mapping[str, Collection[t.Any]] | None = None,
+    ) -> None:
+        lines: t.Iterable[str]
+        if isinstance(data, (str, bytes)):
+            text = to_native(data, errors="surrogate_or_strict")
+            if text.startswith("\ufeff"):
+                text = text[1:]
+            lines = StringIO(text)
+        else:
+            lines = data
+        self._reader = csv.reader(lines, dialect=dialect)
+        if fieldnames is None:
+            fieldnames = next(self._reader, [])
+        self.fieldnames = tuple(fieldnames)
+        self._index = {name: index for index, name in enumerate(self.fieldnames)}
+        self.header = tuple(columns) if columns else self.fieldnames
+
+        column_types = column_types or {}
+        filters = filters or {}
+        missing = [name for name in (*self.header, *column_types, *filters) if name not in self._index]
+        if missing:
+            raise ColumnError(f"Columns not found in the CSV header fields: {', '.join(missing)}")
+
+        converters = {}
+        for name, type_name in column_types.items():
+            if type_name not in COLUMN_TYPES:
+                raise ColumnError(
+                    f"Unknown type '{type_name}' for column '{name}', expected one of: {', '.join(COLUMN_TYPES)}"
+                )
+            converters[name] = (self._index[name], name, type_name)
+
+        self._filters = []
+        for name, values in filters.items():
+            type_name = column_types.get(name, "str")
+            accepted = {None if value is None else self._convert_value(str(value), name, type_name) for value in values}
+            self._filters.append((self._index[name], accepted))
+
+        # Columns used by filters are converted first, the others only for rows that match
+        self._filter_converters = [converters.pop(name) for name in filters if name in converters]
+        self._converters = list(converters.values())
+
+        self._width = len(self.fieldnames)
+        self._getter: t.Callable[[list], tuple] | None = None
+        if columns:
+            indexes = [self._index[name] for name in self.header]
+            if len(indexes) == 1:
+                index = indexes[0]
+                self._getter = lambda row: (row[index],)
+            else:
+                self._getter = itemgetter(*indexes)
+
+    def _convert_value(self, value: str, name: str, type_name: str) -> t.Any:
+        if value == "" and type_name != "str":
+            return None
+        try:
+            return COLUMN_TYPES[type_name](value)
+        except (TypeError, ValueError) as e:
+            line = self._reader.line_num
+            raise ColumnError(
+                f"Cannot convert value '{value}' of column '{name}' in line {line} to {type_name}: {e}"
+            ) from e
+
+    def _convert(self, row: list, converters: list[tuple[int, str, str]]) -> None:
+        for index, name, type_name in converters:
+            value = row[index]
+            if value is not None:
+                row[index] = self._convert_value(value, name, type_name)
+
+    def __iter__(self) -> Iterator[tuple]:
+        width = self._width
+        getter = self._getter
+        filter_converters = self._filter_converters
+        converters = self._converters
+        filters = self._filters
+        # missing values at the end of short rows are None
+        padding: list[t.Any] = [None] * width
+        for row in self._reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend(padding[len(row) :])
+            if filters:
+                if filter_converters:
+                    self._convert(row, filter_converters)
+                for index, accepted in filters:
+                    if row[index] not in accepted:
+                        break
+                else:
+                    if converters:
+                        self._convert(row, converters)
+                    yield tuple(row) if getter is None else getter(row)
+                continue
+            if converters:
+                self._convert(row, converters)
+            yield tuple(row) if getter is None else getter(row)
+
+    def to_dict(self, row: tuple) -> dict[str | None, t.Any]:
+        result: dict[str | None, t.Any] = dict(zip(self.header, row))
+        if len(row) > len(self.header):
+            result[None] = list(row[len(self.header) :])
+        return result
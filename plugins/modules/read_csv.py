@@ -67,6 +67,48 @@ options:
       - When using this parameter, you change the default value used by O(dialect).
       - The default value depends on the dialect used.
     type: bool
+  columns:
+    description:
+      - Only return these columns, in this order.
+      - By default, all columns are returned.
+      - If O(key) is set, it must be one of these columns.
+    type: list
+    elements: str
+    version_added: 13.4.0
+  column_types:
+    description:
+      - A dictionary mapping column names to the type their values are converted to.
+      - Possible types are V(str), V(int), V(float), and V(bool).
+      - Empty values of columns that are not V(str) are converted to V(null).
+      - Columns not mentioned here stay strings.
+    type: dict
+    version_added: 13.4.0
+  filters:
+    description:
+      - A dictionary mapping column names to a value or a list of values.
+      - Only rows where every one of these columns has one of its values are returned.
+      - The values are compared after converting them according to O(column_types).
+      - The columns do not need to be part of O(columns).
+      - Together with O(key), this can be used to look up a few rows of a large file.
+    type: dict
+    version_added: 13.4.0
+  limit:
+    description:
+      - Stop reading the file after this many rows have been found.
+      - If O(filters) is set, only rows matching it are counted.
+    type: int
+    version_added: 13.4.0
+  count_only:
+    description:
+      - Only count the rows, and return an empty RV(list) and RV(dict).
+      - Use RV(count) to get the result.
+    type: bool
+    default: false
+    version_added: 13.4.0
+notes:
+  - The file is read row by row. Rows are kept as tuples until the module returns, and rows not matching O(filters)
+    are not kept at all. Use O(columns), O(filters), O(limit), or O(count_only) to reduce the memory needed for large
+    files.
 seealso:
   - plugin: ansible.builtin.csvfile
     plugin_type: lookup
@@ -114,6 +156,32 @@ EXAMPLES = r"""
     delimiter: ';'
   register: users
   delegate_to: localhost
+
+# Look up two users in a large CSV file, only keeping some columns
+- name: Read two users from CSV file and return a dictionary
+  community.general.read_csv:
+    path: users.csv
+    key: name
+    columns: [name, uid]
+    column_types:
+      uid: int
+    filters:
+      name: [dag, jeroen]
+  register: users
+  delegate_to: localhost
+
+# Count the users with GID 500
+- name: Count users in CSV file
+  community.general.read_csv:
+    path: users.csv
+    filters:
+      gid: '500'
+    count_only: true
+  register: users
+  delegate_to: localhost
+
+- ansible.builtin.debug:
+    msg: '{{ users.count }} users have GID 500'
 """
 
 RETURN = r"""
@@ -143,14 +211,18 @@ list:
       gid: 500
 """
 
+from itertools import islice
+
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.general.plugins.module_utils._csv import (
+    ColumnError,
     CSVError,
+    CSVRowReader,
     CustomDialectFailureError,
     DialectNotAvailableError,
     initialize_dialect,
-    read_csv,
+    open_csv,
 )
 
 
@@ -165,6 +237,11 @@ def main():
             delimiter=dict(type="str"),
             skipinitialspace=dict(type="bool"),
             strict=dict(type="bool"),
+            columns=dict(type="list", elements="str"),
+            column_types=dict(type="dict"),
+            filters=dict(type="dict"),
+            limit=dict(type="int"),
+            count_only=dict(type="bool", default=False),
         ),
         supports_check_mode=True,
     )
@@ -174,6 +251,16 @@ def main():
     key = module.params["key"]
     fieldnames = module.params["fieldnames"]
     unique = module.params["unique"]
+    columns = module.params["columns"]
+    limit = module.params["limit"]
+    count_only = module.params["count_only"]
+
+    if limit is not None and limit < 0:
+        module.fail_json(msg=f"limit must not be negative, got {limit}")
+
+    filters = {}
+    for name, values in (module.params["filters"] or {}).items():
+        filters[name] = values if isinstance(values, list) else [values]
 
     dialect_params = {
         "delimiter": module.params["delimiter"],
@@ -187,35 +274,56 @@ def main():
         module.fail_json(msg=f"{e}")
 
     try:
-        with open(path, "rb") as f:
-            data = f.read()
+        f = open_csv(path)
     except OSError as e:
         module.fail_json(msg=f"Unable to open file: {e}")
 
-    reader = read_csv(data, dialect, fieldnames)
-
-    if key and key not in reader.fieldnames:
-        module.fail_json(msg=f"Key '{key}' was not found in the CSV header fields: {', '.join(reader.fieldnames)}")
-
+    rows = []
     data_dict = dict()
-    data_list = list()
+    count = 0
 
-    if key is None:
+    with f:
         try:
-            for row in reader:
-                data_list.append(row)
+            reader = CSVRowReader(
+                f,
+                dialect,
+                fieldnames,
+                columns=columns,
+                column_types=module.params["column_types"],
+                filters=filters,
+            )
+        except ColumnError as e:
+            module.fail_json(msg=f"{e}")
         except CSVError as e:
             module.fail_json(msg=f"Unable to process file: {e}")
-    else:
+
+        if key and key not in reader.fieldnames:
+            module.fail_json(msg=f"Key '{key}' was not found in the CSV header fields: {', '.join(reader.fieldnames)}")
+        if key and key not in reader.header:
+            module.fail_json(msg=f"Key '{key}' was not found in columns: {', '.join(reader.header)}")
+
+        key_index = reader.header.index(key) if key else None
         try:
-            for row in reader:
-                if unique and row[key] in data_dict:
-                    module.fail_json(msg=f"Key '{key}' is not unique for value '{row[key]}'")
-                data_dict[row[key]] = row
+            for row in islice(reader, limit):
+                count += 1
+                if count_only:
+                    continue
+                if key_index is None:
+                    rows.append(row)
+                    continue
+                if unique and row[key_index] in data_dict:
+                    module.fail_json(msg=f"Key '{key}' is not unique for value '{row[key_index]}'")
+                data_dict[row[key_index]] = row
+        except ColumnError as e:
+            module.fail_json(msg=f"{e}")
         except CSVError as e:
             module.fail_json(msg=f"Unable to process file: {e}")
 
-    module.exit_json(dict=data_dict, list=data_list)
+    data_list = [reader.to_dict(row) for row in rows]
+    for name, row in data_dict.items():
+        data_dict[name] = reader.to_dict(row)
+
+    module.exit_json(dict=data_dict, list=data_list, count=count)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import json
+import pickle
+import typing as t
+import zlib
+
+from ansible.errors import AnsibleError
+from ansible.parsing.ajson import AnsibleJSONDecoder, AnsibleJSONEncoder
+
+try:
+    import lzma
+
+    HAS_LZMA = True
+except ImportError:
+    HAS_LZMA = False
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    # Python 3.14+
+    from compression import zstd
+
+    HAS_ZSTD = True
+except ImportError:
+    try:
+        import zstandard as zstd
+
+        HAS_ZSTD = True
+    except ImportError:
+        HAS_ZSTD = False
+
+
+SERIALIZERS = ("json", "msgpack", "pickle")
+COMPRESSIONS = ("none", "zlib", "lzma", "zstd")
+
+# The header byte is 1 + 4 * serializer index + compression index. All values are below 0x20,
+# so they can never be the first byte of a JSON document, a pickle, or text written by older versions.
+_MAX_HEADER = len(SERIALIZERS) * len(COMPRESSIONS)
+
+
+def _json_dumps(value: t.Any) -> bytes:
+    return json.dumps(
+        value,
+        cls=AnsibleJSONEncoder,  # type: ignore[arg-type]
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> t.Any:
+    return json.loads(data, cls=AnsibleJSONDecoder)  # type: ignore[arg-type]
+
+
+def _msgpack_dumps(value: t.Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> t.Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+def _compress(compression: str, data: bytes) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(data)
+    if compression == "lzma":
+        return lzma.compress(data)
+    if compression == "zstd":
+        return zstd.compress(data) if hasattr(zstd, "compress") else zstd.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "lzma":
+        return lzma.decompress(data)
+    if compression == "zstd":
+        return zstd.decompress(data) if hasattr(zstd, "decompress") else zstd.ZstdDecompressor().decompress(data)
+    return data
+
+
+_DUMPS: dict[str, t.Callable[[t.Any], bytes]] = {"json": _json_dumps, "msgpack": _msgpack_dumps, "pickle": pickle.dumps}
+_LOADS: dict[str, t.Callable[[bytes], t.Any]] = {"json": _json_loads, "msgpack": _msgpack_loads, "pickle": pickle.loads}
+
+
+class CacheSerializer:
+    """
+    Serializes cache values into bytes prefixed with a header byte describing the format.
+
+    When no serializer and no compression is configured, ``encode`` returns ``None`` so that
+    the cache plugin can keep writing entries in its previous format. ``is_encoded`` allows
+    to tell apart entries written by this class from entries in the previous format.
+    """
+
+    def __init__(self, plugin_name: str, serializer: str | None, compression: str | None) -> None:
+        compression = compression or "none"
+        if serializer is None and compression != "none":
+            serializer = "json"
+        if serializer == "msgpack" and not HAS_MSGPACK:
+            raise AnsibleError(f"The 'msgpack' python module is required for the {plugin_name} cache with msgpack")
+        if compression == "lzma" and not HAS_LZMA:
+            raise AnsibleError(f"The 'lzma' python module is required for the {plugin_name} cache with lzma")
+        if compression == "zstd" and not HAS_ZSTD:
+            raise AnsibleError(
+                f"Python 3.14+ or the 'zstandard' python module is required for the {plugin_name} cache with zstd"
+            )
+        self.serializer = serializer
+        self.compression = compression
+        self.enabled = serializer is not None
+        if self.enabled:
+            self._header = bytes([1 + 4 * SERIALIZERS.index(serializer) + COMPRESSIONS.index(compression)])
+
+    def encode(self, value: t.Any) -> bytes | None:
+        if self.serializer is None:
+            return None
+        return self._header + _compress(self.compression, _DUMPS[self.serializer](value))
+
+    @staticmethod
+    def is_encoded(data: t.Any) -> bool:
+        return isinstance(data, bytes) and len(data) > 0 and 1 <= data[0] <= _MAX_HEADER
+
+    @staticmethod
+    def decode(data: bytes) -> t.Any:
+        index = data[0] - 1
+        serializer = SERIALIZERS[index // 4]
+        compression = COMPRESSIONS[index % 4]
+        if serializer == "msgpack" and not HAS_MSGPACK:
+            raise AnsibleError("The 'msgpack' python module is required to read this cache entry")
+        if compression == "lzma" and not HAS_LZMA:
+            raise AnsibleError("The 'lzma' python module is required to read this cache entry")
+        if compression == "zstd" and not HAS_ZSTD:
+            raise AnsibleError("Python 3.14+ or the 'zstandard' python module is required to read this cache entry")
+        return _LOADS[serializer](_decompress(compression, data[1:]))
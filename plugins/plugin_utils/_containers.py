@@ -0,0 +1,105 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import typing as t
+from collections.abc import Mapping, Set
+
+from ansible.module_utils.common.collections import is_sequence
+
+_MAPPING = 0
+_SET = 1
+_SEQUENCE = 2
+
+# Exact types that are never containers, checked before the (slow) ABC isinstance() checks
+_SCALAR_TYPES = frozenset((str, bytes, int, float, bool, type(None)))
+
+
+def _kind(value: t.Any, sets: bool) -> int | None:
+    value_type = type(value)
+    if value_type is dict:
+        return _MAPPING
+    if value_type is list or value_type is tuple:
+        return _SEQUENCE
+    if value_type in _SCALAR_TYPES:
+        return None
+    if isinstance(value, Mapping):
+        return _MAPPING
+    if sets and isinstance(value, Set):
+        return _SET
+    if is_sequence(value):
+        return _SEQUENCE
+    return None
+
+
+def _children(value: t.Any, kind: int) -> list:
+    if kind == _MAPPING:
+        # keys and values interleaved: k0, v0, k1, v1, ...
+        return [elt for item in value.items() for elt in item]
+    return list(value)
+
+
+def _build(value: t.Any, kind: int, children: list, results: list, sequence_type: type | None) -> t.Any:
+    unchanged = all(result is child for result, child in zip(results, children))
+    if kind == _MAPPING:
+        if unchanged and type(value) is dict:
+            return value
+        it = iter(results)
+        return dict(zip(it, it))
+    if kind == _SET:
+        if unchanged and type(value) is set:
+            return value
+        return set(results)
+    if sequence_type is None:
+        if unchanged and (type(value) is list or type(value) is tuple):
+            return value
+        return type(value)(results)
+    if unchanged and type(value) is sequence_type:
+        return value
+    return sequence_type(results)
+
+
+def map_leaves(
+    value: t.Any,
+    leaf: t.Callable[[t.Any], t.Any],
+    *,
+    sets: bool = True,
+    sequence_type: type | None = None,
+) -> t.Any:
+    """
+    Apply ``leaf`` to every key and value nested in mappings, sets (if ``sets`` is ``True``) and sequences.
+
+    Mappings are converted to ``dict`` and sets to ``set``. Sequences keep their type unless ``sequence_type``
+    is given. Containers where ``leaf`` returned every key and element unchanged are not copied: if they
+    already have the target type, the original object is returned. The tree is walked with an explicit stack,
+    so deeply nested input does not hit the recursion limit.
+    """
+    kind = _kind(value, sets)
+    if kind is None:
+        return leaf(value)
+
+    # Every frame is (container, kind, children, results); results grows until it has as many entries as children
+    stack: list[tuple[t.Any, int, list, list]] = [(value, kind, _children(value, kind), [])]
+    while True:
+        container, kind, children, results = stack[-1]
+        for index in range(len(results), len(children)):
+            child = children[index]
+            if type(child) in _SCALAR_TYPES:
+                results.append(leaf(child))
+                continue
+            child_kind = _kind(child, sets)
+            if child_kind is not None:
+                stack.append((child, child_kind, _children(child, child_kind), []))
+                break
+            results.append(leaf(child))
+        else:
+            stack.pop()
+            result = _build(container, kind, children, results, sequence_type)
+            if not stack:
+                return result
+            stack[-1][3].append(result)
@@ -0,0 +1,215 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+import typing as t
+import uuid
+
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+
+
+class EventShipper:
+    """
+    Sends events to a collector from a background thread.
+
+    Callbacks serialize every event themselves and hand it to ``put()``. The
+    worker thread groups the events by ``key`` into batches that are sent once
+    they reach ``max_events`` events or ``max_bytes`` bytes, or once their
+    oldest event is ``interval`` seconds old. ``join(payloads)`` builds the
+    request body of a batch, ``post(key, body, headers)`` sends it and raises
+    an exception on failure.
+
+    Failed requests are retried ``retries`` times with exponential backoff.
+    Batches that still cannot be sent are written to ``spool_dir`` if it is
+    set, and sent first the next time a shipper with the same ``name`` starts.
+
+    Errors are collected by the worker thread and returned by ``pop_errors()``
+    so that the callback can report them from the main thread.
+    """
+
+    BACKOFF = 1.0
+    MAX_BACKOFF = 30.0
+    FLUSH_TIMEOUT = 300.0
+
+    def __init__(
+        self,
+        name: str,
+        post: t.Callable[[t.Any, bytes, dict[str, str]], None],
+        join: t.Callable[[list[bytes]], bytes],
+        queue_size: int = 10000,
+        max_events: int = 100,
+        max_bytes: int = 1000000,
+        interval: float = 5.0,
+        compress: bool = False,
+        retries: int = 3,
+        spool_dir: str | None = None,
+    ) -> None:
+        self.name = name
+        self._post = post
+        self._join = join
+        self._max_events = max(1, max_events)
+        self._max_bytes = max_bytes
+        self._interval = interval
+        self._compress = compress
+        self._retries = max(0, retries)
+        self._spool_dir = spool_dir
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._errors: list[str] = []
+        self._closed = False
+        self._pid = os.getpid()
+        self.sent_batches = 0
+        self._thread = threading.Thread(target=self._run, name=f"{name}-shipper", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, payload: bytes, key: t.Any = None) -> None:
+        """Queue an event. Blocks while the queue is full."""
+        if self._closed:
+            raise RuntimeError(f"{self.name}: event shipper has been closed")
+        self._queue.put((key, payload))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Send all queued events and wait until they have been sent, retried and spooled.
+
+        Waits at most ``timeout`` seconds, ``FLUSH_TIMEOUT`` by default. Returns whether all events were handled in time.
+        """
+        if self._closed:
+            return True
+        if timeout is None:
+            timeout = self.FLUSH_TIMEOUT
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._queue.put((None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(max(0.0, deadline - time.monotonic()))
+
+    def close(self, timeout: float | None = None) -> None:
+        """Send all queued events and stop the worker thread."""
+        if self._closed or self._pid != os.getpid():
+            return
+        self._closed = True
+        self._queue.put((None, None))
+        self._thread.join(timeout)
+
+    def pop_errors(self) -> list[str]:
+        errors, self._errors = self._errors, []
+        return errors
+
+    def _run(self) -> None:
+        self._send_spooled()
+        # key -> [payloads, size, time of the oldest event]
+        pending: dict[t.Any, list] = {}
+        while True:
+            timeout = None
+            if pending:
+                oldest = min(batch[2] for batch in pending.values())
+                timeout = max(0.0, oldest + self._interval - time.monotonic())
+            try:
+                key, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                payload = False
+
+            if payload is None or isinstance(payload, threading.Event):
+                for batch_key in list(pending):
+                    self._send(batch_key, pending.pop(batch_key)[0])
+                if payload is None:
+                    return
+                payload.set()
+                continue
+
+            if payload is not False:
+                batch = pending.get(key)
+                if batch is not None and batch[1] + len(payload) > self._max_bytes:
+                    self._send(key, pending.pop(key)[0])
+                    batch = None
+                if batch is None:
+                    batch = pending[key] = [[], 0, time.monotonic()]
+                batch[0].append(payload)
+                batch[1] += len(payload)
+                if len(batch[0]) >= self._max_events or batch[1] >= self._max_bytes:
+                    self._send(key, pending.pop(key)[0])
+
+            now = time.monotonic()
+            for batch_key in [k for k, batch in pending.items() if now - batch[2] >= self._interval]:
+                self._send(batch_key, pending.pop(batch_key)[0])
+
+    def _send(self, key: t.Any, payloads: list[bytes], spool: bool = True) -> bool:
+        body = self._join(payloads)
+        headers = {}
+        if self._compress:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+
+        delay = self.BACKOFF
+        for attempt in range(self._retries + 1):
+            try:
+                self._post(key, body, headers)
+                self.sent_batches += 1
+                return True
+            except Exception as e:
+                error = e
+            if attempt < self._retries and not self._closed:
+                time.sleep(delay)
+                delay = min(delay * 2, self.MAX_BACKOFF)
+
+        message = f"{self.name}: failed to send {len(payloads)} event(s): {error}"
+        if spool and self._spool_dir:
+            self._spool(key, payloads)
+            message += f"; saved them in {self._spool_dir}"
+        self._errors.append(message)
+        return False
+
+    def _spool(self, key: t.Any, payloads: list[bytes]) -> None:
+        spool_dir = self._spool_dir
+        if not spool_dir:
+            return
+        try:
+            os.makedirs(spool_dir, exist_ok=True)
+            path = os.path.join(spool_dir, f"{self.name}-{time.time():.6f}-{uuid.uuid4().hex}.json")
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(to_bytes(json.dumps({"key": key, "payloads": [to_text(p) for p in payloads]})))
+            os.rename(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self._errors.append(f"{self.name}: cannot save events in {spool_dir}: {e}")
+
+    def _send_spooled(self) -> None:
+        if not self._spool_dir:
+            return
+        try:
+            names = sorted(
+                name
+                for name in os.listdir(self._spool_dir)
+                if name.startswith(f"{self.name}-") and name.endswith(".json")
+            )
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self._spool_dir, name)
+            try:
+                with open(path, "rb") as f:
+                    batch = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not self._send(batch["key"], [to_bytes(p) for p in batch["payloads"]], spool=False):
+                # the collector is still unreachable, keep the remaining files for the next run
+                return
+            try:
+                os.remove(path)
+            except OSError:
+                pass
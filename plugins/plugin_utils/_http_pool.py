@@ -0,0 +1,152 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import http.client
+import io
+import socket
+import ssl
+import threading
+import typing as t
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from ansible.module_utils.common.text.converters import to_bytes
+
+
+class HTTPConnectionPool:
+    """
+    Keeps HTTP(S) connections open between requests.
+
+    ``open_url()`` opens a new connection, including a TLS handshake, for
+    every request. This pool keeps up to ``max_idle`` idle connections per
+    scheme, host, port and certificate validation setting, so that callbacks
+    sending many small requests to the same collector only pay for the
+    handshake once.
+
+    A request on a reused connection that the server has closed in the meantime
+    is repeated once on a new connection. This is only done if the connection
+    was reset or closed before any part of the response arrived; timeouts and
+    other errors are raised.
+    Responses with a status of 400 or more raise ``urllib.error.HTTPError`` like
+    ``open_url()`` does. Proxies are not supported.
+    """
+
+    def __init__(self, max_idle: int = 4, timeout: float = 10) -> None:
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_contexts: dict[bool, ssl.SSLContext] = {}
+
+    def _ssl_context(self, validate_certs: bool) -> ssl.SSLContext:
+        context = self._ssl_contexts.get(validate_certs)
+        if context is None:
+            context = ssl.create_default_context()
+            if not validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_contexts[validate_certs] = context
+        return context
+
+    def _connect(self, key: tuple, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port, validate_certs = key
+        conn: http.client.HTTPConnection
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context(validate_certs))
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        conn.connect()
+        # small requests on a long-lived connection must not wait for the delayed ACK of the previous one
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn
+
+    def _acquire(self, key: tuple) -> http.client.HTTPConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        return None
+
+    def _release(self, key: tuple, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        url: str,
+        data: bytes | str | None = None,
+        headers: dict[str, str] | None = None,
+        method: str = "POST",
+        validate_certs: bool = True,
+        timeout: float | None = None,
+    ) -> tuple[int, bytes]:
+        """Send a request and return the status and the body of the response."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {url}")
+        key = (parts.scheme, parts.hostname, parts.port, validate_certs)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        body = None if data is None else to_bytes(data)
+        headers = dict(headers or {})
+
+        conn = self._acquire(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._connect(key, self.timeout if timeout is None else timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+            except (ConnectionResetError, BrokenPipeError):
+                # RemoteDisconnected is a ConnectionResetError: the server sent no response at all
+                conn.close()
+                if not reused:
+                    raise
+                # the server has closed the idle connection, try once more with a new one
+                conn = None
+                reused = False
+                continue
+            except Exception:
+                conn.close()
+                raise
+            break
+
+        try:
+            content = response.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(content))
+        return response.status, content
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def __enter__(self) -> HTTPConnectionPool:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
@@ -0,0 +1,116 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this plugin util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+import time
+import typing as t
+from collections import OrderedDict
+
+
+class LogFilePool:
+    """
+    Keeps log files open between writes.
+
+    Callbacks writing one file per host would otherwise open and close a file
+    for every result. This pool keeps up to ``max_open`` files open, closing
+    the least recently used one when another file is needed. Writes are
+    buffered and all open files are flushed once ``flush_interval`` seconds
+    have passed since the last flush, checked on every write.
+
+    If ``max_size`` is set, a file that would grow beyond it is rotated first:
+    ``path`` becomes ``path.1``, ``path.1`` becomes ``path.2`` and so on, up to
+    ``backup_count`` old files. With ``compress``, rotated files are gzipped
+    and get a ``.gz`` suffix.
+    """
+
+    def __init__(
+        self,
+        max_open: int = 100,
+        flush_interval: float = 1.0,
+        max_size: int = 0,
+        backup_count: int = 5,
+        compress: bool = False,
+    ) -> None:
+        self.max_open = max(1, max_open)
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.backup_count = backup_count
+        self.compress = compress
+        self._files: OrderedDict[str, t.BinaryIO] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._last_flush = time.monotonic()
+
+    def _open(self, path: str) -> t.BinaryIO:
+        fd = self._files.get(path)
+        if fd is not None:
+            self._files.move_to_end(path)
+            return fd
+
+        fd = open(path, "ab")
+        self._files[path] = fd
+        self._sizes[path] = fd.tell()
+        while len(self._files) > self.max_open:
+            dummy, oldest = self._files.popitem(last=False)
+            oldest.close()
+        return fd
+
+    def _close(self, path: str) -> None:
+        fd = self._files.pop(path, None)
+        if fd is not None:
+            fd.close()
+
+    def _backup_name(self, path: str, index: int) -> str:
+        return f"{path}.{index}.gz" if self.compress else f"{path}.{index}"
+
+    def rotate(self, path: str) -> None:
+        """Close ``path`` and move it out of the way, keeping at most ``backup_count`` old files."""
+        self._close(path)
+        self._sizes[path] = 0
+
+        if self.backup_count < 1:
+            os.remove(path)
+            return
+
+        for index in range(self.backup_count - 1, 0, -1):
+            src = self._backup_name(path, index)
+            if os.path.exists(src):
+                os.replace(src, self._backup_name(path, index + 1))
+
+        if self.compress:
+            with open(path, "rb") as src_fd, gzip.open(self._backup_name(path, 1), "wb") as dst_fd:
+                shutil.copyfileobj(src_fd, dst_fd)
+            os.remove(path)
+        else:
+            os.replace(path, self._backup_name(path, 1))
+
+    def write(self, path: str, data: bytes) -> None:
+        fd = self._open(path)
+
+        if self.max_size and self._sizes[path] and self._sizes[path] + len(data) > self.max_size:
+            self.rotate(path)
+            fd = self._open(path)
+
+        fd.write(data)
+        self._sizes[path] += len(data)
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        for fd in self._files.values():
+            fd.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        while self._files:
+            dummy, fd = self._files.popitem()
+            fd.close()
+        self._sizes.clear()
@@ -8,9 +8,7 @@
 from __future__ import annotations
 
 import typing as t
-from collections.abc import Mapping, Set
-
-from ansible.module_utils.common.collections import is_sequence
+from functools import partial
 
 try:
     # This is ansible-core 2.19+
@@ -24,26 +22,14 @@ except ImportError:
 from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
 from ansible.utils.unsafe_proxy import AnsibleUnsafe
 
+from ansible_collections.community.general.plugins.plugin_utils._containers import map_leaves
 
-def _to_native_types_compat(value: t.Any, *, redact_value: str | None) -> t.Any:
-    """Compatibility function for ansible-core 2.18 and before."""
-    if value is None:
-        return value
+
+def _to_native_leaf_compat(value: t.Any, *, redact_value: str | None) -> t.Any:
     if isinstance(value, AnsibleUnsafe):
         # This only works up to ansible-core 2.18:
-        return _to_native_types_compat(value._strip_unsafe(), redact_value=redact_value)  # type: ignore
+        value = value._strip_unsafe()  # type: ignore
         # But that's fine, since this code path isn't taken on ansible-core 2.19+ anyway.
-    if isinstance(value, Mapping):
-        return {
-            _to_native_types_compat(key, redact_value=redact_value): _to_native_types_compat(
-                val, redact_value=redact_value
-            )
-            for key, val in value.items()
-        }
-    if isinstance(value, Set):
-        return {_to_native_types_compat(elt, redact_value=redact_value) for elt in value}
-    if is_sequence(value):
-        return [_to_native_types_compat(elt, redact_value=redact_value) for elt in value]
     if isinstance(value, AnsibleVaultEncryptedUnicode):
         if redact_value is not None:
             return redact_value
@@ -58,11 +44,12 @@ def _to_native_types_compat(value: t.Any, *, redact_value: str | None) -> t.Any:
     return value
 
 
-def _to_native_types(value: t.Any, *, redact: bool) -> t.Any:
-    if isinstance(value, Mapping):
-        return {_to_native_types(k, redact=redact): _to_native_types(v, redact=redact) for k, v in value.items()}
-    if is_sequence(value):
-        return [_to_native_types(e, redact=redact) for e in value]
+def _to_native_types_compat(value: t.Any, *, redact_value: str | None) -> t.Any:
+    """Compatibility function for ansible-core 2.18 and before."""
+    return map_leaves(value, partial(_to_native_leaf_compat, redact_value=redact_value), sets=True, sequence_type=list)
+
+
+def _to_native_leaf(value: t.Any, *, redact: bool) -> t.Any:
     if redact:
         ciphertext = VaultHelper.get_ciphertext(value, with_tags=False)
         if ciphertext and VaultLib.is_encrypted(ciphertext):
@@ -70,6 +57,10 @@ def _to_native_types(value: t.Any, *, redact: bool) -> t.Any:
     return transform_to_native_types(value, redact=redact)
 
 
+def _to_native_types(value: t.Any, *, redact: bool) -> t.Any:
+    return map_leaves(value, partial(_to_native_leaf, redact=redact), sets=False, sequence_type=list)
+
+
 def remove_all_tags(value: t.Any, *, redact_sensitive_values: bool = False) -> t.Any:
     """
     Remove all tags from all values in the input.
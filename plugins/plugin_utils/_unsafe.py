@@ -7,11 +7,9 @@
 
 from __future__ import annotations
 
-import re
 import typing as t
 from collections.abc import Mapping, Sequence, Set
 
-from ansible.module_utils.common.collections import is_sequence
 from ansible.utils.unsafe_proxy import (
     AnsibleUnsafe,
 )
@@ -19,8 +17,18 @@ from ansible.utils.unsafe_proxy import (
     wrap_var as _make_unsafe,
 )
 
-_RE_TEMPLATE_CHARS = re.compile("[{}]")
-_RE_TEMPLATE_CHARS_BYTES = re.compile(b"[{}]")
+from ansible_collections.community.general.plugins.plugin_utils._containers import map_leaves
+
+
+def _make_leaf_unsafe(value: t.Any) -> t.Any:
+    # Substring checks are considerably faster than a regular expression search
+    if isinstance(value, str):
+        if ("{" in value or "}" in value) and not isinstance(value, AnsibleUnsafe):
+            value = _make_unsafe(value)
+    elif isinstance(value, bytes):
+        if (b"{" in value or b"}" in value) and not isinstance(value, AnsibleUnsafe):
+            value = _make_unsafe(value)
+    return value
 
 
 @t.overload
@@ -64,22 +72,12 @@ def make_unsafe(value: float) -> float: ...
 
 
 def make_unsafe(value: t.Any) -> t.Any:
-    if value is None or isinstance(value, AnsibleUnsafe):
-        return value
+    """
+    Mark all strings and bytes in ``value`` that could contain templates as unsafe.
 
-    if isinstance(value, Mapping):
-        return {make_unsafe(key): make_unsafe(val) for key, val in value.items()}
-    elif isinstance(value, Set):
-        return {make_unsafe(elt) for elt in value}
-    elif is_sequence(value):
-        return type(value)(make_unsafe(elt) for elt in value)
-    elif isinstance(value, bytes):
-        if _RE_TEMPLATE_CHARS_BYTES.search(value):
-            value = _make_unsafe(value)
-        return value
-    elif isinstance(value, str):
-        if _RE_TEMPLATE_CHARS.search(value):
-            value = _make_unsafe(value)
+    Containers without such values are returned as-is if they are a ``dict``, ``set``, ``list``, or ``tuple``.
+    """
+    if value is None or isinstance(value, AnsibleUnsafe):
         return value
 
-    return value
+    return map_leaves(value, _make_leaf_unsafe)
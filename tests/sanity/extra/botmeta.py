@@ -21,6 +21,8 @@ IGNORE_NO_MAINTAINERS = [
     "docs/docsite/rst/filter_guide_selecting_json_data.rst",
     "plugins/cache/memcached.py",
     "plugins/cache/redis.py",
+    "plugins/cache/sharded_file.py",
+    "plugins/cache/sqlite.py",
     "plugins/callback/cgroup_memory_recap.py",
     "plugins/callback/context_demo.py",
     "plugins/callback/counter_enabled.py",
@@ -50,6 +52,11 @@ IGNORE_NO_MAINTAINERS = [
     "plugins/lookup/shelvefile.py",
     "plugins/filter/json_query.py",
     "plugins/filter/random_mac.py",
+    "plugins/plugin_utils/_cache_serialization.py",
+    "plugins/plugin_utils/_containers.py",
+    "plugins/plugin_utils/_event_shipping.py",
+    "plugins/plugin_utils/_http_pool.py",
+    "plugins/plugin_utils/_log_writer.py",
 ]
 
 
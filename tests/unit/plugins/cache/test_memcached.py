@@ -5,14 +5,227 @@
 # Make coding more python3-ish
 from __future__ import annotations
 
+import pickle
+import time
+import typing as t
+
 import pytest
 
 pytest.importorskip("memcache")
 
 from ansible.plugins.loader import cache_loader
 
+from ansible_collections.community.general.plugins.cache import memcached
 from ansible_collections.community.general.plugins.cache.memcached import CacheModule as MemcachedCache
 
 
 def test_memcached_cachemodule():
     assert isinstance(cache_loader.get("community.general.memcached"), MemcachedCache)
+
+
+class FakeClient:
+    """In-memory stand-in for memcache.Client sharing one store, counting calls."""
+
+    store: dict[str, t.Any] = {}
+    expiry: dict[str, int] = {}
+    calls: list[tuple[str, int]] = []
+
+    def __init__(self, *args, **kwargs):
+        self.alive = True
+
+    def _call(self, name, size=0):
+        self.calls.append((name, size))
+
+    def get(self, key):
+        self._call("get")
+        return self.store.get(key)
+
+    def get_multi(self, keys, key_prefix=""):
+        self._call("get_multi")
+        return {key: self.store[key_prefix + key] for key in keys if key_prefix + key in self.store}
+
+    def set(self, key, value, time=0, min_compress_len=0):
+        self._call("set", len(pickle.dumps(value)))
+        self.store[key] = value
+        self.expiry[key] = time
+
+    def set_multi(self, mapping, time=0, key_prefix="", min_compress_len=0):
+        self._call("set_multi", len(pickle.dumps(mapping)))
+        self.store.update(mapping)
+        self.expiry.update(dict.fromkeys(mapping, time))
+
+    def add(self, key, value):
+        self._call("add")
+        self.store.setdefault(key, value)
+
+    def incr(self, key, delta=1):
+        self._call("incr")
+        if key not in self.store:
+            return None
+        self.store[key] = str(int(self.store[key]) + delta)
+        return int(self.store[key])
+
+    def delete(self, key):
+        self._call("delete")
+        self.store.pop(key, None)
+
+    def get_stats(self):
+        self._call("get_stats")
+        return [("server", {})] if self.alive else []
+
+    def disconnect_all(self):
+        self._call("disconnect_all")
+
+
+@pytest.fixture
+def fake_memcache(monkeypatch):
+    monkeypatch.setattr(FakeClient, "store", {})
+    monkeypatch.setattr(FakeClient, "expiry", {})
+    monkeypatch.setattr(FakeClient, "calls", [])
+    monkeypatch.setattr(memcached.memcache, "Client", FakeClient)
+    return FakeClient
+
+
+def _cache(**options):
+    return cache_loader.get("community.general.memcached", **options)
+
+
+def test_set_writes_constant_size(fake_memcache):
+    cache = _cache()
+    for i in range(500):
+        cache.set(f"host{i}", {"i": i})
+    fake_memcache.calls.clear()
+    cache.set("host500", {"i": 500})
+    # one set_multi with the value, a counter increment and one set_multi with a log entry,
+    # independent of the number of hosts
+    assert [name for name, dummy in fake_memcache.calls] == ["set_multi", "incr", "set_multi"]
+    assert fake_memcache.calls[0][1] < 300
+    assert fake_memcache.calls[2][1] < 300
+
+
+def test_bulk_writes(fake_memcache):
+    cache = _cache(_bulk_size=100, _bulk_interval=3600)
+    fake_memcache.calls.clear()
+    for i in range(1000):
+        cache.set(f"host{i}", {"i": i})
+    assert len(fake_memcache.calls) == 30
+
+
+def test_keys_are_shared(fake_memcache):
+    writer = _cache()
+    writer.set("host1", {"a": 1})
+    writer.set("host2", {"b": 2})
+    reader = _cache(_prefetch=True)
+    assert sorted(reader.keys()) == ["host1", "host2"]
+    fake_memcache.calls.clear()
+    assert reader.contains("host1")
+    assert reader.get("host1") == {"a": 1}
+    assert fake_memcache.calls == []
+
+    writer.delete("host1")
+    writer.set("host3", {"c": 3})
+    assert sorted(reader.keys()) == ["host2", "host3"]
+
+
+def test_log_compaction(fake_memcache, monkeypatch):
+    monkeypatch.setattr(memcached.CacheModuleKeys, "COMPACT_MIN_ENTRIES", 10)
+    cache = _cache()
+    for i in range(30):
+        cache.set("host1", {"i": i})
+    cache.keys()
+    assert fake_memcache.store[memcached.CacheModuleKeys.SNAPSHOT]["seq"] == 30
+
+    for key in [key for key in fake_memcache.store if key.startswith(memcached.CacheModuleKeys.ENTRY_PREFIX)]:
+        if key != memcached.CacheModuleKeys.SEQUENCE:
+            del fake_memcache.store[key]
+    assert _cache().keys() == ["host1"]
+
+
+def test_evicted_log_entry(fake_memcache, monkeypatch):
+    writer = _cache()
+    writer.set("host1", {"a": 1})
+    writer.set("host2", {"b": 2})
+    reader = _cache()
+    assert sorted(reader.keys()) == ["host1", "host2"]
+
+    writer.set("host3", {"c": 3})
+    del fake_memcache.store[memcached.CacheModuleKeys.ENTRY_PREFIX + "3"]
+    writer.set("host4", {"d": 4})
+    # without a snapshot covering it, the missing entry may still be written: keep the keys and wait
+    assert sorted(reader.keys()) == ["host1", "host2"]
+    assert sorted(_cache().keys()) == ["host1", "host2"]
+
+    monkeypatch.setattr(memcached.CacheModuleKeys, "GAP_TIMEOUT", 0)
+    assert sorted(reader.keys()) == ["host1", "host2", "host4"]
+
+
+def test_log_entries_do_not_expire(fake_memcache):
+    cache = _cache(_timeout=3600)
+    cache.set("host1", {"a": 1})
+    assert fake_memcache.expiry["ansible_factshost1"] == 3600
+    assert fake_memcache.expiry[memcached.CacheModuleKeys.ENTRY_PREFIX + "1"] == 0
+
+
+def test_evicted_log_entries_are_skipped_in_one_pass(fake_memcache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(memcached.time, "time", lambda: now[0])
+    writer = _cache()
+    reader = _cache()
+    for i in range(50):
+        writer.set(f"host{i}", {"i": i})
+    for seq in range(1, 51):
+        del fake_memcache.store[f"{memcached.CacheModuleKeys.ENTRY_PREFIX}{seq}"]
+    writer.set("host50", {"i": 50})
+    assert reader.keys() == []
+
+    now[0] += memcached.CacheModuleKeys.GAP_TIMEOUT
+    assert reader.keys() == ["host50"]
+
+
+def test_refresh_during_write(fake_memcache):
+    writer = _cache()
+    writer.set("host1", {"a": 1})
+    reader = _cache()
+    assert reader.keys() == ["host1"]
+
+    # the writer has reserved a log entry, but not written it yet
+    fake_memcache.store[memcached.CacheModuleKeys.SEQUENCE] = "2"
+    assert reader.keys() == ["host1"]
+    fake_memcache.store[memcached.CacheModuleKeys.SEQUENCE] = "1"
+
+    writer.set("host2", {"b": 2})
+    assert sorted(reader.keys()) == ["host1", "host2"]
+
+
+def test_legacy_keyset(fake_memcache):
+    writer = _cache()
+    writer.set("host1", {"a": 1})
+    # replace the log by a key set as written by previous versions
+    legacy = {key: time.time() for key in writer.keys()}
+    fake_memcache.store = {
+        key: value for key, value in fake_memcache.store.items() if not key.startswith("ansible_cache")
+    }
+    fake_memcache.store[memcached.CacheModuleKeys.PREFIX] = legacy
+    cache = _cache()
+    assert cache.keys() == ["host1"]
+    assert cache.get("host1") == {"a": 1}
+
+
+def test_pool_waits_for_free_connection(fake_memcache):
+    pool = memcached.ProxyClientPool(max_connections=1, pool_timeout=0.01)
+    connection = pool.get_connection()
+    with pytest.raises(RuntimeError, match="Timed out"):
+        pool.get_connection()
+    pool.release_connection(connection)
+    assert pool.get_connection() is connection
+
+
+def test_pool_health_check(fake_memcache):
+    pool = memcached.ProxyClientPool(health_check_interval=0)
+    connection = pool.get_connection()
+    pool.release_connection(connection)
+    connection.alive = False
+    fake_memcache.calls.clear()
+    time.sleep(0.01)
+    assert pool.get_connection() is connection
+    assert fake_memcache.calls == [("get_stats", 0), ("disconnect_all", 0)]
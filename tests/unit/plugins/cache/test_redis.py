@@ -11,6 +11,7 @@ pytest.importorskip("redis")
 
 from ansible.plugins.loader import cache_loader
 
+from ansible_collections.community.general.plugins.cache import redis as redis_cache
 from ansible_collections.community.general.plugins.cache.redis import CacheModule as RedisCache
 
 
@@ -24,3 +25,190 @@ def test_redis_cachemodule_2():
     # The _uri option is required for the redis plugin
     connection = "[::1]:6379:1"
     assert isinstance(cache_loader.get("community.general.redis", **{"_uri": connection}), RedisCache)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for StrictRedis that counts round trips."""
+
+    def __init__(self, *args, **kwargs):
+        self.data = {}
+        self.zsets = {}
+        self.round_trips = 0
+        self.fail_execute = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def _call(self, name, *args):
+        self.round_trips += 1
+        return getattr(self, f"_{name}")(*args)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self._call(name, *args, *kwargs.values())
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def _set(self, key, value):
+        self.data[key] = value if isinstance(value, bytes) else value.encode()
+
+    def _setex(self, key, ttl, value):
+        self._set(key, value)
+
+    def _exists(self, key):
+        return int(key in self.data)
+
+    def _delete(self, key):
+        self.data.pop(key, None)
+
+    def _zadd(self, name, mapping):
+        self.zsets.setdefault(name, {}).update(mapping)
+
+    def _zrem(self, name, key):
+        self.zsets.get(name, {}).pop(key, None)
+
+    def _zrank(self, name, key):
+        return 0 if key in self.zsets.get(name, {}) else None
+
+    def _zremrangebyscore(self, name, low, high):
+        zset = self.zsets.get(name, {})
+        for key in [k for k, score in zset.items() if low <= score <= high]:
+            del zset[key]
+
+    def _zrange(self, name, start, end):
+        return [key.encode() for key in self.zsets.get(name, {})]
+
+    def _scan_iter(self, match):
+        return [key.encode() for key in self.data if key.startswith(match.rstrip("*"))]
+
+
+class FakePipeline:
+    def __init__(self, db):
+        self.db = db
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        self.db.round_trips += 1
+        if self.db.fail_execute:
+            self.db.fail_execute = False
+            raise ConnectionError("connection lost")
+        return [getattr(self.db, f"_{name}")(*args) for name, args in self.commands]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    # make sure the plugin documentation is loaded before instantiating the class directly
+    cache_loader.get("community.general.redis", **{"_uri": "127.0.0.1:6379:1"})
+    db = FakeRedis()
+    monkeypatch.setattr(redis_cache, "StrictRedis", lambda *args, **kwargs: db)
+    return db
+
+
+def _cache(**options):
+    return cache_loader.get("community.general.redis", **{"_uri": "127.0.0.1:6379:1", **options})
+
+
+def test_redis_round_trips_per_1k_hosts(fake_redis):
+    cache = _cache()
+    for i in range(1000):
+        cache.set(f"host{i}", {"i": i})
+    assert fake_redis.round_trips == 2000
+
+
+def test_redis_bulk_writes(fake_redis):
+    cache = _cache(_bulk_size=100, _bulk_interval=3600)
+    for i in range(1000):
+        cache.set(f"host{i}", {"i": i})
+    assert fake_redis.round_trips == 10
+    assert len(fake_redis.data) == 1000
+
+
+def test_redis_bulk_pending_writes_are_visible(fake_redis):
+    cache = _cache(_bulk_size=100, _bulk_interval=3600)
+    cache.set("host1", {"a": 1})
+    assert fake_redis.round_trips == 0
+    assert cache.contains("host1")
+    assert cache.get("host1") == {"a": 1}
+    assert cache.keys() == ["host1"]
+    assert fake_redis.round_trips == 3
+
+
+def test_redis_bulk_writes_survive_a_failed_flush(fake_redis):
+    cache = _cache(_bulk_size=100, _bulk_interval=3600)
+    cache.set("host1", {"a": 1})
+    fake_redis.fail_execute = True
+    with pytest.raises(ConnectionError):
+        cache.keys()
+    assert fake_redis.data == {}
+    assert cache.contains("host1")
+
+    assert cache.keys() == ["host1"]
+    assert "ansible_factshost1" in fake_redis.data
+
+
+def test_redis_prefetch(fake_redis):
+    writer = _cache(_bulk_size=500, _bulk_interval=3600)
+    for i in range(1000):
+        writer.set(f"host{i}", {"i": i})
+    writer.keys()
+
+    fake_redis.round_trips = 0
+    cache = _cache(_prefetch=True, _bulk_size=500, _bulk_interval=3600)
+    for i in range(1000):
+        assert cache.contains(f"host{i}")
+        assert cache.get(f"host{i}") == {"i": i}
+    # zremrangebyscore, zrange and a single mget
+    assert fake_redis.round_trips == 3
+
+
+def test_redis_contains_checks_expiry_without_bulk_mode(fake_redis):
+    cache = _cache(_timeout=3600)
+    cache.set("host1", {"a": 1})
+    assert cache.contains("host1")
+    fake_redis.zsets[cache._keys_set]["host1"] = 0
+    assert not cache.contains("host1")
+
+
+def test_redis_bulk_mode_registers_one_atexit_handler(fake_redis, monkeypatch):
+    registered = []
+    monkeypatch.setattr(redis_cache.atexit, "register", registered.append)
+    monkeypatch.setattr(redis_cache, "_ATEXIT_REGISTERED", False)
+    caches = [_cache(_bulk_size=100, _bulk_interval=3600) for dummy in range(3)]
+    for i, cache in enumerate(caches):
+        cache.set(f"host{i}", {"i": i})
+    assert registered == [redis_cache._flush_bulk_instances]
+    registered[0]()
+    assert len(fake_redis.data) == 3
+
+
+def test_redis_without_keyset(fake_redis):
+    cache = _cache(_use_keyset=False)
+    cache.set("host1", {"a": 1})
+    assert fake_redis.zsets == {}
+    assert cache.keys() == ["host1"]
+
+    other = _cache(_use_keyset=False)
+    assert other.contains("host1")
+    assert not other.contains("host2")
+    other.delete("host1")
+    assert fake_redis.data == {}
+
+
+def test_redis_compression_reads_mixed_entries(fake_redis):
+    legacy = _cache()
+    legacy.set("old", {"a": 1})
+    compressed = _cache(_serializer="json", _compression="zlib")
+    compressed.set("new", {"b": 2})
+    assert sorted(value[:1] for value in fake_redis.data.values()) == [b"\x02", b"{"]
+
+    reader = _cache(_compression="zlib")
+    assert reader.get("old") == {"a": 1}
+    assert reader.get("new") == {"b": 2}
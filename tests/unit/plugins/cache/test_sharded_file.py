@@ -0,0 +1,108 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import os
+import time
+
+from ansible.plugins.loader import cache_loader
+
+from ansible_collections.community.general.plugins.cache.sharded_file import CacheModule as ShardedFileCache
+
+
+def _entry_files(path):
+    return [
+        os.path.relpath(os.path.join(dirpath, name), path)
+        for dirpath, _dirnames, filenames in os.walk(path)
+        for name in filenames
+        if dirpath != str(path)
+    ]
+
+
+def _cache(path, **options):
+    return cache_loader.get("community.general.sharded_file", **{"_uri": str(path), **options})
+
+
+def test_sharded_file_cachemodule(tmp_path):
+    assert isinstance(_cache(tmp_path), ShardedFileCache)
+
+
+def test_set_get_delete(tmp_path):
+    cache = _cache(tmp_path, _prefix="facts_")
+    cache.set("host1", {"a": 1})
+    cache.set("host2", {"b": 2})
+    assert sorted(cache.keys()) == ["host1", "host2"]
+    assert cache.contains("host1")
+    assert cache.get("host2") == {"b": 2}
+
+    files = _entry_files(tmp_path)
+    assert len(files) == 2
+    for file in files:
+        shard, name = file.split(os.sep)
+        assert len(shard) == 2
+        assert name.startswith("facts_")
+
+    cache.delete("host1")
+    assert cache.keys() == ["host2"]
+    assert not cache.contains("host1")
+
+
+def test_entries_are_shared_between_instances(tmp_path):
+    writer = _cache(tmp_path)
+    reader = _cache(tmp_path)
+    writer.set("host1", {"a": 1})
+    assert reader.contains("host1")
+    assert reader.get("host1") == {"a": 1}
+    writer.delete("host1")
+    assert reader.keys() == []
+
+
+def test_keys_do_not_stat_entries(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    for i in range(20):
+        cache.set(f"host{i}", {"i": i})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected filesystem access")
+
+    monkeypatch.setattr(os, "listdir", fail)
+    monkeypatch.setattr(os, "stat", fail)
+    assert len(cache.keys()) == 20
+    assert cache.contains("host5")
+
+
+def test_expiry(tmp_path):
+    cache = _cache(tmp_path, _timeout=10)
+    cache.set("host1", {"a": 1})
+    assert cache.keys() == ["host1"]
+    for name in list(cache._index):
+        cache._index[name] = (time.time() - 20, 1)
+    assert cache.keys() == []
+    assert not cache.contains("host1")
+
+
+def test_index_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(ShardedFileCache, "COMPACT_MIN_RECORDS", 10)
+    cache = _cache(tmp_path)
+    for i in range(30):
+        cache.set("host1", {"i": i})
+    assert cache.keys() == ["host1"]
+    with open(tmp_path / ".index", "rb") as f:
+        assert len(f.readlines()) == 1
+    assert _cache(tmp_path).get("host1") == {"i": 29}
+
+
+def test_rebuild_missing_index(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("host1", {"a": 1})
+    os.remove(tmp_path / ".index")
+    assert _cache(tmp_path).keys() == ["host1"]
+
+
+def test_compressed_entries(tmp_path):
+    cache = _cache(tmp_path, _compression="zlib")
+    cache.set("host1", {"a": "x" * 1000})
+    assert os.path.getsize(tmp_path / _entry_files(tmp_path)[0]) < 200
+    assert _cache(tmp_path).get("host1") == {"a": "x" * 1000}
@@ -0,0 +1,117 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import gc
+import sqlite3
+import time
+
+import pytest
+from ansible.plugins.loader import cache_loader
+
+from ansible_collections.community.general.plugins.cache import sqlite as sqlite_cache
+from ansible_collections.community.general.plugins.cache.sqlite import CacheModule as SqliteCache
+
+
+def _cache(path, **options):
+    return cache_loader.get("community.general.sqlite", **{"_uri": str(path / "cache.db"), **options})
+
+
+def _rows(path):
+    with sqlite3.connect(str(path / "cache.db")) as conn:
+        return conn.execute("SELECT key, expires FROM ansible_cache").fetchall()
+
+
+def test_sqlite_cachemodule(tmp_path):
+    assert isinstance(_cache(tmp_path), SqliteCache)
+
+
+def test_set_get_delete(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("host1", {"a": 1})
+    cache.set("host2", {"b": 2})
+    assert sorted(cache.keys()) == ["host1", "host2"]
+    assert cache.contains("host1")
+    assert cache.get("host2") == {"b": 2}
+    cache.delete("host1")
+    assert cache.keys() == ["host2"]
+    assert not cache.contains("host1")
+    cache.flush()
+    assert cache.keys() == []
+
+
+def test_writes_are_batched(tmp_path):
+    cache = _cache(tmp_path, _batch_size=10, _batch_interval=3600)
+    for i in range(15):
+        cache.set(f"host{i}", {"i": i})
+    assert len(_rows(tmp_path)) == 10
+    assert cache.get("host14") == {"i": 14}
+
+    reader = _cache(tmp_path)
+    assert not reader.contains("host14")
+    cache.keys()
+    assert reader.contains("host14")
+    assert reader.get("host14") == {"i": 14}
+
+
+def test_expiry(tmp_path):
+    cache = _cache(tmp_path, _timeout=10, _batch_size=1)
+    cache.set("host1", {"a": 1})
+    with sqlite3.connect(str(tmp_path / "cache.db")) as conn:
+        conn.execute("UPDATE ansible_cache SET expires = ?", (time.time() - 1,))
+
+    reader = _cache(tmp_path)
+    assert not reader.contains("host1")
+    assert reader.keys() == []
+    assert _rows(tmp_path) == []
+
+
+def test_no_expiry(tmp_path):
+    cache = _cache(tmp_path, _timeout=0, _batch_size=1)
+    cache.set("host1", {"a": 1})
+    assert [expires for dummy, expires in _rows(tmp_path)] == [None]
+    assert _cache(tmp_path).keys() == ["host1"]
+
+
+def test_prefix(tmp_path):
+    _cache(tmp_path, _prefix="one_", _batch_size=1).set("host1", {"a": 1})
+    other = _cache(tmp_path, _prefix="two_")
+    other.set("host2", {"b": 2})
+    assert other.keys() == ["host2"]
+    other.flush()
+    assert _cache(tmp_path, _prefix="one_").keys() == ["host1"]
+
+
+def test_pending_writes_survive_a_locked_database(tmp_path):
+    cache = _cache(tmp_path, _batch_size=100, _batch_interval=3600, _busy_timeout=0.1)
+    cache.set("host1", {"a": 1})
+
+    locker = sqlite3.connect(str(tmp_path / "cache.db"), isolation_level=None)
+    locker.execute("BEGIN IMMEDIATE")
+    with pytest.raises(sqlite3.OperationalError):
+        cache._commit()
+    locker.execute("ROLLBACK")
+    locker.close()
+
+    assert _rows(tmp_path) == []
+    cache._commit()
+    assert [key for key, dummy in _rows(tmp_path)] == ["ansible_factshost1"]
+
+
+def test_one_atexit_handler_per_process(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(sqlite_cache.atexit, "register", registered.append)
+    monkeypatch.setattr(sqlite_cache, "_ATEXIT_REGISTERED", False)
+    caches = [_cache(tmp_path, _batch_size=100, _batch_interval=3600) for dummy in range(3)]
+    for i, cache in enumerate(caches):
+        cache.set(f"host{i}", {"i": i})
+    assert registered == [sqlite_cache._commit_instances]
+    registered[0]()
+    assert len(_rows(tmp_path)) == 3
+
+    # the handler does not keep the instances alive
+    del cache, caches
+    gc.collect()
+    assert not any(instance._path == str(tmp_path / "cache.db") for instance in sqlite_cache._INSTANCES)
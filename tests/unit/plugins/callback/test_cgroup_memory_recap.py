@@ -0,0 +1,77 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from ansible_collections.community.general.plugins.callback.cgroup_memory_recap import (
+    CgroupFile,
+    MemProf,
+    RingBuffer,
+    parse_cpu_stat,
+    parse_io_stat,
+    percentile,
+)
+
+CPU_STAT = """usage_usec 2500000
+user_usec 2000000
+system_usec 500000
+"""
+
+IO_STAT = """8:0 rbytes=1024 wbytes=4096 rios=1 wios=2 dbytes=0 dios=0
+259:0 rbytes=100 wbytes=0 rios=1 wios=0 dbytes=0 dios=0
+"""
+
+
+def test_parse_stat_files():
+    assert parse_cpu_stat(CPU_STAT) == 2.5
+    assert parse_io_stat(IO_STAT) == 5220
+    assert parse_io_stat("") == 0
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile([7], 95) == 7
+
+
+def test_ring_buffer_keeps_last_samples():
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+    assert sorted(buffer.values()) == [2.0, 3.0, 4.0]
+    buffer.clear()
+    assert len(buffer.values()) == 0
+
+
+def test_cgroup_file_is_reread(tmp_path):
+    path = tmp_path / "memory.current"
+    path.write_text("1024\n")
+    cgroup_file = CgroupFile(str(path))
+    try:
+        assert cgroup_file.read_int() == 1024
+        path.write_text("2048\n")
+        assert cgroup_file.read_int() == 2048
+    finally:
+        cgroup_file.close()
+
+
+def test_memprof_switch(tmp_path):
+    path = tmp_path / "memory.current"
+    path.write_text("1024\n")
+    cgroup_file = CgroupFile(str(path))
+    memprof = MemProf(cgroup_file, interval=60, buffer_size=16)
+    try:
+        assert memprof.switch("task1") is None
+        path.write_text("4096\n")
+        task, samples, peak = memprof.switch("task2")
+        assert task == "task1"
+        assert sorted(samples) == [1024.0, 4096.0]
+        assert peak == 4096
+        task, samples, peak = memprof.switch()
+        assert task == "task2"
+        assert peak == 4096
+        assert memprof.switch() is None
+    finally:
+        cgroup_file.close()
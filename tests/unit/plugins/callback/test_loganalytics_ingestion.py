@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import time
 import unittest
@@ -88,3 +89,49 @@ class TestAzureLogAnalyticsIngestion(unittest.TestCase):
             assert url.scheme + "://" + url.netloc == self.dce_url
 
             assert json.loads(open_url_mock.call_args_list[i].kwargs.get("data"))[0].get("TaskName") == result
+
+    @unittest.mock.patch(
+        "ansible_collections.community.general.plugins.callback.loganalytics_ingestion.open_url", autospec=True
+    )
+    def test_sending_batched_data(self, open_url_mock):
+        """
+        Tests that the queued events are sent as one JSON array when the shipper is stopped.
+        """
+        open_url_mock.return_value.read.return_value = self.fake_access_token
+        self.loganalytics = AzureLogAnalyticsIngestionSource(
+            self.dce_url,
+            self.dcr_id,
+            3,
+            True,
+            self.client_id,
+            self.client_secret,
+            self.tenant_id,
+            self.stream_name,
+            False,
+            False,
+            2,
+            "community.general.loganalytics_ingestion",
+        )
+        self.loganalytics.start_shipper(interval=60, compress=True)
+
+        results = ["foo", "bar", "biz"]
+        for result in results:
+            host_mock = unittest.mock.Mock("host_mock")
+            host_mock.name = "fake-name"
+            task_mock = unittest.mock.Mock("task_mock")
+            task_mock._role = "fake-role"
+            task_mock.get_name = lambda r=result: r
+
+            task_result = TaskResult(
+                host=host_mock, task=task_mock, return_data={}, task_fields={"action": "fake-action", "args": {}}
+            )
+            self.loganalytics.send_to_loganalytics("fake-playbook", task_result, "OK")
+
+        assert open_url_mock.call_count == 1
+        self.loganalytics.stop_shipper()
+        assert open_url_mock.call_count == 2
+
+        kwargs = open_url_mock.call_args_list[1].kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        records = json.loads(gzip.decompress(kwargs["data"]))
+        assert [record["TaskName"] for record in records] == results
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import json
 import unittest
 from collections import OrderedDict
 from unittest.mock import MagicMock, Mock, patch
@@ -93,6 +94,34 @@ class TestOpentelemetry(unittest.TestCase):
         self.assertEqual(host_data.name, "include")
         self.assertEqual(host_data.status, "ok")
 
+    def test_finish_task_not_sampled(self):
+        tasks_data = OrderedDict()
+
+        self.opentelemetry.start_task(
+            tasks_data, False, "myplay", self.mock_task, self.mock_host, sampling_filter=["otherplay: *"]
+        )
+
+        task_data = tasks_data["myuuid"]
+        self.assertFalse(task_data.sampled)
+
+        host_data = self.opentelemetry.finish_task(tasks_data, "ok", self.my_task_result, "")
+        self.assertIsNone(host_data)
+        self.assertEqual(len(task_data.host_data), 0)
+
+    def test_is_sampled(self):
+        test_cases = (
+            ([], 1.0, True),
+            (["myplay: *"], 1.0, True),
+            (["*: mytask"], 1.0, True),
+            (["myplay: other*"], 1.0, False),
+            (["otherplay: *", "*: my*"], 1.0, True),
+            ([], 0.0, False),
+        )
+
+        for tc in test_cases:
+            result = self.opentelemetry.is_sampled("myplay", "mytask", "myuuid", tc[0], tc[1])
+            self.assertEqual(result, tc[2])
+
     @patch("ansible_collections.community.general.plugins.callback.opentelemetry.Status", create=True)
     @patch("ansible_collections.community.general.plugins.callback.opentelemetry.StatusCode", create=True)
     def test_update_span_data(self, mock_status_code, mock_status):
@@ -242,3 +271,21 @@ def generate_test_data(exception=None, msg=None, stderr=None, failed=False):
         res_data["stderr"] = stderr
     res_data["failed"] = failed
     return res_data
+
+
+def test_streaming_ends_the_span_of_each_playbook(tmp_path):
+    pytest.importorskip("opentelemetry.sdk")
+    from ansible.plugins.loader import callback_loader
+
+    spans_file = tmp_path / "spans.json"
+    callback = callback_loader.get("community.general.opentelemetry")
+    callback.set_options(direct={"streaming": True, "store_spans_in_file": str(spans_file)})
+    # with import_playbook, v2_playbook_on_start is called for every playbook, v2_playbook_on_stats only once
+    for name in ("one.yml", "two.yml"):
+        callback.v2_playbook_on_start(Mock(_file_name=name))
+    provider = callback.opentelemetry.tracer_provider
+    callback.v2_playbook_on_stats(None)
+
+    assert callback.opentelemetry.tracer_provider is provider
+    spans = json.loads(spans_file.read_text())["spans"]
+    assert [span["name"] for span in spans] == ["one.yml", "two.yml"]
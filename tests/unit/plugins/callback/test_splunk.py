@@ -14,6 +14,7 @@ from ansible.executor.task_result import TaskResult
 from ansible.release import __version__ as ansible_release
 
 from ansible_collections.community.general.plugins.callback.splunk import SplunkHTTPCollectorSource
+from ansible_collections.community.general.plugins.plugin_utils._event_shipping import EventShipper
 
 if tuple(int(x) for x in ansible_release.split(".")[:2]) >= (2, 21):
     # https://github.com/ansible/ansible/issues/86761
@@ -80,3 +81,33 @@ class TestSplunkClient(unittest.TestCase):
         self.assertEqual(sent_data["event"]["timestamp"], "2020-12-01 00:00:00 +0000")
         self.assertEqual(sent_data["event"]["host"], "my-host")
         self.assertEqual(sent_data["event"]["ip_address"], "1.2.3.4")
+
+    @patch("ansible_collections.community.general.plugins.callback.splunk.open_url")
+    def test_batched_events(self, open_url_mock):
+        self.splunk.shipper = EventShipper(
+            "splunk",
+            lambda key, body, headers: self.splunk.post("endpoint", "token", True, body, headers=headers),
+            b"\n".join,
+            max_events=10,
+            interval=60,
+        )
+        for i in range(25):
+            result = TaskResult(
+                host=self.mock_host, task=self.mock_task, return_data={"i": i}, task_fields={"args": {}}
+            )
+            self.splunk.send_event(
+                url="endpoint",
+                authtoken="token",
+                validate_certs=True,
+                include_milliseconds=False,
+                batch=None,
+                state="OK",
+                result=result,
+                runtime=1,
+            )
+        self.splunk.shipper.close()
+
+        self.assertEqual(open_url_mock.call_count, 3)
+        events = [json.loads(line) for call in open_url_mock.call_args_list for line in call[0][1].split(b"\n")]
+        self.assertEqual([event["event"]["ansible_result"]["i"] for event in events], list(range(25)))
+        self.assertEqual(open_url_mock.call_args[1]["headers"]["Authorization"], "Splunk token")
@@ -0,0 +1,52 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import pytest
+from ansible.errors import AnsibleFilterError
+from ansible_collections.community.internal_test_tools.tests.unit.utils.trust import make_trusted
+
+from ansible_collections.community.general.plugins.filter.json_query import HAS_LIB, _compile, json_query
+
+if not HAS_LIB:
+    pytest.skip("jmespath is not installed", allow_module_level=True)
+
+import jmespath.functions  # noqa: E402
+
+DATA = {
+    "servers": [
+        {"name": make_trusted("server11"), "cluster": "cluster1", "tags": ["web"]},
+        {"name": make_trusted("server21"), "cluster": "cluster2", "tags": [make_trusted("db"), "web"]},
+    ]
+}
+
+
+def test_json_query_ansible_types():
+    assert json_query(DATA, "servers[?starts_with(name, 'server1')].name") == ["server11"]
+    assert json_query(DATA, "servers[?contains(tags, 'db')].cluster") == ["cluster2"]
+    assert json_query(DATA, "join(',', servers[].name)") == "server11,server21"
+    assert json_query(DATA, "length(servers[0])") == 3
+
+
+def test_json_query_does_not_change_jmespath():
+    reverse_types_map = dict(jmespath.functions.REVERSE_TYPES_MAP)
+    for _i in range(3):
+        json_query(DATA, "servers[?starts_with(name, 'server1')].name")
+    assert reverse_types_map == jmespath.functions.REVERSE_TYPES_MAP
+
+
+def test_json_query_compiles_once():
+    _compile.cache_clear()
+    for _i in range(10):
+        json_query(DATA, "servers[].cluster")
+    assert _compile.cache_info().misses == 1
+    assert _compile.cache_info().hits == 9
+
+
+def test_json_query_errors():
+    with pytest.raises(AnsibleFilterError, match="JMESPathError"):
+        json_query(DATA, "servers[")
+    with pytest.raises(AnsibleFilterError, match="JMESPathError"):
+        json_query(DATA, "starts_with(servers, 'a')")
@@ -0,0 +1,72 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import pytest
+
+from ansible_collections.community.general.plugins.filter.lists import (
+    freeze,
+    lists_difference,
+    lists_intersect,
+    lists_symmetric_difference,
+    lists_union,
+    remove_duplicates,
+)
+
+A = [{"name": "eth0", "addrs": ["10.0.0.1"]}, {"name": "eth1", "addrs": []}, {"name": "eth0", "addrs": ["10.0.0.1"]}]
+B = [{"addrs": [], "name": "eth1"}, {"name": "eth2", "addrs": ["10.0.0.2"]}]
+
+
+@pytest.mark.parametrize(
+    "left, right, equal",
+    [
+        ({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}, True),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}, True),
+        ({"a": 1}, {"a": True}, True),
+        ({1}, frozenset([1]), True),
+        ([1], (1,), False),
+        ([1, [2]], (1, [2]), False),
+        ({"a": [1]}, {"a": (1,)}, False),
+        ([1, 2], [2, 1], False),
+    ],
+)
+def test_freeze(left, right, equal):
+    assert (freeze(left) == freeze(right)) is equal
+    assert (left == right) is equal
+    if equal:
+        assert hash(freeze(left)) == hash(freeze(right))
+
+
+def test_freeze_unsupported():
+    class Unhashable:
+        __hash__ = None
+
+    with pytest.raises(TypeError):
+        freeze([Unhashable()])
+
+
+def test_lists_of_dicts():
+    assert remove_duplicates(A) == A[:2]
+    assert lists_union(A, B) == A[:2] + B[1:]
+    assert lists_intersect(A, B) == [A[1]]
+    assert lists_difference(A, B) == [A[0]]
+    assert lists_symmetric_difference(A, B) == [A[0], B[1]]
+
+
+def test_lists_with_unsupported_values():
+    class Unhashable:
+        __hash__ = None
+
+        def __init__(self, value):
+            self.value = value
+
+        def __eq__(self, other):
+            return isinstance(other, Unhashable) and self.value == other.value
+
+    assert lists_intersect([Unhashable(1), Unhashable(2), {"a": 1}], [Unhashable(2), {"a": 1}]) == [
+        Unhashable(2),
+        {"a": 1},
+    ]
+    assert lists_difference([Unhashable(1), Unhashable(2)], [Unhashable(2)]) == [Unhashable(1)]
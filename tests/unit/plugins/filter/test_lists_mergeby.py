@@ -0,0 +1,70 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.community.general.plugins.filter.lists_mergeby import lists_mergeby
+
+LIST1 = [{"name": "b", "value": 1, "tags": ["x"]}, {"name": "a", "value": 1, "sub": {"x": 1}}]
+LIST2 = [{"name": "a", "tags": ["y"], "sub": {"y": 2}}, {"name": "c", "value": 3}, {"value": 4}]
+LIST3 = [{"name": "a", "value": 3, "tags": ["z"]}, {"name": "b", "tags": "z"}]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        (
+            {},
+            [
+                {"name": "a", "value": 3, "sub": {"y": 2}, "tags": ["z"]},
+                {"name": "b", "value": 1, "tags": "z"},
+                {"name": "c", "value": 3},
+            ],
+        ),
+        (
+            {"recursive": True, "list_merge": "append"},
+            [
+                {"name": "a", "value": 3, "sub": {"x": 1, "y": 2}, "tags": ["y", "z"]},
+                {"name": "b", "value": 1, "tags": "z"},
+                {"name": "c", "value": 3},
+            ],
+        ),
+        (
+            {"list_merge": "keep"},
+            [
+                {"name": "a", "value": 3, "sub": {"y": 2}, "tags": ["y"]},
+                {"name": "b", "value": 1, "tags": "z"},
+                {"name": "c", "value": 3},
+            ],
+        ),
+    ],
+)
+def test_lists_mergeby(kwargs, expected):
+    lists = deepcopy([LIST1, LIST2, LIST3])
+
+    result = lists_mergeby(*lists, "name", **kwargs)
+
+    assert result == expected
+    assert [list(elem) for elem in result] == [list(elem) for elem in expected]
+    assert lists == [LIST1, LIST2, LIST3]
+
+
+def test_lists_mergeby_from_high_to_low_priority():
+    # "y" is replaced by ["z"] first, which is then merged with ["x"]
+    lists = [[{"name": "a", "tags": ["x"]}], [{"name": "a", "tags": "y"}], [{"name": "a", "tags": ["z"]}]]
+
+    assert lists_mergeby(*lists, "name", list_merge="keep") == [{"name": "a", "tags": ["x"]}]
+    assert lists_mergeby(*lists, "name", list_merge="append") == [{"name": "a", "tags": ["x", "z"]}]
+
+
+def test_lists_mergeby_errors():
+    with pytest.raises(AnsibleFilterError, match="must be dictionaries"):
+        lists_mergeby(LIST1, ["a"], "name")
+    with pytest.raises(AnsibleFilterError, match="'list_merge' must be one of"):
+        lists_mergeby(LIST1, LIST2, "name", list_merge="merge")
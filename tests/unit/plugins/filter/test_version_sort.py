@@ -0,0 +1,50 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import pytest
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.community.general.plugins.filter.version_sort import version_sort
+from ansible_collections.community.general.plugins.module_utils._version import LooseVersion
+
+VERSIONS = [
+    "a-1.9.rpm",
+    "a-1.10-1.rpm",
+    "a-1.09.rpm",
+    "b-1.01.rpm",
+    "a-2.1-0.rpm",
+    "a-1.10-0.rpm",
+    "a-1.10-0.rpm",
+    "a-1.2b3.rpm",
+    "a-1.2.rpm",
+]
+
+
+def test_version_sort_like_loose_version():
+    assert version_sort(VERSIONS) == sorted(VERSIONS, key=LooseVersion)
+    assert version_sort(VERSIONS, reverse=True) == sorted(VERSIONS, key=LooseVersion, reverse=True)
+
+
+def test_version_sort_mixed_components():
+    # LooseVersion cannot compare 1 with "a"; numbers sort before strings
+    assert version_sort(["1.a", "1.2", "1"]) == ["1", "1.2", "1.a"]
+
+
+def test_version_sort_unique():
+    assert version_sort(VERSIONS, unique=True) == sorted(dict.fromkeys(VERSIONS), key=LooseVersion)
+
+
+@pytest.mark.parametrize("latest_n", [0, 1, 3, len(VERSIONS), len(VERSIONS) + 1])
+def test_version_sort_latest_n(latest_n):
+    expected = sorted(VERSIONS, key=LooseVersion)
+    assert version_sort(VERSIONS, latest_n=latest_n) == expected[len(expected) - min(latest_n, len(expected)) :]
+    expected = sorted(VERSIONS, key=LooseVersion, reverse=True)
+    assert version_sort(VERSIONS, reverse=True, latest_n=latest_n) == expected[:latest_n]
+
+
+def test_version_sort_invalid_latest_n():
+    with pytest.raises(AnsibleFilterError, match="latest_n must be a non-negative integer"):
+        version_sort(VERSIONS, latest_n=-1)
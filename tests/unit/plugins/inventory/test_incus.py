@@ -181,3 +181,34 @@ def test_build_inventory_fqdn_from_host_domain(inventory, mocker):
     assert len(inventory.inventory.groups["incus_r3"].child_groups) == 2
     assert len(inventory.inventory.groups["incus_r3_proj1"].hosts) == 1
     assert len(inventory.inventory.groups["incus_r3_proj2"].hosts) == 2
+
+
+def test_populate_from_cached_remotes(mocker):
+    get_option = _build_get_option(
+        {
+            "default_groups": True,
+            "remotes": ["r1", "r3:proj2"],
+            "filters": ["status=running"],
+            "host_fqdn": True,
+        },
+    )
+    plugin = InventoryModule()
+    plugin.inventory = InventoryData()
+    plugin.templar = Templar(loader=DataLoader())
+    plugin.get_option = mocker.MagicMock(side_effect=get_option)
+    plugin._run_incus = mocker.MagicMock(side_effect=run_incus)
+    remotes = plugin.get_remotes()
+
+    assert [remote["name"] for remote in remotes] == ["r1", "r3"]
+    assert list(remotes[1]["projects"]) == ["proj2"]
+
+    # building the inventory from the (cached) result does not run incus again
+    plugin._run_incus = mocker.MagicMock(side_effect=AssertionError)
+    plugin.populate(remotes)
+
+    assert sorted(plugin.inventory.groups["all"].hosts, key=lambda host: host.name) == [
+        plugin.inventory.get_host("c1.default.r1"),
+        plugin.inventory.get_host("c4.proj2.r3"),
+        plugin.inventory.get_host("c5.proj2.r3"),
+    ]
+    assert len(plugin.inventory.groups["incus_r3_proj2"].hosts) == 2
@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+import copy
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 from ansible.inventory.data import InventoryData
 
@@ -120,3 +123,119 @@ def test_build_inventory_groups_with_no_groupselection(inventory):
         if generated_data[key] != value:
             eq = False
     assert eq
+
+
+class FakeLXDClient:
+    """Serves the instances of the test data like a LXD server, optionally without recursion=2 support."""
+
+    def __init__(self, data, recursion=True, networks=None):
+        self.data = data
+        self.recursion = recursion
+        self.networks = networks or {}
+        self.requests = []
+
+    def do(self, method, url):
+        self.requests.append(url)
+        parsed = urlparse(url)
+        path = parsed.path.split("/")[2:]
+        if path == ["networks"]:
+            return {"type": "sync", "metadata": [f"/1.0/networks/{name}" for name in self.networks]}
+        if path[0] == "networks":
+            return copy.deepcopy(self.networks[path[1]]["state"])
+        if path == ["instances"]:
+            recursion = parse_qs(parsed.query).get("recursion", ["0"])[0]
+            if recursion == "1" or (recursion == "2" and self.recursion):
+                instances = []
+                for instance in self.data.values():
+                    metadata = copy.deepcopy(instance["instances"]["metadata"])
+                    if recursion == "2":
+                        metadata["state"] = copy.deepcopy(instance["state"]["metadata"])
+                    instances.append(metadata)
+                return {"type": "sync", "metadata": instances}
+            return {"type": "sync", "metadata": [f"/1.0/instances/{name}" for name in self.data]}
+        if len(path) == 2:
+            return copy.deepcopy(self.data[path[1]]["instances"])
+        return copy.deepcopy(self.data[path[1]]["state"])
+
+
+@pytest.fixture
+def instances(inventory):
+    data = copy.deepcopy(inventory.data["instances"])
+    for i in range(20):
+        instance = copy.deepcopy(data["vlantest"])
+        instance["instances"]["metadata"]["name"] = f"instance{i}"
+        data[f"instance{i}"] = instance
+    inventory.data = {}
+    inventory.project = None
+    return data
+
+
+def test_get_all_instance_data_recursion(inventory, instances):
+    inventory.socket = FakeLXDClient(instances)
+    inventory.get_all_instance_data()
+
+    assert inventory.socket.requests == ["/1.0/instances?recursion=2"]
+    assert list(inventory.data["instances"]) == list(instances)
+    for name, instance in instances.items():
+        assert inventory.data["instances"][name]["instances"]["metadata"] == instance["instances"]["metadata"]
+        assert inventory.data["instances"][name]["state"]["metadata"] == instance["state"]["metadata"]
+
+
+def test_get_all_instance_data_without_recursion(mocker, inventory, instances):
+    inventory.socket = FakeLXDClient(instances, recursion=False)
+    clients = []
+
+    def connect():
+        clients.append(FakeLXDClient(instances))
+        return clients[-1]
+
+    mocker.patch.object(inventory, "_connect_to_socket", side_effect=connect)
+    inventory.get_all_instance_data()
+
+    # the instances are fetched over at most FETCH_WORKERS additional connections
+    assert 1 <= len(clients) <= inventory.FETCH_WORKERS
+    assert sum(len(client.requests) for client in clients) == 2 * len(instances)
+    assert list(inventory.data["instances"]) == list(instances)
+    for name, instance in instances.items():
+        assert inventory.data["instances"][name] == instance
+
+
+def test_revalidate_instance_data(mocker, inventory, instances):
+    networks = {"lxdbr0": {"state": {"type": "sync", "metadata": {"vlan": None}}}}
+    inventory.data = {
+        "instances": copy.deepcopy(instances),
+        "networks": {},
+    }
+    del instances["instance0"]
+    instances["instance1"]["instances"]["metadata"]["status"] = "Stopped"
+    instances["instance1"]["state"]["metadata"]["network"] = None
+    instances["new"] = copy.deepcopy(instances["instance2"])
+    instances["new"]["instances"]["metadata"]["name"] = "new"
+    inventory.socket = FakeLXDClient(instances, networks=networks)
+    clients = []
+
+    def connect():
+        clients.append(FakeLXDClient(instances))
+        return clients[-1]
+
+    mocker.patch.object(inventory, "_connect_to_socket", side_effect=connect)
+
+    assert inventory.revalidate_instance_data() is True
+    assert inventory.socket.requests == [
+        "/1.0/instances?recursion=1",
+        "/1.0/networks",
+        "/1.0/networks/lxdbr0/state?project=None",
+    ]
+    fetched = sorted(url for client in clients for url in client.requests)
+    assert fetched == [
+        "/1.0/instances/instance1/state?project=None",
+        "/1.0/instances/instance1?project=None",
+        "/1.0/instances/new/state?project=None",
+        "/1.0/instances/new?project=None",
+    ]
+    assert inventory.data["instances"] == instances
+    assert inventory.data["networks"] == networks
+
+    inventory.socket = FakeLXDClient(instances, networks=networks)
+    assert inventory.revalidate_instance_data() is False
+    assert inventory.socket.requests == ["/1.0/instances?recursion=1", "/1.0/networks"]
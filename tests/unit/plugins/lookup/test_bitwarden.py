@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+import os
 import re
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -12,7 +14,11 @@ from ansible.errors import AnsibleError
 from ansible.parsing.ajson import AnsibleJSONEncoder
 from ansible.plugins.loader import lookup_loader
 
-from ansible_collections.community.general.plugins.lookup.bitwarden import Bitwarden, BitwardenException
+from ansible_collections.community.general.plugins.lookup.bitwarden import (
+    HAS_CRYPTOGRAPHY,
+    Bitwarden,
+    BitwardenException,
+)
 
 MOCK_COLLECTION_ID = "3b12a9da-7c49-40b8-ad33-aede017a7ead"
 MOCK_ORGANIZATION_ID = "292ba0c6-f289-11ee-9301-ef7b639ccd2a"
@@ -189,6 +195,16 @@ class LoggedOutMockBitwarden(MockBitwarden):
     unlocked = False
 
 
+class CountingMockBitwarden(MockBitwarden):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def _run(self, args, stdin=None, expected_rc=0):
+        self.calls.append(args[:2])
+        return super()._run(args, stdin=stdin, expected_rc=expected_rc)
+
+
 class TestLookupModule(unittest.TestCase):
     def setUp(self):
         self.lookup = lookup_loader.get("community.general.bitwarden")
@@ -298,3 +314,43 @@ class TestLookupModule(unittest.TestCase):
         with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
             self.lookup.run([], sync=True)
             self.assertTrue(mock_bitwarden.synced)
+
+    def test_bitwarden_plugin_cache(self):
+        mock_bitwarden = CountingMockBitwarden()
+        with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+            self.assertEqual(
+                [["passwordA3"], ["b", "d"], []],
+                self.lookup.run(["a_test", "dupe_name", "not_here"], field="password", cache=True),
+            )
+            self.assertEqual([[MOCK_RECORDS[0]]], self.lookup.run([MOCK_RECORDS[0]["id"]], search="id", cache=True))
+            self.assertEqual(
+                [[MOCK_RECORDS[2]]],
+                self.lookup.run(["dupe_name"], organization_id=MOCK_ORGANIZATION_ID, cache=True),
+            )
+        # one list per organization, no call per term
+        self.assertEqual([["list", "items"], ["list", "items"]], mock_bitwarden.calls)
+
+    @unittest.skipUnless(HAS_CRYPTOGRAPHY, "cryptography is not installed")
+    def test_bitwarden_plugin_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = os.path.join(tmpdir, "cache")
+            options = dict(field="password", cache=True, cache_file=cache_file, bw_session="session")
+
+            mock_bitwarden = CountingMockBitwarden()
+            with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+                self.assertEqual([["passwordA3"]], self.lookup.run(["a_test"], **options))
+            self.assertEqual([["list", "items"]], mock_bitwarden.calls)
+            with open(cache_file, "rb") as f:
+                self.assertNotIn(b"passwordA3", f.read())
+
+            # a new process reads the file
+            mock_bitwarden = CountingMockBitwarden()
+            with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+                self.assertEqual([["passwordA3"]], self.lookup.run(["a_test"], **options))
+            self.assertEqual([], mock_bitwarden.calls)
+
+            # another session key cannot use it
+            mock_bitwarden = CountingMockBitwarden()
+            with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+                self.assertEqual([["passwordA3"]], self.lookup.run(["a_test"], **dict(options, bw_session="other")))
+            self.assertEqual([["list", "items"]], mock_bitwarden.calls)
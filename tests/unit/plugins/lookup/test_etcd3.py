@@ -24,7 +24,10 @@ class FakeKVMetadata:
 
 
 class FakeEtcd3Client(MagicMock):
+    prefix_reads = 0
+
     def get_prefix(self, key):
+        FakeEtcd3Client.prefix_reads += 1
         for i in range(1, 4):
             yield self.get(f"{key}_{i}")
 
@@ -35,6 +38,9 @@ class FakeEtcd3Client(MagicMock):
 class TestLookupModule(unittest.TestCase):
     def setUp(self):
         etcd3.HAS_ETCD = True
+        etcd3._CLIENTS.clear()
+        etcd3._PREFIX_SNAPSHOTS.clear()
+        FakeEtcd3Client.prefix_reads = 0
         self.lookup = lookup_loader.get("community.general.etcd3")
 
     @patch("ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client", FakeEtcd3Client())
@@ -50,3 +56,39 @@ class TestLookupModule(unittest.TestCase):
             {"key": "a_key_3", "value": "a_key_3 value"},
         ]
         self.assertListEqual(expected_result, self.lookup.run(["a_key"], [], **{"prefix": True}))
+
+    def test_client_reuse(self):
+        client = FakeEtcd3Client()
+        with patch("ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client", client):
+            self.lookup.run(["a_key"], [])
+            self.lookup.run(["b_key"], [])
+            self.lookup.run(["b_key"], [], **{"host": "other"})
+        self.assertEqual(client.call_count, 2)
+
+    @patch("ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client", FakeEtcd3Client())
+    def test_prefetch_prefix(self):
+        expected_result = [
+            {"key": "a_key_2", "value": "a_key_2 value"},
+            {"key": "other", "value": "other value"},
+        ]
+        for dummy in range(2):
+            self.assertListEqual(
+                expected_result,
+                self.lookup.run(
+                    ["a_key_2", "a_key_4", "other"], [], **{"prefetch_prefix": "a_key", "prefetch_ttl": 60}
+                ),
+            )
+        self.assertEqual(FakeEtcd3Client.prefix_reads, 1)
+
+    @patch("ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client", FakeEtcd3Client())
+    def test_prefetch_prefix_with_prefix(self):
+        expected_result = [
+            {"key": "a_key_1", "value": "a_key_1 value"},
+            {"key": "a_key_2", "value": "a_key_2 value"},
+            {"key": "a_key_3", "value": "a_key_3 value"},
+        ]
+        for dummy in range(2):
+            self.assertListEqual(
+                expected_result, self.lookup.run(["a_key_"], [], **{"prefix": True, "prefetch_prefix": "a_key"})
+            )
+        self.assertEqual(FakeEtcd3Client.prefix_reads, 2)
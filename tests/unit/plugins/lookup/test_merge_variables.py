@@ -330,6 +330,29 @@ class TestMergeVariablesLookup(unittest.TestCase):
 
         self.assertEqual(results, [["item1", "item5"]])
 
+    @patch.object(AnsiblePlugin, "set_options")
+    @patch.object(
+        AnsiblePlugin,
+        "get_option",
+        side_effect=[None, "ignore", "suffix", ["dummy1"], "deep", "append", "replace", "replace", []],
+    )
+    @patch.object(Templar, "template", side_effect=lambda value: value)
+    def test_merge_list_group_many_hosts(self, mock_template, mock_get_option, mock_set_options):
+        host_count = 2000
+        hostvars = self.HostVarsMock(
+            {
+                f"host{i}": {"inventory_hostname": f"host{i}", f"{i}testlist__merge_var": [f"item{i}"]}
+                for i in range(host_count)
+            }
+        )
+        groups = {"dummy1": [f"host{i}" for i in range(0, host_count, 2)], "dummy2": ["host1"]}
+        variables = {"inventory_hostname": "host0", "hostvars": hostvars, "groups": groups}
+
+        results = self.merge_vars_lookup.run(["__merge_var"], variables)
+        self.assertEqual(results, [[f"item{i}" for i in range(0, host_count, 2)]])
+        # the variable of every host in the group is templated once
+        self.assertEqual(mock_template.call_count, host_count // 2)
+
     @patch.object(AnsiblePlugin, "set_options")
     @patch.object(
         AnsiblePlugin,
@@ -13,6 +13,7 @@ from ansible.errors import AnsibleLookupError, AnsibleOptionsError
 from ansible.plugins.loader import lookup_loader
 
 from ansible_collections.community.general.plugins.lookup.onepassword import (
+    OnePass,
     OnePassCLIv2,
 )
 
@@ -247,6 +248,35 @@ def test_op_lookup(mocker, cli_class, vault, queries, kwargs, output, expected):
     assert result == expected
 
 
+def test_op_lookup_cache(mocker):
+    output = json.dumps(MOCK_ENTRIES[OnePassCLIv2][1]["output"])
+    mocker.patch(
+        "ansible_collections.community.general.plugins.lookup.onepassword.OnePass._get_cli_class", OnePassCLIv2
+    )
+    assert_logged_in = mocker.patch.object(OnePassCLIv2, "assert_logged_in", return_value=True)
+    run = mocker.patch.object(OnePassCLIv2, "_run", return_value=(0, output, ""))
+    OnePass.clear_cache()
+
+    op_lookup = lookup_loader.get("community.general.onepassword")
+    try:
+        assert op_lookup.run(["Dummy Login"], vault="Test Vault", field="password1", cache=True) == [
+            "data in custom field"
+        ]
+        assert op_lookup.run(["Dummy Login"], vault="Test Vault", field="username", cache=True) == ["agent.smith"]
+        assert run.call_count == 1
+        assert assert_logged_in.call_count == 1
+
+        # other items are fetched once each, duplicate terms are not fetched again
+        op_lookup.run(["Other Login", "Third Login", "Other Login"], vault="Test Vault", cache=True)
+        assert run.call_count == 3
+
+        # without the cache option, op is run every time
+        op_lookup.run(["Dummy Login"], vault="Test Vault")
+        assert run.call_count == 4
+    finally:
+        OnePass.clear_cache()
+
+
 @pytest.mark.parametrize("op_fixture", OP_VERSION_FIXTURES)
 def test_signin(op_fixture, request):
     op = request.getfixturevalue(op_fixture)
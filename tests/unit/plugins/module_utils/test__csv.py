@@ -162,3 +162,52 @@ def test_invalid_dialect(data: str, dialect: t.Any, dialect_params: t.Any, field
         result = True
 
     assert result
+
+
+def test_row_reader():
+    dialect = csv.initialize_dialect("excel")
+    reader = csv.CSVRowReader("\ufeffid,name,role\n1,foo,bar\n\n2,bar\n3,baz,qux,extra\n", dialect)
+    assert reader.header == ("id", "name", "role")
+    assert [reader.to_dict(row) for row in reader] == [
+        {"id": "1", "name": "foo", "role": "bar"},
+        {"id": "2", "name": "bar", "role": None},
+        {"id": "3", "name": "baz", "role": "qux", None: ["extra"]},
+    ]
+
+
+def test_row_reader_columns():
+    dialect = csv.initialize_dialect("excel")
+    data = "id,name,enabled,weight\n1,foo,yes,1.5\n2,bar,no,\n3,baz,,2\n"
+    reader = csv.CSVRowReader(
+        data,
+        dialect,
+        columns=["name", "id", "weight"],
+        column_types={"id": "int", "enabled": "bool", "weight": "float"},
+        filters={"enabled": [False, None]},
+    )
+    assert reader.header == ("name", "id", "weight")
+    assert list(reader) == [("bar", 2, None), ("baz", 3, 2.0)]
+
+    reader = csv.CSVRowReader(data, dialect, columns=["name"], filters={"id": ["1", "3"]})
+    assert [reader.to_dict(row) for row in reader] == [{"name": "foo"}, {"name": "baz"}]
+
+
+@pytest.mark.parametrize(
+    "kwargs,message",
+    [
+        ({"columns": ["id", "other"]}, "Columns not found in the CSV header fields: other"),
+        ({"column_types": {"id": "date"}}, "Unknown type 'date' for column 'id'"),
+        ({"filters": {"other": ["x"]}}, "Columns not found in the CSV header fields: other"),
+    ],
+)
+def test_row_reader_invalid_columns(kwargs, message):
+    dialect = csv.initialize_dialect("excel")
+    with pytest.raises(csv.ColumnError, match=message):
+        csv.CSVRowReader("id,name\n1,foo\n", dialect, **kwargs)
+
+
+def test_row_reader_invalid_value():
+    dialect = csv.initialize_dialect("excel")
+    reader = csv.CSVRowReader("id,name\n1,foo\nx,bar\n", dialect, column_types={"id": "int"})
+    with pytest.raises(csv.ColumnError, match="Cannot convert value 'x' of column 'id' in line 3 to int"):
+        list(reader)
@@ -0,0 +1,73 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import pickle
+
+import pytest
+from ansible.errors import AnsibleError
+
+from ansible_collections.community.general.plugins.plugin_utils import _cache_serialization
+from ansible_collections.community.general.plugins.plugin_utils._cache_serialization import (
+    COMPRESSIONS,
+    SERIALIZERS,
+    CacheSerializer,
+)
+
+VALUE = {"__payload__": json.dumps({"ansible_hostname": "host1", "ansible_mounts": [{"size": 1}] * 100})}
+
+
+def _available(serializer, compression):
+    if serializer == "msgpack" and not _cache_serialization.HAS_MSGPACK:
+        return False
+    if compression == "lzma" and not _cache_serialization.HAS_LZMA:
+        return False
+    return not (compression == "zstd" and not _cache_serialization.HAS_ZSTD)
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS)
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_round_trip(serializer, compression):
+    if not _available(serializer, compression):
+        pytest.skip(f"{serializer}/{compression} is not available")
+    codec = CacheSerializer("test", serializer, compression)
+    data = codec.encode(VALUE)
+    assert CacheSerializer.is_encoded(data)
+    assert CacheSerializer.decode(data) == VALUE
+    if compression != "none":
+        assert len(data) < len(json.dumps(VALUE))
+
+
+def test_disabled_by_default():
+    codec = CacheSerializer("test", None, None)
+    assert codec.encode(VALUE) is None
+
+
+def test_compression_defaults_to_json():
+    codec = CacheSerializer("test", None, "zlib")
+    assert codec.serializer == "json"
+    assert CacheSerializer.decode(codec.encode(VALUE)) == VALUE
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        json.dumps(VALUE, indent=4).encode(),
+        json.dumps(VALUE).encode(),
+        pickle.dumps(VALUE),
+        "text",
+        VALUE,
+        b"",
+    ],
+)
+def test_legacy_entries_are_not_encoded(data):
+    assert not CacheSerializer.is_encoded(data)
+
+
+def test_missing_library(monkeypatch):
+    monkeypatch.setattr(_cache_serialization, "HAS_MSGPACK", False)
+    with pytest.raises(AnsibleError, match="msgpack"):
+        CacheSerializer("test", "msgpack", "none")
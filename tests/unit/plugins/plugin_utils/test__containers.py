@@ -0,0 +1,53 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from ansible_collections.community.general.plugins.plugin_utils._containers import map_leaves
+
+
+def _upper(value):
+    return value.upper() if isinstance(value, str) else value
+
+
+def test_map_leaves():
+    value = {"a": ["b", 1, ("c", None)], "d": {"e"}, 2: 3.0}
+    assert map_leaves(value, _upper) == {"A": ["B", 1, ("C", None)], "D": {"E"}, 2: 3.0}
+
+
+def test_map_leaves_sharing():
+    numbers = [1, [2, 3], {4: None}, (5,), {6}]
+    value = {"a": numbers, "b": ["c"]}
+    result = map_leaves(value, _upper)
+    assert result == {"A": numbers, "B": ["C"]}
+    assert result["A"] is numbers
+
+    assert map_leaves(numbers, _upper) is numbers
+    assert map_leaves(numbers, str) == ["1", ["2", "3"], {"4": "None"}, ("5",), {"6"}]
+
+
+def test_map_leaves_types():
+    value = OrderedDict(a=[frozenset([1]), (1, 2)])
+    result = map_leaves(value, _upper, sequence_type=list)
+    assert type(result) is dict
+    assert result == {"A": [{1}, [1, 2]]}
+    assert type(result["A"][0]) is set
+
+    assert map_leaves({1}, str, sets=False) == "{1}"
+
+
+def test_map_leaves_deep():
+    value = {}
+    current = value
+    for dummy in range(10000):
+        current["a"] = {}
+        current = current["a"]
+
+    result = map_leaves(value, _upper)
+    for dummy in range(10000):
+        assert list(result) == ["A"]
+        result = result["A"]
+    assert result == {}
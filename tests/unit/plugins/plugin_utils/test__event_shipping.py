@@ -0,0 +1,120 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+import time
+
+import pytest
+
+from ansible_collections.community.general.plugins.plugin_utils._event_shipping import EventShipper
+
+
+class Collector:
+    def __init__(self, failures=0):
+        self.requests = []
+        self.failures = failures
+
+    def post(self, key, body, headers):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection refused")
+        if headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        self.requests.append((key, body.split(b"\n")))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(EventShipper, "BACKOFF", 0.0)
+
+
+def test_batches_by_count():
+    collector = Collector()
+    shipper = EventShipper("test", collector.post, b"\n".join, max_events=10, interval=60)
+    for i in range(25):
+        shipper.put(b"%d" % i)
+    shipper.close()
+
+    assert [len(events) for key, events in collector.requests] == [10, 10, 5]
+    assert [event for key, events in collector.requests for event in events] == [b"%d" % i for i in range(25)]
+
+
+def test_batches_by_size():
+    collector = Collector()
+    shipper = EventShipper("test", collector.post, b"\n".join, max_bytes=25, interval=60)
+    for _i in range(5):
+        shipper.put(b"x" * 10)
+    shipper.close()
+
+    assert [len(events) for key, events in collector.requests] == [2, 2, 1]
+
+
+def test_batches_by_key_and_interval():
+    collector = Collector()
+    shipper = EventShipper("test", collector.post, b"\n".join, interval=0.05)
+    shipper.put(b"a1", key="a")
+    shipper.put(b"b1", key="b")
+    shipper.put(b"a2", key="a")
+    time.sleep(0.5)
+
+    assert sorted(collector.requests) == [("a", [b"a1", b"a2"]), ("b", [b"b1"])]
+    shipper.close()
+
+
+def test_flush_and_compress():
+    collector = Collector()
+    shipper = EventShipper("test", collector.post, b"\n".join, compress=True, interval=60)
+    shipper.put(b"event")
+    shipper.flush()
+
+    assert collector.requests == [(None, [b"event"])]
+    shipper.close()
+
+
+def test_flush_timeout():
+    release = threading.Event()
+    collector = Collector()
+    shipper = EventShipper("test", lambda *args: release.wait(), b"\n".join, interval=60)
+    shipper.put(b"event")
+    assert not shipper.flush(timeout=0.1)
+
+    release.set()
+    shipper._post = collector.post
+    assert shipper.flush()
+    shipper.close()
+
+
+def test_retry():
+    collector = Collector(failures=2)
+    shipper = EventShipper("test", collector.post, b"\n".join, retries=2)
+    shipper.put(b"event")
+    shipper.close()
+
+    assert collector.requests == [(None, [b"event"])]
+    assert shipper.pop_errors() == []
+
+
+def test_spool(tmp_path):
+    collector = Collector(failures=2)
+    shipper = EventShipper("test", collector.post, b"\n".join, retries=1, spool_dir=str(tmp_path))
+    shipper.put(b'{"event": 1}', key="host")
+    shipper.close()
+
+    assert collector.requests == []
+    errors = shipper.pop_errors()
+    assert len(errors) == 1
+    assert "failed to send 1 event(s): connection refused" in errors[0]
+    assert len(os.listdir(tmp_path)) == 1
+
+    # the next shipper sends the saved events first
+    shipper = EventShipper("test", collector.post, b"\n".join, spool_dir=str(tmp_path))
+    shipper.put(b'{"event": 2}', key="host")
+    shipper.close()
+
+    assert collector.requests == [("host", [b'{"event": 1}']), ("host", [b'{"event": 2}'])]
+    assert os.listdir(tmp_path) == []
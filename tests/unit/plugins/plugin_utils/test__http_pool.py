@@ -0,0 +1,92 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import http.server
+import socket
+import threading
+import time
+from urllib.error import HTTPError
+
+import pytest
+
+from ansible_collections.community.general.plugins.plugin_utils._http_pool import HTTPConnectionPool
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections.append(self.connection)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.path, self.headers.get("X-Test"), body))
+        if self.path == "/slow":
+            time.sleep(0.5)
+        status = 500 if self.path == "/error" else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.connections = []
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_reuses_connection(server):
+    url = f"http://127.0.0.1:{server.server_port}/collector?a=b"
+    with HTTPConnectionPool() as pool:
+        for i in range(5):
+            assert pool.request(url, f"event {i}", headers={"X-Test": "yes"}) == (200, b"ok")
+
+    assert len(server.connections) == 1
+    assert server.requests == [("/collector?a=b", "yes", b"event %d" % i) for i in range(5)]
+
+
+def test_reconnects_closed_connection(server):
+    url = f"http://127.0.0.1:{server.server_port}/"
+    with HTTPConnectionPool() as pool:
+        pool.request(url, "one")
+        # the server closes the idle connection
+        server.connections[0].shutdown(socket.SHUT_RDWR)
+        pool.request(url, "two")
+
+    assert len(server.connections) == 2
+    assert [body for path, header, body in server.requests] == [b"one", b"two"]
+
+
+def test_timeout_is_not_retried(server):
+    with HTTPConnectionPool(timeout=0.1) as pool:
+        pool.request(f"http://127.0.0.1:{server.server_port}/", "one")
+        with pytest.raises(TimeoutError):
+            pool.request(f"http://127.0.0.1:{server.server_port}/slow", "two")
+
+    assert len(server.connections) == 1
+    assert [body for path, header, body in server.requests] == [b"one", b"two"]
+
+
+def test_http_error(server):
+    with HTTPConnectionPool() as pool:
+        with pytest.raises(HTTPError) as exc:
+            pool.request(f"http://127.0.0.1:{server.server_port}/error", "event")
+        assert exc.value.code == 500
+        # the connection is still usable after an error status
+        pool.request(f"http://127.0.0.1:{server.server_port}/", "event")
+
+    assert len(server.connections) == 1
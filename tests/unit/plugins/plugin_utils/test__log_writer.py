@@ -0,0 +1,73 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import gzip
+
+from ansible_collections.community.general.plugins.plugin_utils._log_writer import LogFilePool
+
+
+def test_write_is_buffered_until_flush(tmp_path):
+    path = tmp_path / "host1"
+    pool = LogFilePool(flush_interval=3600)
+    pool.write(str(path), b"one\n")
+    pool.write(str(path), b"two\n")
+    assert path.read_bytes() == b""
+    pool.flush()
+    assert path.read_bytes() == b"one\ntwo\n"
+    pool.close()
+
+
+def test_flush_interval_zero_flushes_every_write(tmp_path):
+    path = tmp_path / "host1"
+    pool = LogFilePool(flush_interval=0)
+    pool.write(str(path), b"one\n")
+    assert path.read_bytes() == b"one\n"
+    pool.close()
+
+
+def test_least_recently_used_file_is_closed(tmp_path):
+    pool = LogFilePool(max_open=2, flush_interval=3600)
+    for name in ("host1", "host2", "host1", "host3"):
+        pool.write(str(tmp_path / name), f"{name}\n".encode())
+    assert list(pool._files) == [str(tmp_path / "host1"), str(tmp_path / "host3")]
+    # closing a file flushes it
+    assert (tmp_path / "host2").read_bytes() == b"host2\n"
+    pool.close()
+    assert (tmp_path / "host1").read_bytes() == b"host1\nhost1\n"
+    assert (tmp_path / "host3").read_bytes() == b"host3\n"
+
+
+def test_appends_to_existing_file(tmp_path):
+    path = tmp_path / "host1"
+    path.write_bytes(b"old\n")
+    pool = LogFilePool()
+    pool.write(str(path), b"new\n")
+    pool.close()
+    assert path.read_bytes() == b"old\nnew\n"
+
+
+def test_rotation(tmp_path):
+    path = tmp_path / "host1"
+    pool = LogFilePool(max_size=10, backup_count=2)
+    for i in range(4):
+        pool.write(str(path), f"line {i:03d}\n".encode())
+    pool.close()
+    assert path.read_bytes() == b"line 003\n"
+    assert (tmp_path / "host1.1").read_bytes() == b"line 002\n"
+    assert (tmp_path / "host1.2").read_bytes() == b"line 001\n"
+    assert not (tmp_path / "host1.3").exists()
+
+
+def test_rotation_with_compression(tmp_path):
+    path = tmp_path / "host1"
+    pool = LogFilePool(max_size=10, backup_count=1, compress=True)
+    for i in range(3):
+        pool.write(str(path), f"line {i:03d}\n".encode())
+    pool.close()
+    assert path.read_bytes() == b"line 002\n"
+    with gzip.open(tmp_path / "host1.1.gz") as f:
+        assert f.read() == b"line 001\n"
+    assert not (tmp_path / "host1.2.gz").exists()
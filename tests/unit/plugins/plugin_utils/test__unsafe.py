@@ -158,3 +158,34 @@ def test_make_unsafe_set():
     assert unsafe_value == value
     for obj in unsafe_value:
         assert not _is_trusted(obj)
+
+
+def test_make_unsafe_structural_sharing():
+    safe_list = [_make_trusted("value"), 1, None]
+    safe_dict = {_make_trusted("key"): _make_trusted("value")}
+    value = {
+        _make_trusted("safe_list"): safe_list,
+        _make_trusted("safe_dict"): safe_dict,
+        _make_trusted("unsafe"): [_make_trusted("{{value}}")],
+    }
+    unsafe_value = make_unsafe(value)
+    assert unsafe_value == value
+    assert unsafe_value is not value
+    assert unsafe_value["safe_list"] is safe_list
+    assert unsafe_value["safe_dict"] is safe_dict
+    assert unsafe_value["unsafe"] is not value["unsafe"]
+    assert not _is_trusted(unsafe_value["unsafe"][0])
+
+
+def test_make_unsafe_deep_nesting():
+    value = []
+    current = value
+    for dummy in range(10000):
+        current.append([])
+        current = current[0]
+    current.append(_make_trusted("{{value}}"))
+
+    unsafe_value = make_unsafe(value)
+    for dummy in range(10001):
+        unsafe_value = unsafe_value[0]
+    assert not _is_trusted(unsafe_value)